@@ -0,0 +1,35 @@
+"""enforce one attendance per user per event
+
+Revision ID: add_attendance_unique
+Revises: add_reaction_target_index
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_attendance_unique'
+down_revision = 'add_reaction_target_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add a unique (user_id, event_id) constraint and a lower(email) index."""
+    # Keep the earliest attendance where a user somehow joined twice
+    op.execute("""
+        DELETE FROM attendances AS a
+        USING attendances AS b
+        WHERE a.user_id = b.user_id
+          AND a.event_id = b.event_id
+          AND a.id > b.id
+    """)
+    op.create_unique_constraint('uq_attendances_user_event', 'attendances', ['user_id', 'event_id'])
+    op.execute("CREATE INDEX ix_users_email_lower ON users (lower(email))")
+
+
+def downgrade() -> None:
+    """Remove the attendance constraint and email index."""
+    op.drop_index('ix_users_email_lower', table_name='users')
+    op.drop_constraint('uq_attendances_user_event', 'attendances', type_='unique')
@@ -0,0 +1,121 @@
+"""record changes to synced tables in change_log for mobile delta sync
+
+Revision ID: add_change_log
+Revises: add_conditional_get_indexes
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_change_log'
+down_revision = 'add_conditional_get_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add change_log and the statement-level triggers that fill it."""
+    op.create_table(
+        'change_log',
+        sa.Column('id', sa.BigInteger(), nullable=False),
+        sa.Column('txid', sa.BigInteger(), server_default=sa.text("(pg_current_xact_id()::text)::bigint"), nullable=False),
+        sa.Column('entity', sqlmodel.sql.sqltypes.AutoString(length=20), nullable=False),
+        sa.Column('entity_id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=True),
+        sa.Column('deleted', sa.Boolean(), server_default=sa.false(), nullable=False),
+        sa.Column('changed_at', sa.DateTime(), server_default=sa.text("(now() AT TIME ZONE 'utc')"), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_change_log_txid_id', 'change_log', ['txid', 'id'])
+    op.create_index('ix_change_log_changed_at', 'change_log', ['changed_at'])
+
+    # Statement-level triggers with transition tables: one INSERT ... SELECT
+    # per statement, so bulk writes log their rows in a single step.
+    # Events and posts (TG_ARGV[0] is the entity name)
+    op.execute("""
+        CREATE FUNCTION change_log_rows() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                INSERT INTO change_log (entity, entity_id, deleted)
+                SELECT TG_ARGV[0], id, true FROM old_rows ORDER BY id;
+            ELSE
+                INSERT INTO change_log (entity, entity_id)
+                SELECT TG_ARGV[0], id FROM new_rows ORDER BY id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+    # Attendances, logged per event and scoped to the attendee
+    op.execute("""
+        CREATE FUNCTION change_log_attendances() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                INSERT INTO change_log (entity, entity_id, user_id, deleted)
+                SELECT 'attendance', event_id, user_id, true FROM old_rows ORDER BY id;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                INSERT INTO change_log (entity, entity_id, user_id)
+                SELECT 'attendance', event_id, user_id FROM new_rows ORDER BY id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+    # Reactions, logged once per target whose counts changed
+    op.execute("""
+        CREATE FUNCTION change_log_reactions() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                INSERT INTO change_log (entity, entity_id)
+                SELECT DISTINCT lower(target_type::text) || '_reactions', target_id FROM old_rows;
+            ELSE
+                INSERT INTO change_log (entity, entity_id)
+                SELECT DISTINCT lower(target_type::text) || '_reactions', target_id FROM new_rows;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+
+    for table, function, argument in (
+        ('events', 'change_log_rows', "'event'"),
+        ('posts', 'change_log_rows', "'post'"),
+        ('attendances', 'change_log_attendances', ''),
+        ('reactions', 'change_log_reactions', ''),
+    ):
+        op.execute(f"""
+            CREATE TRIGGER {table}_change_log_insert
+            AFTER INSERT ON {table}
+            REFERENCING NEW TABLE AS new_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION {function}({argument});
+        """)
+        op.execute(f"""
+            CREATE TRIGGER {table}_change_log_update
+            AFTER UPDATE ON {table}
+            REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION {function}({argument});
+        """)
+        op.execute(f"""
+            CREATE TRIGGER {table}_change_log_delete
+            AFTER DELETE ON {table}
+            REFERENCING OLD TABLE AS old_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION {function}({argument});
+        """)
+
+
+def downgrade() -> None:
+    """Drop the change log triggers, their functions and change_log."""
+    for table in ('reactions', 'attendances', 'posts', 'events'):
+        for event in ('delete', 'update', 'insert'):
+            op.execute(f"DROP TRIGGER IF EXISTS {table}_change_log_{event} ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS change_log_reactions()")
+    op.execute("DROP FUNCTION IF EXISTS change_log_attendances()")
+    op.execute("DROP FUNCTION IF EXISTS change_log_rows()")
+    op.drop_index('ix_change_log_changed_at', table_name='change_log')
+    op.drop_index('ix_change_log_txid_id', table_name='change_log')
+    op.drop_table('change_log')
@@ -0,0 +1,63 @@
+"""trigger-maintained table versions for list validators
+
+Revision ID: add_collection_versions
+Revises: add_change_log
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_collection_versions'
+down_revision = 'add_change_log'
+branch_labels = None
+depends_on = None
+
+TABLES = ('events', 'posts', 'profiles', 'fair_work_postings')
+
+
+def upgrade() -> None:
+    """Add collection_versions and the statement-level triggers that bump it."""
+    op.create_table(
+        'collection_versions',
+        sa.Column('name', sqlmodel.sql.sqltypes.AutoString(length=50), nullable=False),
+        sa.Column('version', sa.BigInteger(), server_default=sa.text('0'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('name')
+    )
+    for table in TABLES:
+        op.execute(f"""
+            INSERT INTO collection_versions (name, version, updated_at)
+            SELECT '{table}', 0, coalesce(max(updated_at), now() AT TIME ZONE 'utc') FROM {table}
+        """)
+
+    # One UPDATE per statement, bulk writes included. The row lock orders
+    # bumps by commit, so versions and updated_at only ever move forward.
+    op.execute("""
+        CREATE FUNCTION collection_versions_bump() RETURNS trigger AS $$
+        BEGIN
+            UPDATE collection_versions
+            SET version = version + 1,
+                updated_at = greatest(updated_at, clock_timestamp() AT TIME ZONE 'utc')
+            WHERE name = TG_TABLE_NAME;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+    for table in TABLES:
+        op.execute(f"""
+            CREATE TRIGGER {table}_collection_version
+            AFTER INSERT OR UPDATE OR DELETE ON {table}
+            FOR EACH STATEMENT EXECUTE FUNCTION collection_versions_bump();
+        """)
+
+
+def downgrade() -> None:
+    """Drop the version triggers, their function and collection_versions."""
+    for table in TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_collection_version ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS collection_versions_bump()")
+    op.drop_table('collection_versions')
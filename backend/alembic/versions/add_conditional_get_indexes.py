@@ -0,0 +1,33 @@
+"""index updated_at for conditional GET version lookups
+
+Revision ID: add_conditional_get_indexes
+Revises: add_profile_search_indexes
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_conditional_get_indexes'
+down_revision = 'add_profile_search_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add (id, updated_at) indexes for index-only version checks, and events.updated_at for list versions."""
+    op.create_index('ix_events_id_updated_at', 'events', ['id', 'updated_at'])
+    op.create_index('ix_events_updated_at', 'events', ['updated_at'])
+    op.create_index('ix_posts_id_updated_at', 'posts', ['id', 'updated_at'])
+    op.create_index('ix_profiles_id_updated_at', 'profiles', ['id', 'updated_at'])
+    op.create_index('ix_fair_work_postings_id_updated_at', 'fair_work_postings', ['id', 'updated_at'])
+
+
+def downgrade() -> None:
+    """Drop the version lookup indexes."""
+    op.drop_index('ix_fair_work_postings_id_updated_at', table_name='fair_work_postings')
+    op.drop_index('ix_profiles_id_updated_at', table_name='profiles')
+    op.drop_index('ix_posts_id_updated_at', table_name='posts')
+    op.drop_index('ix_events_updated_at', table_name='events')
+    op.drop_index('ix_events_id_updated_at', table_name='events')
@@ -0,0 +1,50 @@
+"""posting coordinates and precomputed event/posting matches
+
+Revision ID: add_event_posting_matches
+Revises: add_posting_dedupe
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_event_posting_matches'
+down_revision = 'add_posting_dedupe'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add posting lat/lng, coordinate indexes and the event_posting_matches table."""
+    op.add_column('fair_work_postings', sa.Column('latitude', sa.Float(), nullable=True))
+    op.add_column('fair_work_postings', sa.Column('longitude', sa.Float(), nullable=True))
+    op.create_index('ix_fair_work_postings_lat_lng', 'fair_work_postings', ['latitude', 'longitude'])
+    op.create_index('ix_events_lat_lng', 'events', ['latitude', 'longitude'])
+
+    op.create_table(
+        'event_posting_matches',
+        sa.Column('event_id', sa.Integer(), nullable=False),
+        sa.Column('posting_id', sa.Integer(), nullable=False),
+        sa.Column('rank', sa.Integer(), nullable=False),
+        sa.Column('score', sa.Float(), nullable=False),
+        sa.Column('distance_km', sa.Float(), nullable=False),
+        sa.ForeignKeyConstraint(['event_id'], ['events.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['posting_id'], ['fair_work_postings.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('event_id', 'posting_id')
+    )
+    op.create_index('ix_event_posting_matches_event_rank', 'event_posting_matches', ['event_id', 'rank'])
+    op.create_index(op.f('ix_event_posting_matches_posting_id'), 'event_posting_matches', ['posting_id'])
+    # Matches for existing events are computed by scripts/refresh_job_matches.py
+
+
+def downgrade() -> None:
+    """Drop event_posting_matches and posting coordinates."""
+    op.drop_index(op.f('ix_event_posting_matches_posting_id'), table_name='event_posting_matches')
+    op.drop_index('ix_event_posting_matches_event_rank', table_name='event_posting_matches')
+    op.drop_table('event_posting_matches')
+    op.drop_index('ix_events_lat_lng', table_name='events')
+    op.drop_index('ix_fair_work_postings_lat_lng', table_name='fair_work_postings')
+    op.drop_column('fair_work_postings', 'longitude')
+    op.drop_column('fair_work_postings', 'latitude')
@@ -0,0 +1,123 @@
+"""index event tags and maintain per-tag counts
+
+Revision ID: add_event_tag_index
+Revises: add_search_vectors
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_event_tag_index'
+down_revision = 'add_search_vectors'
+branch_labels = None
+depends_on = None
+
+
+def _event_search_document(tags_type: str) -> str:
+    return (
+        "setweight(to_tsvector('english'::regconfig, coalesce(title, '')), 'A') || "
+        f"setweight(to_tsvector('english'::regconfig, coalesce(tags, '[]'::{tags_type})), 'B') || "
+        "setweight(to_tsvector('english'::regconfig, coalesce(location, '')), 'C') || "
+        "setweight(to_tsvector('english'::regconfig, coalesce(description, '')), 'D')"
+    )
+
+
+def _replace_search_vector(tags_type: str) -> None:
+    op.add_column('events', sa.Column(
+        'search_vector',
+        postgresql.TSVECTOR(),
+        sa.Computed(_event_search_document(tags_type), persisted=True),
+        nullable=True
+    ))
+    op.create_index('ix_events_search_vector', 'events', ['search_vector'], postgresql_using='gin')
+
+
+def upgrade() -> None:
+    """Convert events.tags to JSONB with a GIN index and add event_tag_counts."""
+    # The generated search vector reads tags, so it has to be rebuilt around the type change
+    op.drop_index('ix_events_search_vector', table_name='events')
+    op.drop_column('events', 'search_vector')
+    op.alter_column(
+        'events', 'tags',
+        type_=postgresql.JSONB(),
+        existing_type=sa.JSON(),
+        postgresql_using='tags::jsonb'
+    )
+    _replace_search_vector('jsonb')
+    op.create_index(
+        'ix_events_tags', 'events', ['tags'],
+        postgresql_using='gin',
+        postgresql_ops={'tags': 'jsonb_path_ops'}
+    )
+
+    op.create_table(
+        'event_tag_counts',
+        sa.Column('tag', sqlmodel.sql.sqltypes.AutoString(length=255), nullable=False),
+        sa.Column('event_count', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('tag')
+    )
+    op.execute("""
+        CREATE FUNCTION event_tag_counts_refresh() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'UPDATE' AND OLD.tags IS NOT DISTINCT FROM NEW.tags THEN
+                RETURN NULL;
+            END IF;
+
+            IF TG_OP IN ('UPDATE', 'DELETE') AND jsonb_typeof(OLD.tags) = 'array' THEN
+                UPDATE event_tag_counts AS c
+                SET event_count = c.event_count - 1
+                FROM (SELECT DISTINCT jsonb_array_elements_text(OLD.tags) AS tag) AS t
+                WHERE c.tag = t.tag;
+
+                DELETE FROM event_tag_counts
+                WHERE event_count <= 0
+                  AND tag IN (SELECT jsonb_array_elements_text(OLD.tags));
+            END IF;
+
+            IF TG_OP IN ('INSERT', 'UPDATE') AND jsonb_typeof(NEW.tags) = 'array' THEN
+                INSERT INTO event_tag_counts (tag, event_count)
+                SELECT DISTINCT jsonb_array_elements_text(NEW.tags), 1
+                ON CONFLICT (tag) DO UPDATE
+                SET event_count = event_tag_counts.event_count + 1;
+            END IF;
+
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+        CREATE TRIGGER events_tag_counts
+        AFTER INSERT OR DELETE OR UPDATE OF tags ON events
+        FOR EACH ROW EXECUTE FUNCTION event_tag_counts_refresh();
+    """)
+    # Backfill counts for existing events
+    op.execute("""
+        INSERT INTO event_tag_counts (tag, event_count)
+        SELECT t.tag, count(DISTINCT e.id)
+        FROM events AS e
+        CROSS JOIN LATERAL jsonb_array_elements_text(e.tags) AS t(tag)
+        WHERE jsonb_typeof(e.tags) = 'array'
+        GROUP BY t.tag;
+    """)
+
+
+def downgrade() -> None:
+    """Restore events.tags to JSON and drop the tag aggregate."""
+    op.execute("DROP TRIGGER IF EXISTS events_tag_counts ON events")
+    op.execute("DROP FUNCTION IF EXISTS event_tag_counts_refresh()")
+    op.drop_table('event_tag_counts')
+    op.drop_index('ix_events_tags', table_name='events')
+    op.drop_index('ix_events_search_vector', table_name='events')
+    op.drop_column('events', 'search_vector')
+    op.alter_column(
+        'events', 'tags',
+        type_=sa.JSON(),
+        existing_type=postgresql.JSONB(),
+        postgresql_using='tags::json'
+    )
+    _replace_search_vector('json')
@@ -0,0 +1,109 @@
+"""near-duplicate flag and MinHash band table for fair work postings
+
+Revision ID: add_posting_dedupe
+Revises: add_posting_natural_key
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_posting_dedupe'
+down_revision = 'add_posting_natural_key'
+branch_labels = None
+depends_on = None
+
+
+def _counts_refresh_function(canonical_only: bool) -> str:
+    """fair_work_posting_counts_refresh(), optionally counting canonical postings only."""
+    where = "WHERE duplicate_of_id IS NULL" if canonical_only else ""
+    return f"""
+        CREATE OR REPLACE FUNCTION fair_work_posting_counts_refresh() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                UPDATE fair_work_posting_counts AS c
+                SET posting_count = c.posting_count - d.n
+                FROM (
+                    SELECT employment_type, union_status,
+                           posting_wage_band(wage_min, wage_max) AS wage_band, count(*) AS n
+                    FROM old_rows
+                    {where}
+                    GROUP BY 1, 2, 3
+                ) AS d
+                WHERE c.employment_type = d.employment_type
+                  AND c.union_status = d.union_status
+                  AND c.wage_band = d.wage_band;
+            END IF;
+
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                INSERT INTO fair_work_posting_counts (employment_type, union_status, wage_band, posting_count)
+                SELECT employment_type, union_status, posting_wage_band(wage_min, wage_max), count(*)
+                FROM new_rows
+                {where}
+                GROUP BY 1, 2, 3
+                ON CONFLICT (employment_type, union_status, wage_band) DO UPDATE
+                SET posting_count = fair_work_posting_counts.posting_count + EXCLUDED.posting_count;
+            END IF;
+
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """
+
+
+def _rebuild_counts(canonical_only: bool) -> None:
+    where = "WHERE duplicate_of_id IS NULL" if canonical_only else ""
+    op.execute("DELETE FROM fair_work_posting_counts")
+    op.execute(f"""
+        INSERT INTO fair_work_posting_counts (employment_type, union_status, wage_band, posting_count)
+        SELECT employment_type, union_status, posting_wage_band(wage_min, wage_max), count(*)
+        FROM fair_work_postings
+        {where}
+        GROUP BY 1, 2, 3
+    """)
+
+
+def upgrade() -> None:
+    """Add duplicate_of_id and the band table; facet counts cover canonical postings only."""
+    op.add_column('fair_work_postings', sa.Column('duplicate_of_id', sa.Integer(), nullable=True))
+    op.create_foreign_key(
+        'fair_work_postings_duplicate_of_id_fkey', 'fair_work_postings', 'fair_work_postings',
+        ['duplicate_of_id'], ['id'], ondelete='SET NULL'
+    )
+    # Postings repeating an older posting's natural key duplicate its key owner
+    op.execute("""
+        UPDATE fair_work_postings p
+        SET duplicate_of_id = owner.id
+        FROM fair_work_postings owner
+        WHERE p.key_duplicate
+          AND NOT owner.key_duplicate
+          AND lower(p.organization) = lower(owner.organization)
+          AND lower(p.title) = lower(owner.title)
+          AND lower(p.location) = lower(owner.location)
+    """)
+
+    op.create_table(
+        'fair_work_posting_bands',
+        sa.Column('band', sa.Integer(), nullable=False),
+        sa.Column('band_hash', sa.BigInteger(), nullable=False),
+        sa.Column('posting_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['posting_id'], ['fair_work_postings.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('band', 'band_hash', 'posting_id')
+    )
+    op.create_index('ix_fair_work_posting_bands_posting_id', 'fair_work_posting_bands', ['posting_id'])
+
+    # Existing postings are indexed and deduplicated by scripts/dedupe_postings.py
+    op.execute(_counts_refresh_function(canonical_only=True))
+    _rebuild_counts(canonical_only=True)
+
+
+def downgrade() -> None:
+    """Restore all-postings facet counts and drop the deduplication tables and columns."""
+    op.execute(_counts_refresh_function(canonical_only=False))
+    op.drop_index('ix_fair_work_posting_bands_posting_id', table_name='fair_work_posting_bands')
+    op.drop_table('fair_work_posting_bands')
+    op.drop_constraint('fair_work_postings_duplicate_of_id_fkey', 'fair_work_postings', type_='foreignkey')
+    op.drop_column('fair_work_postings', 'duplicate_of_id')
+    _rebuild_counts(canonical_only=False)
@@ -0,0 +1,114 @@
+"""maintain posting counts per facet for Unionized listings
+
+Revision ID: add_posting_facet_counts
+Revises: add_posting_search_indexes
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_posting_facet_counts'
+down_revision = 'add_posting_search_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add posting_wage_band() and the trigger-maintained fair_work_posting_counts table."""
+    # Hourly wage band by the top of the posted range
+    op.execute("""
+        CREATE FUNCTION posting_wage_band(wage_min double precision, wage_max double precision)
+        RETURNS text
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE
+        AS $$
+            SELECT CASE
+                WHEN coalesce(wage_max, wage_min) IS NULL THEN 'unlisted'
+                WHEN coalesce(wage_max, wage_min) < 20 THEN 'under-20'
+                WHEN coalesce(wage_max, wage_min) < 30 THEN '20-30'
+                ELSE '30-plus'
+            END
+        $$;
+    """)
+
+    op.create_table(
+        'fair_work_posting_counts',
+        sa.Column('employment_type', postgresql.ENUM(name='employmenttype', create_type=False), nullable=False),
+        sa.Column('union_status', postgresql.ENUM(name='unionstatus', create_type=False), nullable=False),
+        sa.Column('wage_band', sqlmodel.sql.sqltypes.AutoString(length=20), nullable=False),
+        sa.Column('posting_count', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('employment_type', 'union_status', 'wage_band')
+    )
+
+    # Statement-level triggers with transition tables: one aggregate update
+    # per statement, so bulk inserts do not touch the counters row by row
+    op.execute("""
+        CREATE FUNCTION fair_work_posting_counts_refresh() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                UPDATE fair_work_posting_counts AS c
+                SET posting_count = c.posting_count - d.n
+                FROM (
+                    SELECT employment_type, union_status,
+                           posting_wage_band(wage_min, wage_max) AS wage_band, count(*) AS n
+                    FROM old_rows
+                    GROUP BY 1, 2, 3
+                ) AS d
+                WHERE c.employment_type = d.employment_type
+                  AND c.union_status = d.union_status
+                  AND c.wage_band = d.wage_band;
+            END IF;
+
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                INSERT INTO fair_work_posting_counts (employment_type, union_status, wage_band, posting_count)
+                SELECT employment_type, union_status, posting_wage_band(wage_min, wage_max), count(*)
+                FROM new_rows
+                GROUP BY 1, 2, 3
+                ON CONFLICT (employment_type, union_status, wage_band) DO UPDATE
+                SET posting_count = fair_work_posting_counts.posting_count + EXCLUDED.posting_count;
+            END IF;
+
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+        CREATE TRIGGER fair_work_postings_counts_insert
+        AFTER INSERT ON fair_work_postings
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION fair_work_posting_counts_refresh();
+    """)
+    op.execute("""
+        CREATE TRIGGER fair_work_postings_counts_update
+        AFTER UPDATE ON fair_work_postings
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION fair_work_posting_counts_refresh();
+    """)
+    op.execute("""
+        CREATE TRIGGER fair_work_postings_counts_delete
+        AFTER DELETE ON fair_work_postings
+        REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION fair_work_posting_counts_refresh();
+    """)
+
+    # Backfill from existing postings
+    op.execute("""
+        INSERT INTO fair_work_posting_counts (employment_type, union_status, wage_band, posting_count)
+        SELECT employment_type, union_status, posting_wage_band(wage_min, wage_max), count(*)
+        FROM fair_work_postings
+        GROUP BY 1, 2, 3;
+    """)
+
+
+def downgrade() -> None:
+    """Drop the facet aggregate, its triggers and posting_wage_band()."""
+    op.execute("DROP TRIGGER IF EXISTS fair_work_postings_counts_delete ON fair_work_postings")
+    op.execute("DROP TRIGGER IF EXISTS fair_work_postings_counts_update ON fair_work_postings")
+    op.execute("DROP TRIGGER IF EXISTS fair_work_postings_counts_insert ON fair_work_postings")
+    op.execute("DROP FUNCTION IF EXISTS fair_work_posting_counts_refresh()")
+    op.drop_table('fair_work_posting_counts')
+    op.execute("DROP FUNCTION IF EXISTS posting_wage_band(double precision, double precision)")
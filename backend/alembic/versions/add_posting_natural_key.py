@@ -0,0 +1,45 @@
+"""natural key unique index for fair work posting imports
+
+Revision ID: add_posting_natural_key
+Revises: add_posting_wage_range
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_posting_natural_key'
+down_revision = 'add_posting_wage_range'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Mark postings repeating an older one's natural key, and index the key of the rest."""
+    op.add_column('fair_work_postings', sa.Column(
+        'key_duplicate', sa.Boolean(), server_default=sa.false(), nullable=False
+    ))
+    # The oldest posting keeps the key; the others stay, marked (add_posting_dedupe
+    # also flags them with duplicate_of_id, hiding them from listings)
+    op.execute("""
+        UPDATE fair_work_postings p
+        SET key_duplicate = true
+        FROM fair_work_postings older
+        WHERE lower(p.organization) = lower(older.organization)
+          AND lower(p.title) = lower(older.title)
+          AND lower(p.location) = lower(older.location)
+          AND older.id < p.id
+    """)
+    op.execute("""
+        CREATE UNIQUE INDEX uq_fair_work_postings_natural_key ON fair_work_postings
+        (lower(organization), lower(title), lower(location))
+        WHERE NOT key_duplicate
+    """)
+
+
+def downgrade() -> None:
+    """Remove the natural key and the key_duplicate marks."""
+    op.drop_index('uq_fair_work_postings_natural_key', table_name='fair_work_postings')
+    op.drop_column('fair_work_postings', 'key_duplicate')
@@ -0,0 +1,49 @@
+"""trigram and composite indexes for fair work postings
+
+Revision ID: add_posting_search_indexes
+Revises: add_attendance_unique
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_posting_search_indexes'
+down_revision = 'add_attendance_unique'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Enable pg_trgm and index postings for fuzzy search and filtered listing."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("""
+        CREATE INDEX ix_fair_work_postings_search_trgm ON fair_work_postings
+        USING gin ((title || ' ' || organization || ' ' || location) gin_trgm_ops)
+    """)
+    op.execute("""
+        CREATE INDEX ix_fair_work_postings_location_trgm ON fair_work_postings
+        USING gin (location gin_trgm_ops)
+    """)
+    op.execute("""
+        CREATE INDEX ix_fair_work_postings_posted ON fair_work_postings
+        (posted_date DESC, id DESC)
+    """)
+    op.execute("""
+        CREATE INDEX ix_fair_work_postings_status_posted ON fair_work_postings
+        (union_status, posted_date DESC, id DESC)
+    """)
+    op.execute("""
+        CREATE INDEX ix_fair_work_postings_type_status_posted ON fair_work_postings
+        (employment_type, union_status, posted_date DESC, id DESC)
+    """)
+
+
+def downgrade() -> None:
+    """Remove posting search indexes (the pg_trgm extension is left installed)."""
+    op.drop_index('ix_fair_work_postings_type_status_posted', table_name='fair_work_postings')
+    op.drop_index('ix_fair_work_postings_status_posted', table_name='fair_work_postings')
+    op.drop_index('ix_fair_work_postings_posted', table_name='fair_work_postings')
+    op.drop_index('ix_fair_work_postings_location_trgm', table_name='fair_work_postings')
+    op.drop_index('ix_fair_work_postings_search_trgm', table_name='fair_work_postings')
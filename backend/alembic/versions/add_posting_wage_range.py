@@ -0,0 +1,54 @@
+"""wage range column and wage indexes for fair work postings
+
+Revision ID: add_posting_wage_range
+Revises: add_posting_facet_counts
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_posting_wage_range'
+down_revision = 'add_posting_facet_counts'
+branch_labels = None
+depends_on = None
+
+
+POSTING_WAGE_RANGE = (
+    "CASE WHEN wage_min IS NULL AND wage_max IS NULL THEN NULL "
+    "ELSE numrange((least(wage_min, wage_max))::numeric, "
+    "(greatest(wage_min, wage_max))::numeric, '[]') END"
+)
+
+
+def upgrade() -> None:
+    """Add a GiST-indexed wage_range and btree indexes for wage sorting."""
+    op.add_column('fair_work_postings', sa.Column(
+        'wage_range',
+        postgresql.NUMRANGE(),
+        sa.Computed(POSTING_WAGE_RANGE, persisted=True),
+        nullable=True
+    ))
+    op.create_index(
+        'ix_fair_work_postings_wage_range', 'fair_work_postings', ['wage_range'],
+        postgresql_using='gist'
+    )
+    op.execute("""
+        CREATE INDEX ix_fair_work_postings_wage_top ON fair_work_postings
+        ((greatest(wage_min, wage_max)) DESC, id DESC)
+    """)
+    op.execute("""
+        CREATE INDEX ix_fair_work_postings_status_wage_top ON fair_work_postings
+        (union_status, (greatest(wage_min, wage_max)) DESC, id DESC)
+    """)
+
+
+def downgrade() -> None:
+    """Remove the wage indexes and the wage_range column."""
+    op.drop_index('ix_fair_work_postings_status_wage_top', table_name='fair_work_postings')
+    op.drop_index('ix_fair_work_postings_wage_top', table_name='fair_work_postings')
+    op.drop_index('ix_fair_work_postings_wage_range', table_name='fair_work_postings')
+    op.drop_column('fair_work_postings', 'wage_range')
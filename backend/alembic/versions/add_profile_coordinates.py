@@ -0,0 +1,29 @@
+"""profile coordinates geocoded from location
+
+Revision ID: add_profile_coordinates
+Revises: add_event_posting_matches
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_profile_coordinates'
+down_revision = 'add_event_posting_matches'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add profile lat/lng."""
+    op.add_column('profiles', sa.Column('latitude', sa.Float(), nullable=True))
+    op.add_column('profiles', sa.Column('longitude', sa.Float(), nullable=True))
+    # Existing locations are geocoded by scripts/geocode_backfill.py
+
+
+def downgrade() -> None:
+    """Drop profile lat/lng."""
+    op.drop_column('profiles', 'longitude')
+    op.drop_column('profiles', 'latitude')
@@ -0,0 +1,48 @@
+"""index profiles for name typeahead and cause filters
+
+Revision ID: add_profile_search_indexes
+Revises: add_profile_coordinates
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_profile_search_indexes'
+down_revision = 'add_profile_coordinates'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Convert profiles.causes to JSONB and add name and cause indexes."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.alter_column(
+        'profiles', 'causes',
+        type_=postgresql.JSONB(),
+        existing_type=sa.JSON(),
+        postgresql_using='causes::jsonb'
+    )
+    op.create_index(
+        'ix_profiles_causes', 'profiles', ['causes'],
+        postgresql_using='gin',
+        postgresql_ops={'causes': 'jsonb_path_ops'}
+    )
+    op.execute('CREATE INDEX ix_profiles_name_prefix ON profiles ((lower(name) COLLATE "C"), id)')
+    op.execute("CREATE INDEX ix_profiles_name_trgm ON profiles USING gin (lower(name) gin_trgm_ops)")
+
+
+def downgrade() -> None:
+    """Drop profile search indexes and restore profiles.causes to JSON."""
+    op.drop_index('ix_profiles_name_trgm', table_name='profiles')
+    op.drop_index('ix_profiles_name_prefix', table_name='profiles')
+    op.drop_index('ix_profiles_causes', table_name='profiles')
+    op.alter_column(
+        'profiles', 'causes',
+        type_=sa.JSON(),
+        existing_type=postgresql.JSONB(),
+        postgresql_using='causes::json'
+    )
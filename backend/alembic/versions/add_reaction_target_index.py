@@ -0,0 +1,30 @@
+"""index reactions by target
+
+Revision ID: add_reaction_target_index
+Revises: add_event_tag_index
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_reaction_target_index'
+down_revision = 'add_event_tag_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Index reactions by (target_type, target_id, reaction_type) for per-target counts."""
+    op.create_index(
+        'ix_reactions_target',
+        'reactions',
+        ['target_type', 'target_id', 'reaction_type'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    """Remove the reaction target index."""
+    op.drop_index('ix_reactions_target', table_name='reactions')
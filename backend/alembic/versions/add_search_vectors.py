@@ -0,0 +1,52 @@
+"""add full-text search vectors to events and posts
+
+Revision ID: add_search_vectors
+Revises: f8a9b2c3d4e5
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_search_vectors'
+down_revision = 'f8a9b2c3d4e5'
+branch_labels = None
+depends_on = None
+
+
+EVENT_SEARCH_DOCUMENT = (
+    "setweight(to_tsvector('english'::regconfig, coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english'::regconfig, coalesce(tags, '[]'::json)), 'B') || "
+    "setweight(to_tsvector('english'::regconfig, coalesce(location, '')), 'C') || "
+    "setweight(to_tsvector('english'::regconfig, coalesce(description, '')), 'D')"
+)
+POST_SEARCH_DOCUMENT = "to_tsvector('english'::regconfig, coalesce(text, ''))"
+
+
+def upgrade() -> None:
+    """Add generated tsvector columns with GIN indexes for /search."""
+    op.add_column('events', sa.Column(
+        'search_vector',
+        postgresql.TSVECTOR(),
+        sa.Computed(EVENT_SEARCH_DOCUMENT, persisted=True),
+        nullable=True
+    ))
+    op.add_column('posts', sa.Column(
+        'search_vector',
+        postgresql.TSVECTOR(),
+        sa.Computed(POST_SEARCH_DOCUMENT, persisted=True),
+        nullable=True
+    ))
+    op.create_index('ix_events_search_vector', 'events', ['search_vector'], postgresql_using='gin')
+    op.create_index('ix_posts_search_vector', 'posts', ['search_vector'], postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Remove search vectors and their indexes."""
+    op.drop_index('ix_posts_search_vector', table_name='posts')
+    op.drop_index('ix_events_search_vector', table_name='events')
+    op.drop_column('posts', 'search_vector')
+    op.drop_column('events', 'search_vector')
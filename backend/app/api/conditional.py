@@ -0,0 +1,241 @@
+"""Conditional GET (ETag / Last-Modified) dependencies for read endpoints."""
+
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, List, Optional, Tuple
+from fastapi import Depends, Query, Request, Response
+from sqlalchemy import update
+from sqlalchemy.orm import aliased
+from sqlmodel import Session, func, select
+from app.db.session import get_session
+from app.core.negotiation import prefers_msgpack
+from app.api.deps import get_current_user, get_optional_current_user
+from app.models import User, Profile, Event, Post, Attendance, FairWorkPosting, CollectionVersion
+from app.schemas import Projection
+
+
+class NotModified(Exception):
+    """Raised by a version dependency when the client's copy is current (answered with 304)."""
+
+    def __init__(self, headers: dict):
+        self.headers = headers
+
+
+def _http_date(value: datetime) -> str:
+    return format_datetime(value.replace(tzinfo=timezone.utc, microsecond=0), usegmt=True)
+
+
+def check_validators(request: Request, response: Response, last_modified: datetime, *version: Any) -> None:
+    """
+    Set ETag and Last-Modified on the response, or raise NotModified.
+
+    The ETag is a weak tag hashed from version (ids, timestamps, options
+    that shape the payload), so it is computed from a version query
+    without building the response. MessagePack responses get their own
+    tag, so a JSON copy never revalidates a MessagePack one or the other
+    way round. If-None-Match takes precedence over If-Modified-Since, as
+    RFC 9110 requires.
+    """
+    digest = hashlib.sha1(repr((last_modified, *version)).encode()).hexdigest()[:20]
+    if prefers_msgpack(request.headers):
+        digest += "-msgpack"
+    headers = {
+        "ETag": f'W/"{digest}"',
+        "Last-Modified": _http_date(last_modified),
+        "Cache-Control": "no-cache",
+    }
+    response.headers.update(headers)
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if "*" in tags or f'"{digest}"' in tags:
+            raise NotModified(headers)
+        return
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return
+        if since.tzinfo and last_modified.replace(tzinfo=timezone.utc, microsecond=0) <= since:
+            raise NotModified(headers)
+
+
+def touch(session: Session, model, id: int) -> None:
+    """
+    Bump a row's updated_at without loading it. The caller commits.
+
+    Used when data embedded in the row's responses changes (attendance,
+    reactions), so its validators change too.
+    """
+    session.exec(
+        update(model)
+        .where(model.id == id)
+        .values(updated_at=datetime.utcnow())
+        .execution_options(synchronize_session=False)
+    )
+
+
+def collection_versions(session: Session, *models) -> Optional[Tuple[datetime, List[int]]]:
+    """
+    (newest updated_at, versions in argument order) of whole tables, read
+    from the trigger-maintained collection_versions rows, or None if a
+    table has no row yet.
+    """
+    names = [model.__tablename__ for model in models]
+    rows = {
+        row.name: row
+        for row in session.exec(select(CollectionVersion).where(CollectionVersion.name.in_(names))).all()
+    }
+    if len(rows) < len(names):
+        return None
+    return max(row.updated_at for row in rows.values()), [rows[name].version for name in names]
+
+
+def _parse_sections(include: Optional[str]) -> list:
+    return sorted({part.strip() for part in (include or "").split(",") if part.strip()})
+
+
+async def event_version(
+    event_id: int,
+    request: Request,
+    response: Response,
+    include: Optional[str] = None,
+    current_user: Optional[User] = Depends(get_optional_current_user),
+    session: Session = Depends(get_session)
+) -> None:
+    """
+    Validators for GET /events/{event_id}.
+
+    Version: the event's and creator's updated_at (attendance and
+    reactions bump the event), plus attendee profiles when embedded and
+    the viewer when their state is. Matched jobs change with postings, so
+    ?include=jobs responses carry no validators.
+    """
+    sections = _parse_sections(include)
+    if "jobs" in sections:
+        return
+    columns = [Event.updated_at, Profile.updated_at]
+    if "attendees" in sections:
+        attendee = aliased(Profile)
+        columns.append(
+            select(func.max(attendee.updated_at))
+            .join(Attendance, Attendance.user_id == attendee.user_id)
+            .where(Attendance.event_id == event_id)
+            .scalar_subquery()
+        )
+    row = session.exec(
+        select(*columns).join(Profile, Profile.id == Event.creator_id).where(Event.id == event_id)
+    ).first()
+    if row is None:
+        return  # the endpoint answers 404
+    viewer = current_user.id if current_user and "viewer" in sections else None
+    last_modified = max(value for value in row if value is not None)
+    check_validators(request, response, last_modified, "event", event_id, *row, sections, viewer)
+
+
+async def events_version(
+    request: Request,
+    response: Response,
+    tag: Optional[List[str]] = Query(None),
+    fields: Projection = Projection.FULL,
+    session: Session = Depends(get_session)
+) -> None:
+    """
+    Collection validators for GET /events and /events/map.
+
+    Version: the events table's version (any write, deletions included;
+    attendance and reactions bump the event).
+    """
+    versions = collection_versions(session, Event)
+    if versions is not None:
+        last_modified, version = versions
+        check_validators(
+            request, response, last_modified, "events", *version, request.url.path, sorted(tag or []), fields.value
+        )
+
+
+async def feed_version(
+    request: Request,
+    response: Response,
+    current_user: User = Depends(get_current_user),
+    session: Session = Depends(get_session)
+) -> None:
+    """
+    Validators for GET /feed.
+
+    Version: the events, posts and profiles (embedded creators) table
+    versions, the viewer (whose reactions and attendance are shown) and
+    the query.
+    """
+    versions = collection_versions(session, Event, Post, Profile)
+    if versions is not None:
+        last_modified, version = versions
+        check_validators(request, response, last_modified, "feed", *version, current_user.id, request.url.query)
+
+
+async def post_version(
+    post_id: int,
+    request: Request,
+    response: Response,
+    session: Session = Depends(get_session)
+) -> None:
+    """Validators for GET /posts/{post_id}: the post's and creator's updated_at."""
+    row = session.exec(
+        select(Post.updated_at, Profile.updated_at)
+        .join(Profile, Profile.id == Post.creator_id)
+        .where(Post.id == post_id)
+    ).first()
+    if row is not None:
+        check_validators(request, response, max(row), "post", post_id, *row)
+
+
+async def profile_version(
+    profile_id: int,
+    request: Request,
+    response: Response,
+    session: Session = Depends(get_session)
+) -> None:
+    """Validators for GET /profiles/{profile_id}."""
+    updated_at = session.exec(select(Profile.updated_at).where(Profile.id == profile_id)).first()
+    if updated_at is not None:
+        check_validators(request, response, updated_at, "profile", profile_id)
+
+
+async def my_profile_version(
+    request: Request,
+    response: Response,
+    current_user: User = Depends(get_current_user),
+    session: Session = Depends(get_session)
+) -> None:
+    """Validators for GET /profiles/me."""
+    row = session.exec(select(Profile.id, Profile.updated_at).where(Profile.user_id == current_user.id)).first()
+    if row is not None:
+        check_validators(request, response, row.updated_at, "profile", row.id, current_user.email)
+
+
+def postings_version(
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_session)
+) -> None:
+    """Collection validators for GET /unionized/ and /unionized/page: the postings table's version and the query."""
+    versions = collection_versions(db, FairWorkPosting)
+    if versions is not None:
+        last_modified, version = versions
+        check_validators(request, response, last_modified, "postings", *version, request.url.path, request.url.query)
+
+
+def posting_version(
+    posting_id: int,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_session)
+) -> None:
+    """Validators for GET /unionized/{posting_id}."""
+    updated_at = db.exec(select(FairWorkPosting.updated_at).where(FairWorkPosting.id == posting_id)).first()
+    if updated_at is not None:
+        check_validators(request, response, updated_at, "posting", posting_id)
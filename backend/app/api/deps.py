@@ -5,10 +5,12 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlmodel import Session, select
 from app.db.session import get_session
+from app.core.config import settings
 from app.core.security import verify_token
 from app.models import User
 
 security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
 
 
 async def get_current_user(
@@ -51,3 +53,32 @@ async def get_current_user(
         )
     
     return user
+
+
+async def get_optional_current_user(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security),
+    session: Session = Depends(get_session)
+) -> Optional[User]:
+    """
+    Dependency to get the current user on routes that also serve anonymous viewers.
+    
+    Returns None when no token is sent; an invalid token still raises 401.
+    """
+    if credentials is None:
+        return None
+    return await get_current_user(credentials=credentials, session=session)
+
+
+async def get_operator_user(current_user: User = Depends(get_current_user)) -> User:
+    """
+    Dependency for operational endpoints: the current user, who must be
+    listed in OPERATOR_EMAILS.
+    
+    Raises HTTPException 403 for any other authenticated user.
+    """
+    if current_user.email.lower() not in settings.get_operator_emails():
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Operator access required"
+        )
+    return current_user
@@ -1,7 +1,7 @@
 """API v1 router configuration."""
 
 from fastapi import APIRouter
-from app.api.v1.endpoints import auth, events, posts, profiles, reactions, feed, unionized
+from app.api.v1.endpoints import auth, events, posts, profiles, reactions, feed, unionized, search, exports, sync, stats
 
 api_router = APIRouter()
 
@@ -13,3 +13,7 @@ api_router.include_router(posts.router, prefix="/posts", tags=["posts"])
 api_router.include_router(reactions.router, prefix="/reactions", tags=["reactions"])
 api_router.include_router(feed.router, prefix="/feed", tags=["feed"])
 api_router.include_router(unionized.router, prefix="/unionized", tags=["unionized"])
+api_router.include_router(search.router, prefix="/search", tags=["search"])
+api_router.include_router(exports.router, prefix="/exports", tags=["exports"])
+api_router.include_router(sync.router, prefix="/sync", tags=["sync"])
+api_router.include_router(stats.router, prefix="/stats", tags=["stats"])
@@ -1,14 +1,96 @@
 """Event endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import Session, select
+from typing import List, Optional, Union
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import exists, true
+from sqlmodel import Session, select, func
 from app.db.session import get_session
-from app.schemas import EventCreate, EventResponse, EventWithCreator, AttendeeListResponse
-from app.models import User, Profile, Event, Attendance
-from app.api.deps import get_current_user
+from app.schemas import (
+    EventCreate, EventResponse, EventCard, EventDetail, EventViewerState, ProfileCard, Projection,
+    ReactionCounts, AttendeeListResponse, AttendeePage, TagCount,
+    BulkAttendanceRequest, BulkAttendanceResponse
+)
+from app.models import User, Profile, Event, Attendance, EventTagCount, Reaction, ReactionType, TargetType
+from app.api.deps import get_current_user, get_optional_current_user
+from app.api.conditional import event_version, events_version, touch
+from app.core.cache import cached, invalidate, model_key, model_tag
+from app.core.exceptions import ValidationException
+from app.core.pagination import encode_cursor, decode_cursor
+from app.core.sql import escape_like
+from app.core.projections import load_schema_columns, from_row
+from app.core.serialization import TrustedJSONResponse
+from app.services.attendance import bulk_check_in
+from app.services.geocoder import coordinates
+from app.services.profile_cards import creator_profiles
+from app.services.job_matching import is_labor_tagged, refresh_event_matches, event_jobs
 
 router = APIRouter()
 
+# Sections that can be embedded in the event detail via ?include=
+EVENT_INCLUDES = {"attendees", "reactions", "viewer", "jobs"}
+
+# Attendee profile cards returned per page
+ATTENDEE_PAGE_SIZE = 20
+
+
+def _parse_include(include: Optional[str]) -> set:
+    """Parse and validate a comma-separated ?include= value."""
+    if not include:
+        return set()
+    sections = {part.strip() for part in include.split(",") if part.strip()}
+    unknown = sections - EVENT_INCLUDES
+    if unknown:
+        raise ValidationException(
+            f"Unknown include: {', '.join(sorted(unknown))}",
+            field="include",
+            details={"allowed": sorted(EVENT_INCLUDES)}
+        )
+    return sections
+
+
+def _attendee_count():
+    """Correlated COUNT of an event's attendances, computed in the same query as the event."""
+    return (
+        select(func.count(Attendance.id))
+        .where(Attendance.event_id == Event.id)
+        .correlate(Event)
+        .scalar_subquery()
+        .label("attendee_count")
+    )
+
+
+def _event_cache_key(event_id: int, include: Optional[str] = None, current_user: Optional[User] = None, **_):
+    """Cache key for an event detail, or None when the response is per-user or changes with postings."""
+    sections = _parse_include(include)
+    if "jobs" in sections or ("viewer" in sections and current_user):
+        return None
+    return model_key(Event, event_id, *sorted(sections - {"viewer"}))
+
+
+def _event_cache_tags(event: dict) -> list:
+    """The event, its creator and any embedded attendee profiles."""
+    return [
+        model_tag(Event, event["id"]),
+        model_tag(Profile, event["creator"]["id"]),
+        *(model_tag(Profile, card["id"]) for card in event.get("attendees") or []),
+    ]
+
+
+def _attendee_cards(event_id: int):
+    """Select attendee profile cards for an event, in join order."""
+    return (
+        select(
+            Profile.id,
+            Profile.name,
+            Profile.avatar_url,
+            Profile.profile_type,
+            Attendance.id.label("attendance_id")
+        )
+        .join(Attendance, Attendance.user_id == Profile.user_id)
+        .where(Attendance.event_id == event_id)
+        .order_by(Attendance.id)
+    )
+
 
 @router.post("", response_model=EventResponse, status_code=status.HTTP_201_CREATED)
 async def create_event(
@@ -32,9 +114,17 @@ async def create_event(
         creator_id=profile.id,
         **event_data.model_dump()
     )
+    if event.latitude is None or event.longitude is None:
+        event.latitude, event.longitude = coordinates(event.location)
     session.add(event)
+    session.flush()
+    
+    # Precompute nearby job postings for labor actions
+    if is_labor_tagged(event.tags):
+        refresh_event_matches(session, [event.id])
     session.commit()
     session.refresh(event)
+    invalidate(model_tag(Event))
     
     # Return with attendee_count
     result = event.model_dump()
@@ -42,69 +132,178 @@ async def create_event(
     return EventResponse(**result)
 
 
-@router.get("", response_model=list[EventResponse])
+@router.get(
+    "",
+    response_model=Union[list[EventResponse], list[EventCard]],
+    dependencies=[Depends(events_version)]
+)
 async def list_events(
-    session: Session = Depends(get_session)
+    response: Response,
+    session: Session = Depends(get_session),
+    tag: Optional[List[str]] = Query(None),
+    fields: Projection = Projection.FULL
 ):
-    """List all events for the feed."""
-    statement = select(Event).order_by(Event.created_at.desc())
-    events = session.exec(statement).all()
+    """
+    List all events for the feed.
     
-    # Add attendee count to each event
-    result = []
-    for event in events:
-        event_dict = event.model_dump()
-        event_dict["attendee_count"] = len(event.attendances)
-        result.append(EventResponse(**event_dict))
+    Repeat the tag parameter to only return events carrying every given tag.
+    fields=card returns EventCards: descriptions are neither read from the
+    database nor sent.
+    """
+    schema = EventCard if fields == Projection.CARD else EventResponse
+    statement = (
+        select(Event, _attendee_count())
+        .options(load_schema_columns(Event, schema))
+        .order_by(Event.created_at.desc())
+    )
+    if tag:
+        statement = statement.where(Event.tags.contains(tag))
+    rows = session.exec(statement).all()
     
-    return result
+    result = [from_row(schema, event, attendee_count=attendee_count) for event, attendee_count in rows]
+    
+    return TrustedJSONResponse(result, list[schema], response)
 
 
-@router.get("/map", response_model=list[EventResponse])
+@router.get("/map", response_model=list[EventResponse], dependencies=[Depends(events_version)])
+@cached(key=lambda tag=None, **_: model_key(Event, "map", *sorted(tag or [])), tags=lambda value: [model_tag(Event)])
 async def list_map_events(
-    session: Session = Depends(get_session)
+    session: Session = Depends(get_session),
+    tag: Optional[List[str]] = Query(None)
 ):
-    """List all events with coordinates for the map."""
+    """List all events with coordinates for the map, optionally filtered by tag."""
     statement = (
-        select(Event)
+        select(Event, _attendee_count())
         .where(Event.latitude.isnot(None))
         .where(Event.longitude.isnot(None))
     )
-    events = session.exec(statement).all()
+    if tag:
+        statement = statement.where(Event.tags.contains(tag))
+    rows = session.exec(statement).all()
     
-    # Add attendee count to each event
     result = []
-    for event in events:
+    for event, attendee_count in rows:
         event_dict = event.model_dump()
-        event_dict["attendee_count"] = len(event.attendances)
+        event_dict["attendee_count"] = attendee_count
         result.append(EventResponse(**event_dict))
     
     return result
 
 
-@router.get("/{event_id}", response_model=EventWithCreator)
+@router.get("/tags", response_model=list[TagCount])
+async def list_event_tags(
+    session: Session = Depends(get_session),
+    limit: int = Query(100, ge=1, le=500)
+):
+    """
+    List event tags with the number of events carrying each, most used first.
+    
+    Reads the trigger-maintained event_tag_counts table, so the cost does not
+    grow with the number of events.
+    """
+    statement = (
+        select(EventTagCount)
+        .where(EventTagCount.event_count > 0)
+        .order_by(EventTagCount.event_count.desc(), EventTagCount.tag)
+        .limit(limit)
+    )
+    return session.exec(statement).all()
+
+
+@router.get("/{event_id}", response_model=EventDetail, dependencies=[Depends(event_version)])
+@cached(key=_event_cache_key, tags=_event_cache_tags)
 async def get_event(
     event_id: int,
+    include: Optional[str] = None,
+    current_user: Optional[User] = Depends(get_optional_current_user),
     session: Session = Depends(get_session)
 ):
-    """Get event detail by ID."""
-    event = session.get(Event, event_id)
+    """
+    Get event detail by ID.
     
-    if not event:
+    The event and its attendee count come back from a single query; the
+    creator (with email) comes from the profile-card cache. Pass a
+    comma-separated ?include= to embed more in the same response:
+    
+    - attendees: first page of attendee profile cards
+    - reactions: reaction counts by type
+    - viewer: whether the current user attends and how they reacted
+    - jobs: nearby fair work postings matched to a labor action
+    """
+    sections = _parse_include(include)
+    
+    columns = [Event, _attendee_count()]
+    
+    if "reactions" in sections:
+        counts = [
+            func.count(Reaction.id).filter(Reaction.reaction_type == reaction_type).label(reaction_type.value)
+            for reaction_type in ReactionType
+        ]
+        reaction_counts = (
+            select(*counts)
+            .where(Reaction.target_type == TargetType.EVENT, Reaction.target_id == Event.id)
+            .correlate(Event)
+            .lateral("reaction_counts")
+        )
+        columns.append(reaction_counts)
+    
+    viewer = current_user if "viewer" in sections else None
+    if viewer:
+        viewer_attending = exists().where(
+            Attendance.event_id == Event.id,
+            Attendance.user_id == viewer.id
+        ).correlate(Event)
+        viewer_reaction = (
+            select(Reaction.reaction_type)
+            .where(
+                Reaction.target_type == TargetType.EVENT,
+                Reaction.target_id == Event.id,
+                Reaction.user_id == viewer.id
+            )
+            .correlate(Event)
+            .limit(1)
+            .scalar_subquery()
+        )
+        columns += [viewer_attending.label("viewer_attending"), viewer_reaction.label("viewer_reaction")]
+    
+    statement = select(*columns).where(Event.id == event_id)
+    if "reactions" in sections:
+        statement = statement.join(reaction_counts, true())
+    
+    row = session.exec(statement).first()
+    
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Event not found"
         )
     
-    # Load creator relationship
-    creator = session.get(Profile, event.creator_id)
+    event = row[0]
     
-    # Build response with attendee count
+    # Build response with attendee count and creator
     event_dict = event.model_dump()
-    event_dict["attendee_count"] = len(event.attendances)
-    event_dict["creator"] = creator
+    event_dict["attendee_count"] = row.attendee_count
+    event_dict["creator"] = creator_profiles(session, [event.creator_id])[event.creator_id]
+    
+    if "reactions" in sections:
+        event_dict["reactions"] = ReactionCounts(
+            **{reaction_type.value: getattr(row, reaction_type.value) for reaction_type in ReactionType}
+        )
+    
+    if viewer:
+        event_dict["viewer"] = EventViewerState(
+            attending=row.viewer_attending,
+            reaction_type=row.viewer_reaction
+        )
+    
+    if "attendees" in sections:
+        attendee_rows = session.exec(_attendee_cards(event_id).limit(ATTENDEE_PAGE_SIZE)).all()
+        event_dict["attendees"] = [ProfileCard(**r._mapping) for r in attendee_rows]
     
-    return EventWithCreator(**event_dict)
+    if "jobs" in sections:
+        event_dict["jobs"] = event_jobs(session, event_id)
+    
+    return EventDetail(**event_dict)
 
 
 @router.post("/{event_id}/join", response_model=dict)
@@ -141,8 +340,10 @@ async def join_event(
         event_id=event_id
     )
     session.add(attendance)
+    touch(session, Event, event_id)
     session.commit()
     session.refresh(attendance)
+    invalidate(model_tag(Event, event_id), model_tag(Event))
     
     return {
         "message": "Successfully joined event",
@@ -171,7 +372,9 @@ async def leave_event(
         )
     
     session.delete(attendance)
+    touch(session, Event, event_id)
     session.commit()
+    invalidate(model_tag(Event, event_id), model_tag(Event))
     
     return {"message": "Successfully left event"}
 
@@ -198,3 +401,84 @@ async def get_event_attendees(
         total_count=len(attendances),
         attendees=[a.user_id for a in attendances]
     )
+
+
+@router.get("/{event_id}/attendees/profiles", response_model=AttendeePage)
+async def list_event_attendee_profiles(
+    event_id: int,
+    q: Optional[str] = Query(None, min_length=1, max_length=255),
+    cursor: Optional[str] = None,
+    limit: int = Query(ATTENDEE_PAGE_SIZE, ge=1, le=100),
+    session: Session = Depends(get_session)
+):
+    """
+    List attendee profile cards for an event, in the order people joined.
+    
+    Each page (and the total) comes from one joined query, so clients do not
+    need to look up attendee profiles one by one. Pass q to only list
+    attendees whose name starts with it (case-insensitive).
+    """
+    statement = _attendee_cards(event_id)
+    total = (
+        select(func.count(Attendance.id))
+        .join(Profile, Profile.user_id == Attendance.user_id)
+        .where(Attendance.event_id == event_id)
+    )
+    
+    if q:
+        name_prefix = Profile.name.ilike(f"{escape_like(q)}%")
+        statement = statement.where(name_prefix)
+        total = total.where(name_prefix)
+    
+    if cursor:
+        (last_attendance_id,) = decode_cursor(cursor, int)
+        statement = statement.where(Attendance.id > last_attendance_id)
+    
+    statement = statement.add_columns(total.correlate(None).scalar_subquery().label("total_count"))
+    rows = session.exec(statement.limit(limit + 1)).all()
+    
+    if not rows and not session.get(Event, event_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Event not found"
+        )
+    
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    
+    return AttendeePage(
+        total_count=rows[0].total_count if rows else session.exec(total).one(),
+        attendees=[ProfileCard(**row._mapping) for row in rows],
+        next_cursor=encode_cursor(rows[-1].attendance_id) if has_more else None
+    )
+
+
+@router.post("/{event_id}/attendees/bulk", response_model=BulkAttendanceResponse)
+async def bulk_check_in_attendees(
+    event_id: int,
+    request: BulkAttendanceRequest,
+    current_user: User = Depends(get_current_user),
+    session: Session = Depends(get_session)
+):
+    """
+    Check many people in to an event at once (organizer only).
+    
+    Accepts user ids and/or emails, resolves them in bulk and records all
+    attendances in one transaction. Returns the outcome for every row:
+    checked_in, already_attending, unknown_user or duplicate.
+    """
+    event = session.get(Event, event_id)
+    if not event:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Event not found"
+        )
+    
+    statement = select(Profile.id).where(Profile.user_id == current_user.id)
+    if session.exec(statement).first() != event.creator_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only the event organizer can check people in"
+        )
+    
+    return bulk_check_in(session, event_id, request.user_ids, request.emails)
@@ -0,0 +1,86 @@
+"""Streaming export endpoints."""
+
+from datetime import date
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select
+from sqlmodel import Session, select
+from app.db.session import get_session
+from app.api.deps import get_current_user
+from app.models import User, Profile, Event
+from app.schemas import ExportFormat
+from app.services.exports import export_chunks, events_export, attendees_export, postings_export
+
+router = APIRouter()
+
+MEDIA_TYPES = {ExportFormat.NDJSON: "application/x-ndjson", ExportFormat.CSV: "text/csv"}
+
+
+def _export_response(name: str, statement: Select, format: ExportFormat) -> StreamingResponse:
+    """Stream statement's rows as a dated file download."""
+    filename = f"{name}-{date.today().isoformat()}.{format.value}"
+    return StreamingResponse(
+        export_chunks(statement, format),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
+@router.get("/events")
+async def export_events(
+    format: ExportFormat = ExportFormat.NDJSON,
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Export every event as NDJSON or CSV.
+
+    Rows are streamed from a server-side cursor in a read-only transaction
+    with a statement timeout, so exports of any size use flat memory.
+    """
+    return _export_response("events", events_export(), format)
+
+
+@router.get("/attendees")
+async def export_attendees(
+    format: ExportFormat = ExportFormat.NDJSON,
+    event_id: Optional[int] = None,
+    current_user: User = Depends(get_current_user),
+    session: Session = Depends(get_session)
+):
+    """
+    Export attendees of the events you organize (or of one of them) as NDJSON or CSV.
+
+    Each row has the event, the attendee's profile id and name, and when
+    they joined; emails are not exported.
+    """
+    profile_id = session.exec(select(Profile.id).where(Profile.user_id == current_user.id)).first()
+    if profile_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Profile not found"
+        )
+
+    if event_id is not None:
+        creator_id = session.exec(select(Event.creator_id).where(Event.id == event_id)).first()
+        if creator_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Event not found"
+            )
+        if creator_id != profile_id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Only the event's organizer can export its attendees"
+            )
+
+    return _export_response("attendees", attendees_export(profile_id, event_id), format)
+
+
+@router.get("/postings")
+async def export_postings(
+    format: ExportFormat = ExportFormat.NDJSON,
+    current_user: User = Depends(get_current_user)
+):
+    """Export every fair work posting as NDJSON or CSV, duplicates included (see duplicate_of_id)."""
+    return _export_response("postings", postings_export(), format)
@@ -1,45 +1,55 @@
 """Feed endpoints."""
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
+from sqlalchemy.orm import defer
 from sqlmodel import Session, select
 from app.db.session import get_session
 from app.api.deps import get_current_user
-from app.schemas import FeedItem, ProfileResponse
-from app.models import Event, Post, Profile, User, Reaction, Attendance
+from app.api.conditional import feed_version
+from app.schemas import FeedItem, ProfileCard, Projection
+from app.models import Event, Post, User, Reaction, Attendance
+from app.core.serialization import TrustedJSONResponse
+from app.services.profile_cards import creator_profiles
 
 router = APIRouter()
 
 
-@router.get("", response_model=list[FeedItem])
+@router.get("", response_model=list[FeedItem], dependencies=[Depends(feed_version)])
 async def get_feed(
+    response: Response,
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_user),
-    limit: int = 50
+    limit: int = 50,
+    fields: Projection = Projection.FULL
 ):
     """
     Get the community feed (events and posts in reverse chronological order).
     
     Returns a unified feed of both events and posts, newest first.
+    fields=card leaves event descriptions out (not read from the database)
+    and embeds creators as ProfileCards.
     """
+    card = fields == Projection.CARD
+    
     # Get events
     event_statement = select(Event).order_by(Event.created_at.desc()).limit(limit)
+    if card:
+        event_statement = event_statement.options(defer(Event.description))
     events = session.exec(event_statement).all()
     
     # Get posts
     post_statement = select(Post).order_by(Post.created_at.desc()).limit(limit)
     posts = session.exec(post_statement).all()
     
+    # Creator profiles for the whole page, mostly from the profile-card cache
+    creators = creator_profiles(session, [item.creator_id for item in (*events, *posts)])
+    if card:
+        creators = {profile_id: ProfileCard(**profile.model_dump()) for profile_id, profile in creators.items()}
+    
     # Combine and sort by created_at
     feed_items = []
     
     for event in events:
-        creator_profile = session.get(Profile, event.creator_id)
-        creator_user = session.get(User, creator_profile.user_id)
-        
-        # Create ProfileResponse with email from User
-        creator_data = creator_profile.model_dump()
-        creator_data['email'] = creator_user.email
-        
         # Get reactions for this event
         reaction_statement = select(Reaction).where(
             Reaction.target_type == "EVENT",
@@ -70,10 +80,10 @@ async def get_feed(
         feed_items.append(FeedItem(
             type="event",
             id=event.id,
-            creator=ProfileResponse(**creator_data),
+            creator=creators[event.creator_id],
             created_at=event.created_at,
             title=event.title,
-            description=event.description,
+            description=None if card else event.description,
             event_type=event.tags[0] if event.tags else None,  # Use first tag as event_type
             start_time=event.event_date,  # Map event_date to start_time
             end_time=None,  # No end_time in current model
@@ -86,13 +96,6 @@ async def get_feed(
         ))
     
     for post in posts:
-        creator_profile = session.get(Profile, post.creator_id)
-        creator_user = session.get(User, creator_profile.user_id)
-        
-        # Create ProfileResponse with email from User
-        creator_data = creator_profile.model_dump()
-        creator_data['email'] = creator_user.email
-        
         # Get reactions for this post
         reaction_statement = select(Reaction).where(
             Reaction.target_type == "POST",
@@ -116,7 +119,7 @@ async def get_feed(
         feed_items.append(FeedItem(
             type="post",
             id=post.id,
-            creator=ProfileResponse(**creator_data),
+            creator=creators[post.creator_id],
             created_at=post.created_at,
             text=post.text,
             image_url=post.image_url,
@@ -126,4 +129,4 @@ async def get_feed(
     # Sort by created_at (newest first) and limit
     feed_items.sort(key=lambda x: x.created_at, reverse=True)
     
-    return feed_items[:limit]
+    return TrustedJSONResponse(feed_items[:limit], list[FeedItem], response)
@@ -6,6 +6,9 @@ from app.db.session import get_session
 from app.schemas import PostCreate, PostResponse, PostWithCreator
 from app.models import User, Profile, Post
 from app.api.deps import get_current_user
+from app.api.conditional import post_version
+from app.core.cache import cached, invalidate, model_key, model_tag
+from app.services.profile_cards import creator_profiles
 
 router = APIRouter()
 
@@ -35,16 +38,21 @@ async def create_post(
     session.add(post)
     session.commit()
     session.refresh(post)
+    invalidate(model_tag(Post))
     
     return post
 
 
-@router.get("/{post_id}", response_model=PostWithCreator)
+@router.get("/{post_id}", response_model=PostWithCreator, dependencies=[Depends(post_version)])
+@cached(
+    key=lambda post_id, **_: model_key(Post, post_id),
+    tags=lambda value: [model_tag(Post, value["id"]), model_tag(Profile, value["creator"]["id"])]
+)
 async def get_post(
     post_id: int,
     session: Session = Depends(get_session)
 ):
-    """Get post detail by ID."""
+    """Get post detail by ID, with its creator from the profile-card cache."""
     post = session.get(Post, post_id)
     
     if not post:
@@ -53,11 +61,8 @@ async def get_post(
             detail="Post not found"
         )
     
-    # Load creator relationship
-    creator = session.get(Profile, post.creator_id)
-    
     # Build response
     post_dict = post.model_dump()
-    post_dict["creator"] = creator
+    post_dict["creator"] = creator_profiles(session, [post.creator_id])[post.creator_id]
     
     return PostWithCreator(**post_dict)
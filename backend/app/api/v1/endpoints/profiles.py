@@ -1,17 +1,79 @@
 """Profile endpoints."""
 
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Optional, Union
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlmodel import Session, select
 from app.db.session import get_session
-from app.schemas import ProfileResponse, ProfileUpdate, EventResponse
-from app.models import User, Profile, Event, Attendance
+from app.schemas import ProfileCard, ProfileResponse, ProfileUpdate, EventResponse, Projection
+from app.models import User, Profile, ProfileType, Event, Attendance
 from app.api.deps import get_current_user
+from app.api.conditional import my_profile_version, profile_version
+from app.core.cache import cached, invalidate, model_key, model_tag
+from app.core.exceptions import ValidationException
+from app.core.projections import schema_columns
+from app.services.geocoder import coordinates
+from app.services.profile_search import search_profiles
 
 router = APIRouter()
 
+# Most profiles one batch lookup may ask for
+MAX_BATCH_PROFILES = 100
 
-@router.get("/me", response_model=ProfileResponse)
+
+def _parse_ids(ids: str) -> List[int]:
+    """Parse a comma-separated ?ids= value, keeping the first occurrence of each id."""
+    parsed = []
+    for part in ids.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        try:
+            parsed.append(int(part))
+        except ValueError:
+            raise ValidationException(f"Invalid profile id: {part}", field="ids")
+    parsed = list(dict.fromkeys(parsed))
+    if len(parsed) > MAX_BATCH_PROFILES:
+        raise ValidationException(
+            f"At most {MAX_BATCH_PROFILES} profiles can be requested at once",
+            field="ids",
+            details={"max": MAX_BATCH_PROFILES}
+        )
+    return parsed
+
+
+def _profiles_with_email():
+    """Select profiles with their user's email, joined in the same query."""
+    return select(Profile, User.email).join(User, User.id == Profile.user_id)
+
+
+@router.get("", response_model=Union[list[ProfileResponse], list[ProfileCard]])
+async def get_profiles(
+    ids: str = Query(..., min_length=1, description="Comma-separated profile ids"),
+    fields: Projection = Projection.FULL,
+    session: Session = Depends(get_session)
+):
+    """
+    Get many profiles by ID in one request.
+    
+    Profiles and emails come from one joined query. Results follow the
+    order of ids (duplicates collapsed); ids with no profile are left out.
+    fields=card returns ProfileCards, selecting only their columns.
+    """
+    profile_ids = _parse_ids(ids)
+    if not profile_ids:
+        return []
+    
+    if fields == Projection.CARD:
+        statement = select(*schema_columns(Profile, ProfileCard)).where(Profile.id.in_(profile_ids))
+        by_id = {row.id: ProfileCard(**row._mapping) for row in session.exec(statement)}
+    else:
+        rows = session.exec(_profiles_with_email().where(Profile.id.in_(profile_ids))).all()
+        by_id = {profile.id: {**profile.model_dump(), "email": email} for profile, email in rows}
+    return [by_id[profile_id] for profile_id in profile_ids if profile_id in by_id]
+
+
+@router.get("/me", response_model=ProfileResponse, dependencies=[Depends(my_profile_version)])
 async def get_my_profile(
     current_user: User = Depends(get_current_user),
     session: Session = Depends(get_session)
@@ -53,11 +115,14 @@ async def update_my_profile(
     update_data = profile_data.model_dump(exclude_unset=True)
     for key, value in update_data.items():
         setattr(profile, key, value)
+    if "location" in update_data:
+        profile.latitude, profile.longitude = coordinates(profile.location)
     
     profile.updated_at = datetime.utcnow()
     session.add(profile)
     session.commit()
     session.refresh(profile)
+    invalidate(model_tag(Profile, profile.id))
     
     # Return profile with email from user
     return {
@@ -66,21 +131,45 @@ async def update_my_profile(
     }
 
 
-@router.get("/{profile_id}", response_model=ProfileResponse)
+@router.get("/search", response_model=list[ProfileCard])
+async def search_profile_directory(
+    q: Optional[str] = Query(None, min_length=1, max_length=255),
+    cause: Optional[List[str]] = Query(None),
+    profile_type: Optional[ProfileType] = None,
+    limit: int = Query(10, ge=1, le=50),
+    session: Session = Depends(get_session)
+):
+    """
+    Search people and groups by name, for the directory and autocomplete.
+    
+    q matches the start of the name, or of a later word in it
+    (case-insensitive). Repeat cause to only return profiles supporting
+    every given cause. Results are lightweight cards, names starting with q
+    first.
+    """
+    return search_profiles(session, q=q, causes=cause, profile_type=profile_type, limit=limit)
+
+
+@router.get("/{profile_id}", response_model=ProfileResponse, dependencies=[Depends(profile_version)])
+@cached(
+    key=lambda profile_id, **_: model_key(Profile, profile_id),
+    tags=lambda value: [model_tag(Profile, value["id"])]
+)
 async def get_profile(
     profile_id: int,
     session: Session = Depends(get_session)
 ):
     """Get a profile by ID."""
-    profile = session.get(Profile, profile_id)
+    row = session.exec(_profiles_with_email().where(Profile.id == profile_id)).first()
     
-    if not profile:
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Profile not found"
         )
     
-    return profile
+    profile, email = row
+    return {**profile.model_dump(), "email": email}
 
 
 @router.get("/{profile_id}/events", response_model=list[EventResponse])
@@ -1,15 +1,28 @@
 """Reaction endpoints."""
 
+from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlmodel import Session, select, func
 from app.db.session import get_session
 from app.schemas import ReactionCreate, ReactionResponse, ReactionCounts
 from app.models import User, Reaction, ReactionType, TargetType, Event, Post
 from app.api.deps import get_current_user
+from app.api.conditional import touch
+from app.core.cache import invalidate, model_tag
 
 router = APIRouter()
 
 
+def _touch_target(session: Session, target_type: TargetType, target_id: int) -> None:
+    """Bump the target's version, since its responses embed reaction counts. The caller commits."""
+    touch(session, Event if target_type == TargetType.EVENT else Post, target_id)
+
+
+def _invalidate_target(target_type: TargetType, target_id: int) -> None:
+    """Drop cached responses embedding a target's reaction counts."""
+    invalidate(model_tag(Event if target_type == TargetType.EVENT else Post, target_id))
+
+
 @router.post("", response_model=ReactionResponse, status_code=status.HTTP_201_CREATED)
 async def add_or_update_reaction(
     reaction_data: ReactionCreate,
@@ -45,9 +58,12 @@ async def add_or_update_reaction(
     if existing:
         # Update existing reaction
         existing.reaction_type = reaction_data.reaction_type
+        existing.updated_at = datetime.utcnow()
         session.add(existing)
+        _touch_target(session, existing.target_type, existing.target_id)
         session.commit()
         session.refresh(existing)
+        _invalidate_target(existing.target_type, existing.target_id)
         return existing
     
     # Create new reaction
@@ -56,8 +72,10 @@ async def add_or_update_reaction(
         **reaction_data.model_dump()
     )
     session.add(reaction)
+    _touch_target(session, reaction.target_type, reaction.target_id)
     session.commit()
     session.refresh(reaction)
+    _invalidate_target(reaction.target_type, reaction.target_id)
     
     return reaction
 
@@ -85,7 +103,9 @@ async def remove_reaction(
         )
     
     session.delete(reaction)
+    _touch_target(session, target_type, target_id)
     session.commit()
+    _invalidate_target(target_type, target_id)
     
     return {"message": "Reaction removed successfully"}
 
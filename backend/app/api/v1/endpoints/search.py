@@ -0,0 +1,149 @@
+"""Full-text search endpoints."""
+
+from datetime import datetime
+from typing import Optional
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import REAL, cast, func, literal, tuple_, union_all
+from sqlmodel import Session, select
+from app.db.session import get_session
+from app.schemas import SearchResponse, SearchResult
+from app.models import Event, Post, TargetType, SEARCH_CONFIG
+from app.core.geo import bounding_box
+from app.core.pagination import encode_cursor, decode_cursor
+
+router = APIRouter()
+
+event_vector = Event.__table__.c.search_vector
+post_vector = Post.__table__.c.search_vector
+
+
+@router.get("", response_model=SearchResponse)
+def search(
+    *,
+    session: Session = Depends(get_session),
+    q: str = Query(..., min_length=1, max_length=200),
+    type: Optional[TargetType] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    latitude: Optional[float] = Query(None, ge=-90, le=90),
+    longitude: Optional[float] = Query(None, ge=-180, le=180),
+    radius_km: float = Query(25, gt=0, le=500),
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=50),
+) -> SearchResponse:
+    """
+    Search events and posts, best matches first.
+
+    Uses the GIN-indexed search vectors, so only matching rows are ranked.
+    Date filters apply to the event date for events and the creation date
+    for posts. A geo filter (latitude + longitude) limits results to events
+    within radius_km; posts have no location and are left out.
+    """
+    ts_query = func.websearch_to_tsquery(SEARCH_CONFIG, q)
+    geo = latitude is not None and longitude is not None
+
+    branches = []
+
+    if type in (None, TargetType.EVENT):
+        event_query = select(
+            literal(TargetType.EVENT.value).label("type"),
+            Event.id.label("id"),
+            func.ts_rank_cd(event_vector, ts_query).label("rank"),
+        ).where(event_vector.op("@@")(ts_query))
+        if date_from:
+            event_query = event_query.where(Event.event_date >= date_from)
+        if date_to:
+            event_query = event_query.where(Event.event_date <= date_to)
+        if geo:
+            min_lat, max_lat, min_lng, max_lng = bounding_box(latitude, longitude, radius_km)
+            event_query = event_query.where(
+                Event.latitude.between(min_lat, max_lat),
+                Event.longitude.between(min_lng, max_lng),
+            )
+        branches.append(event_query)
+
+    if type in (None, TargetType.POST) and not geo:
+        post_query = select(
+            literal(TargetType.POST.value).label("type"),
+            Post.id.label("id"),
+            func.ts_rank_cd(post_vector, ts_query).label("rank"),
+        ).where(post_vector.op("@@")(ts_query))
+        if date_from:
+            post_query = post_query.where(Post.created_at >= date_from)
+        if date_to:
+            post_query = post_query.where(Post.created_at <= date_to)
+        branches.append(post_query)
+
+    if not branches:
+        return SearchResponse(results=[])
+
+    hits = (branches[0] if len(branches) == 1 else union_all(*branches)).subquery()
+    statement = select(hits.c.type, hits.c.id, hits.c.rank)
+
+    # Keyset pagination on (rank, type, id); the rank is compared as REAL so
+    # the cursor round-trip cannot skip or repeat the boundary row
+    if cursor:
+        last_rank, last_type, last_id = decode_cursor(cursor, float, str, int)
+        statement = statement.where(
+            tuple_(hits.c.rank, hits.c.type, hits.c.id)
+            < tuple_(cast(last_rank, REAL), last_type, last_id)
+        )
+
+    statement = statement.order_by(
+        hits.c.rank.desc(), hits.c.type.desc(), hits.c.id.desc()
+    ).limit(limit + 1)
+    rows = session.exec(statement).all()
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    # Hydrate the page with one query per result type
+    event_ids = [row.id for row in rows if row.type == TargetType.EVENT.value]
+    post_ids = [row.id for row in rows if row.type == TargetType.POST.value]
+    events = {}
+    posts = {}
+    if event_ids:
+        events = {e.id: e for e in session.exec(select(Event).where(Event.id.in_(event_ids)))}
+    if post_ids:
+        posts = {p.id: p for p in session.exec(select(Post).where(Post.id.in_(post_ids)))}
+
+    results = []
+    for row in rows:
+        if row.type == TargetType.EVENT.value:
+            event = events.get(row.id)
+            if event is None:
+                continue
+            results.append(SearchResult(
+                type=TargetType.EVENT,
+                id=event.id,
+                rank=row.rank,
+                creator_id=event.creator_id,
+                created_at=event.created_at,
+                title=event.title,
+                description=event.description,
+                event_date=event.event_date,
+                location=event.location,
+                latitude=event.latitude,
+                longitude=event.longitude,
+                tags=event.tags,
+            ))
+        else:
+            post = posts.get(row.id)
+            if post is None:
+                continue
+            results.append(SearchResult(
+                type=TargetType.POST,
+                id=post.id,
+                rank=row.rank,
+                creator_id=post.creator_id,
+                created_at=post.created_at,
+                text=post.text,
+                image_url=post.image_url,
+            ))
+
+    next_cursor = None
+    if has_more:
+        last = rows[-1]
+        next_cursor = encode_cursor(last.rank, last.type, last.id)
+
+    return SearchResponse(results=results, next_cursor=next_cursor)
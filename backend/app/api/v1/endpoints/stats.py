@@ -0,0 +1,18 @@
+"""Runtime counters of the serving process."""
+
+from fastapi import APIRouter, Depends
+from app.api.deps import get_operator_user
+from app.models import User
+from app.core import compression, single_flight
+from app.core.cache import get_cache
+
+router = APIRouter()
+
+
+@router.get("")
+async def process_stats(current_user: User = Depends(get_operator_user)):
+    """
+    Get this worker process's cache, request coalescing and compression counters.
+    Only operators (accounts listed in OPERATOR_EMAILS) may read them.
+    """
+    return {"cache": get_cache().stats(), "coalescing": single_flight.stats(), "compression": compression.stats()}
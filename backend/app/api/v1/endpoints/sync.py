@@ -0,0 +1,45 @@
+"""Delta sync endpoint for the mobile app."""
+
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlmodel import Session
+from app.db.session import get_session
+from app.api.deps import get_current_user
+from app.models import User
+from app.schemas import SyncResponse
+from app.core.serialization import TrustedJSONResponse
+from app.services.sync import ChangesPruned, changes_since, current_watermark
+
+router = APIRouter()
+
+
+@router.get("", response_model=SyncResponse)
+async def sync(
+    since: Optional[str] = None,
+    current_user: User = Depends(get_current_user),
+    session: Session = Depends(get_session)
+):
+    """
+    Get what changed since the watermark of your last sync.
+    
+    Returns changed events and posts, current reaction counts of events
+    and posts reacted to, events you started attending, and tombstones
+    for deletions and events you left. Store the returned watermark and
+    pass it as since next time; while has_more is true, sync again.
+    
+    Without since, only a watermark is returned: take it, refetch your
+    lists, then sync from it. A watermark older than the change log keeps
+    changes gets 410 Gone; start over the same way.
+    """
+    if since is None:
+        return SyncResponse(watermark=current_watermark(session))
+    
+    try:
+        changes = changes_since(session, current_user.id, since)
+    except ChangesPruned:
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail="Changes since this watermark are no longer kept; refetch and sync without since"
+        )
+    
+    return TrustedJSONResponse(changes, SyncResponse)
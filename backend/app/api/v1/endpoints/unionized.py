@@ -1,48 +1,160 @@
 """API endpoints for Unionized fair work postings."""
 
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlmodel import Session, select
+import codecs
+from typing import List, Optional, Union
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Response, UploadFile
+from sqlmodel import Session, func, select
 from app.db.session import get_session
-from app.models import FairWorkPosting, EmploymentType, UnionStatus
-from app.schemas import FairWorkPostingCreate, FairWorkPostingResponse
+from app.models import User, Event, FairWorkPosting, EmploymentType, UnionStatus
+from app.schemas import (
+    FairWorkPostingCreate, FairWorkPostingResponse, FairWorkPostingCard, FairWorkPostingPage, PostingSort, Projection,
+    PostingImportFormat, PostingImportReport, EventJobMatch
+)
+from app.api.deps import get_current_user
+from app.api.conditional import posting_version, postings_version
+from app.core.cache import cached, invalidate, model_key, model_tag
+from app.core.projections import load_schema_columns, from_row
+from app.core.serialization import TrustedJSONResponse
+from app.services.postings import filter_postings, sort_postings, after_cursor, next_cursor, posting_facets
+from app.services.posting_dedupe import flag_duplicates
+from app.services.job_matching import MATCH_LIMIT, refresh_posting_matches, event_jobs
+from app.services.posting_import import detect_format, is_utf8, read_records, import_postings
+from app.services.geocoder import coordinates
 
 router = APIRouter()
 
 
-@router.get("/", response_model=List[FairWorkPostingResponse])
+@router.get(
+    "/",
+    response_model=Union[List[FairWorkPostingResponse], List[FairWorkPostingCard]],
+    dependencies=[Depends(postings_version)]
+)
 def get_fair_work_postings(
     *,
+    response: Response,
     db: Session = Depends(get_session),
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
+    q: Optional[str] = Query(None, min_length=1, max_length=200),
     location: Optional[str] = None,
     employment_type: Optional[EmploymentType] = None,
     union_status: Optional[UnionStatus] = None,
-) -> List[FairWorkPosting]:
+    min_wage: Optional[float] = Query(None, ge=0),
+    max_wage: Optional[float] = Query(None, ge=0),
+    fields: Projection = Projection.FULL,
+) -> TrustedJSONResponse:
     """
     Get fair work postings with optional filters.
     Returns chronological list (newest first).
-    """
-    query = select(FairWorkPosting)
     
-    # Apply filters
-    if location:
-        query = query.where(FairWorkPosting.location.ilike(f"%{location}%"))
-    if employment_type:
-        query = query.where(FairWorkPosting.employment_type == employment_type)
-    if union_status:
-        query = query.where(FairWorkPosting.union_status == union_status)
+    q is a typo-tolerant search over title, organization and location.
+    min_wage/max_wage keep postings whose wage range overlaps them.
+    fields=card returns FairWorkPostingCards, loading only their columns.
+    """
+    schema = FairWorkPostingCard if fields == Projection.CARD else FairWorkPostingResponse
+    query = filter_postings(
+        select(FairWorkPosting).options(load_schema_columns(FairWorkPosting, schema)),
+        q=q,
+        location=location,
+        employment_type=employment_type,
+        union_status=union_status,
+        min_wage=min_wage,
+        max_wage=max_wage,
+    )
     
     # Order by posted_date descending (newest first)
-    query = query.order_by(FairWorkPosting.posted_date.desc())
+    query = query.order_by(FairWorkPosting.posted_date.desc(), FairWorkPosting.id.desc())
     query = query.offset(skip).limit(limit)
     
     postings = db.exec(query).all()
-    return postings
+    return TrustedJSONResponse([from_row(schema, posting) for posting in postings], List[schema], response)
+
+
+@router.get("/page", response_model=FairWorkPostingPage, dependencies=[Depends(postings_version)])
+def get_fair_work_posting_page(
+    *,
+    response: Response,
+    db: Session = Depends(get_session),
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=100),
+    facets: bool = True,
+    q: Optional[str] = Query(None, min_length=1, max_length=200),
+    location: Optional[str] = None,
+    employment_type: Optional[EmploymentType] = None,
+    union_status: Optional[UnionStatus] = None,
+    min_wage: Optional[float] = Query(None, ge=0),
+    max_wage: Optional[float] = Query(None, ge=0),
+    sort: PostingSort = PostingSort.NEWEST,
+    fields: Projection = Projection.FULL,
+) -> TrustedJSONResponse:
+    """
+    Get a page of fair work postings with facet counts.
+    
+    Pass next_cursor from the previous page as cursor; unlike skip, the
+    cost of a page does not grow with how deep the client has paged.
+    The first page also carries facet counts (per employment type, union
+    status and wage band) under the same filters; pass facets=false to
+    skip them.
+    
+    sort is newest (default), wage_desc or wage_asc; wage sorts order by
+    the top of the posted wage range and leave out postings without one.
+    A cursor only continues the sort it was issued for.
+    
+    fields=card returns FairWorkPostingCards as items, loading only their
+    columns.
+    """
+    filters = dict(
+        q=q,
+        location=location,
+        employment_type=employment_type,
+        union_status=union_status,
+        min_wage=min_wage,
+        max_wage=max_wage,
+    )
+    schema = FairWorkPostingCard if fields == Projection.CARD else FairWorkPostingResponse
+    query = select(FairWorkPosting).options(load_schema_columns(FairWorkPosting, schema))
+    query = sort_postings(filter_postings(query, **filters), sort)
+    
+    if cursor:
+        query = after_cursor(query, sort, cursor)
+    
+    postings = db.exec(query.limit(limit + 1)).all()
+    
+    has_more = len(postings) > limit
+    postings = postings[:limit]
+    
+    page = FairWorkPostingPage(
+        items=[from_row(schema, posting) for posting in postings],
+        next_cursor=next_cursor(postings[-1], sort) if has_more else None,
+        facets=posting_facets(db, **filters) if facets and not cursor else None,
+    )
+    return TrustedJSONResponse(page, FairWorkPostingPage, response)
 
 
-@router.get("/{posting_id}", response_model=FairWorkPostingResponse)
+@router.get("/near-event/{event_id}", response_model=List[EventJobMatch])
+def get_postings_near_event(
+    *,
+    db: Session = Depends(get_session),
+    event_id: int,
+    limit: int = Query(MATCH_LIMIT, ge=1, le=MATCH_LIMIT),
+) -> List[EventJobMatch]:
+    """
+    Get fair work postings matched to an upcoming labor event, best first.
+    
+    Matches (distance plus keyword overlap) are precomputed whenever the
+    event or a nearby posting changes, so this is a single indexed read.
+    """
+    matches = event_jobs(db, event_id, limit)
+    if not matches and not db.get(Event, event_id):
+        raise HTTPException(status_code=404, detail="Event not found")
+    return matches
+
+
+@router.get("/{posting_id}", response_model=FairWorkPostingResponse, dependencies=[Depends(posting_version)])
+@cached(
+    key=lambda posting_id, **_: model_key(FairWorkPosting, posting_id),
+    tags=lambda value: [model_tag(FairWorkPosting, value["id"])]
+)
 def get_fair_work_posting(
     *,
     db: Session = Depends(get_session),
@@ -64,9 +176,69 @@ def create_fair_work_posting(
     """
     Create a new fair work posting.
     Note: In production, this would require admin authentication.
+    
+    A near-duplicate of an existing posting is still created, with
+    duplicate_of_id set, and left out of listings. So is a posting with
+    the same organization, title and location as an existing one: it is
+    marked key_duplicate, so imports keep updating the original. Two
+    identical postings created at the same moment can still conflict on
+    the natural key (409); retrying creates the second as a duplicate.
     """
     posting = FairWorkPosting(**posting_in.model_dump())
+    if posting.latitude is None or posting.longitude is None:
+        posting.latitude, posting.longitude = coordinates(posting.location)
+    key_owner = db.exec(
+        select(FairWorkPosting.id).where(
+            func.lower(FairWorkPosting.organization) == posting.organization.lower(),
+            func.lower(FairWorkPosting.title) == posting.title.lower(),
+            func.lower(FairWorkPosting.location) == posting.location.lower(),
+            ~FairWorkPosting.key_duplicate
+        )
+    ).first()
+    if key_owner is not None:
+        posting.key_duplicate = True
+        posting.duplicate_of_id = key_owner
     db.add(posting)
+    db.flush()
+    
+    # Flag it if it nearly duplicates an existing posting (hidden from listings)
+    if key_owner is None:
+        flag_duplicates(db, [(posting.id, posting_in.model_dump())])
+    refresh_posting_matches(db, [posting.id])
     db.commit()
     db.refresh(posting)
+    invalidate(model_tag(FairWorkPosting))
     return posting
+
+
+@router.post("/import", response_model=PostingImportReport)
+def import_fair_work_postings(
+    *,
+    db: Session = Depends(get_session),
+    file: UploadFile = File(...),
+    format: Optional[PostingImportFormat] = None,
+    current_user: User = Depends(get_current_user),
+) -> PostingImportReport:
+    """
+    Bulk import fair work postings from an NDJSON or CSV file.
+    Requires authentication.
+    
+    The format is taken from format, or else the file extension (.csv,
+    .ndjson, .jsonl). Rows are validated and upserted in chunks while the
+    upload is read, keyed on organization, title and location, so
+    re-importing a partner's list only writes what changed. Bad rows are
+    reported by line number and do not stop the import.
+    """
+    fmt = format or detect_format(file.filename)
+    if fmt is None:
+        raise HTTPException(
+            status_code=400,
+            detail="Unknown file format; pass format=ndjson or format=csv"
+        )
+    
+    # Checked up front: chunks are committed as they are read
+    if not is_utf8(file.file):
+        raise HTTPException(status_code=400, detail="File must be UTF-8 encoded")
+    
+    lines = codecs.iterdecode(file.file, "utf-8-sig")
+    return import_postings(db, read_records(lines, fmt))
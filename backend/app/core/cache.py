@@ -0,0 +1,337 @@
+"""Application cache with tag-based invalidation."""
+
+import asyncio
+import functools
+import json
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Optional, Set, Tuple
+from fastapi.encoders import jsonable_encoder
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Longest an entry may live, whatever TTL it was stored with; Redis tag
+# sets are kept this long so they always outlive the entries they list
+MAX_TTL = 24 * 60 * 60
+
+
+def model_key(model, *parts: Any) -> str:
+    """Typed cache key for a model ("events:42:include=reactions")."""
+    return ":".join([model.__tablename__, *(str(part) for part in parts)])
+
+
+def model_tag(model, id: Optional[int] = None) -> str:
+    """
+    Invalidation tag for one row ("events:42"), or, without an id, for
+    cached lists of the model ("events").
+    """
+    return model.__tablename__ if id is None else f"{model.__tablename__}:{id}"
+
+
+class Cache(ABC):
+    """
+    Cache backend interface.
+
+    Values must be JSON-compatible (see cached()), so every backend returns
+    the same thing. Each entry can carry tags; invalidating a tag drops
+    every entry stored with it.
+    """
+
+    def __init__(self, default_ttl: int):
+        self.default_ttl = default_ttl
+        self._counters = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+        self._counter_lock = threading.Lock()
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._counter_lock:
+            self._counters[name] += amount
+
+    def _ttl(self, ttl: Optional[int]) -> int:
+        return min(ttl or self.default_ttl, MAX_TTL)
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """Cached value, or None on a miss."""
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: Optional[int] = None, tags: Iterable[str] = ()) -> None:
+        """Store a value for ttl seconds (default_ttl if not given)."""
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Cached values of those keys that hit."""
+        values = {}
+        for key in keys:
+            value = self.get(key)
+            if value is not None:
+                values[key] = value
+        return values
+
+    def set_many(self, items: Dict[str, Tuple[Any, Iterable[str]]], ttl: Optional[int] = None) -> None:
+        """Store several {key: (value, tags)} entries."""
+        for key, (value, tags) in items.items():
+            self.set(key, value, ttl=ttl, tags=tags)
+
+    @abstractmethod
+    def invalidate(self, *tags: str) -> None:
+        """Drop every entry stored with any of the tags."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Drop everything."""
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit, miss, eviction and invalidation counters since start-up."""
+        with self._counter_lock:
+            counters = dict(self._counters)
+        lookups = counters["hits"] + counters["misses"]
+        counters["hit_ratio"] = counters["hits"] / lookups if lookups else 0.0
+        counters["backend"] = type(self).__name__
+        return counters
+
+
+class NullCache(Cache):
+    """Caching disabled: every lookup misses."""
+
+    def get(self, key: str) -> Optional[Any]:
+        self._count("misses")
+        return None
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None, tags: Iterable[str] = ()) -> None:
+        pass
+
+    def invalidate(self, *tags: str) -> None:
+        pass
+
+    def clear(self) -> None:
+        pass
+
+
+class MemoryCache(Cache):
+    """
+    In-process LRU cache with per-entry TTL.
+
+    Entries are dropped least recently used first once max_entries is
+    reached (counted as evictions), and lazily when read after expiring.
+    Each worker process has its own copy, so invalidations only reach the
+    process that made them; use RedisCache with several workers.
+    """
+
+    def __init__(self, max_entries: int, default_ttl: int):
+        super().__init__(default_ttl)
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Any, FrozenSet[str]]]" = OrderedDict()
+        self._tags: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+
+    def _remove(self, key: str) -> None:
+        _, _, tags = self._entries.pop(key)
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self._counters["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._counters["hits"] += 1
+            return entry[1]
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None, tags: Iterable[str] = ()) -> None:
+        tags = frozenset(tags)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + self._ttl(ttl), value, tags)
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+                self._counters["evictions"] += 1
+
+    def invalidate(self, *tags: str) -> None:
+        with self._lock:
+            for tag in tags:
+                for key in list(self._tags.get(tag, ())):
+                    self._remove(key)
+                    self._counters["invalidations"] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._tags.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        stats = super().stats()
+        stats["entries"] = len(self._entries)
+        return stats
+
+
+class RedisCache(Cache):
+    """
+    Cache in Redis, or any server speaking its protocol, shared by all workers.
+
+    Values are stored as JSON under "<prefix><key>" with an expiry; each
+    tag is a set of the keys stored with it. Redis errors are logged and
+    treated as misses, so an unavailable cache server slows requests down
+    but never fails them.
+    """
+
+    def __init__(self, url: str, default_ttl: int, prefix: str = "riseup:cache:"):
+        super().__init__(default_ttl)
+        import redis
+
+        self._redis = redis
+        self._client = redis.Redis.from_url(url, socket_timeout=0.5, socket_connect_timeout=0.5)
+        self.prefix = prefix
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self.prefix}tag:{tag}"
+
+    def get(self, key: str) -> Optional[Any]:
+        try:
+            raw = self._client.get(self.prefix + key)
+        except self._redis.RedisError as e:
+            logger.warning(f"Cache get failed: {e}")
+            raw = None
+        if raw is None:
+            self._count("misses")
+            return None
+        self._count("hits")
+        return json.loads(raw)
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None, tags: Iterable[str] = ()) -> None:
+        self.set_many({key: (value, tags)}, ttl=ttl)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        keys = list(keys)
+        if not keys:
+            return {}
+        try:
+            raws = self._client.mget([self.prefix + key for key in keys])
+        except self._redis.RedisError as e:
+            logger.warning(f"Cache get failed: {e}")
+            raws = [None] * len(keys)
+        values = {key: json.loads(raw) for key, raw in zip(keys, raws) if raw is not None}
+        self._count("hits", len(values))
+        self._count("misses", len(keys) - len(values))
+        return values
+
+    def set_many(self, items: Dict[str, Tuple[Any, Iterable[str]]], ttl: Optional[int] = None) -> None:
+        # One round trip for all entries and their tag sets
+        try:
+            pipe = self._client.pipeline(transaction=False)
+            for key, (value, tags) in items.items():
+                pipe.set(self.prefix + key, json.dumps(value, separators=(",", ":")), ex=self._ttl(ttl))
+                for tag in tags:
+                    pipe.sadd(self._tag_key(tag), self.prefix + key)
+                    pipe.expire(self._tag_key(tag), MAX_TTL)
+            pipe.execute()
+        except self._redis.RedisError as e:
+            logger.warning(f"Cache set failed: {e}")
+
+    def invalidate(self, *tags: str) -> None:
+        try:
+            for tag in tags:
+                keys = self._client.smembers(self._tag_key(tag))
+                self._client.delete(self._tag_key(tag), *keys)
+                self._count("invalidations", len(keys))
+        except self._redis.RedisError as e:
+            logger.error(f"Cache invalidation failed for {tags}: {e}")
+
+    def clear(self) -> None:
+        try:
+            for key in self._client.scan_iter(match=f"{self.prefix}*", count=1000):
+                self._client.delete(key)
+        except self._redis.RedisError as e:
+            logger.error(f"Cache clear failed: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        stats = super().stats()
+        try:
+            # Evictions are the server's (maxmemory policy), across all clients
+            stats["evictions"] = self._client.info("stats").get("evicted_keys", 0)
+        except self._redis.RedisError:
+            pass
+        return stats
+
+
+@lru_cache(maxsize=1)
+def get_cache() -> Cache:
+    """The configured cache backend (CACHE_BACKEND: memory, redis or none)."""
+    if settings.CACHE_BACKEND == "redis":
+        return RedisCache(settings.CACHE_URL, settings.CACHE_DEFAULT_TTL)
+    if settings.CACHE_BACKEND == "memory":
+        return MemoryCache(settings.CACHE_MAX_ENTRIES, settings.CACHE_DEFAULT_TTL)
+    return NullCache(settings.CACHE_DEFAULT_TTL)
+
+
+def invalidate(*tags: str) -> None:
+    """Drop cached entries carrying any of the tags. Call after the write is committed."""
+    if tags:
+        get_cache().invalidate(*tags)
+
+
+def cached(
+    key: Callable[..., Optional[str]],
+    tags: Callable[[Any], Iterable[str]] = lambda value: (),
+    ttl: Optional[int] = None
+):
+    """
+    Cache an endpoint's response.
+
+    The result is stored in its JSON-compatible form (jsonable_encoder), so
+    a hit returns plain dicts and lists for FastAPI to validate against
+    the response model as usual. Errors are not cached.
+
+    Args:
+        key: Called with the endpoint's keyword arguments; returns the cache
+            key (see model_key), or None to bypass the cache for this call
+            (e.g. when the response depends on the current user)
+        tags: Called with the encoded result; returns its invalidation tags
+            (see model_tag)
+        ttl: Seconds to keep the entry (CACHE_DEFAULT_TTL if not given)
+    """
+    def decorator(func):
+        def lookup(kwargs) -> Tuple[Optional[str], Optional[Any]]:
+            cache_key = key(**kwargs)
+            return cache_key, (get_cache().get(cache_key) if cache_key is not None else None)
+
+        def store(cache_key: Optional[str], result: Any) -> Any:
+            if cache_key is None:
+                return result
+            value = jsonable_encoder(result)
+            get_cache().set(cache_key, value, ttl=ttl, tags=tags(value))
+            return value
+
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(**kwargs):
+                cache_key, value = lookup(kwargs)
+                if value is not None:
+                    return value
+                return store(cache_key, await func(**kwargs))
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(**kwargs):
+            cache_key, value = lookup(kwargs)
+            if value is not None:
+                return value
+            return store(cache_key, func(**kwargs))
+        return wrapper
+
+    return decorator
@@ -0,0 +1,239 @@
+"""Response compression (zstd, brotli, gzip) negotiated from Accept-Encoding."""
+
+import logging
+import zlib
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+from starlette.datastructures import Headers, MutableHeaders
+from app.core.config import settings
+from app.core.negotiation import MSGPACK_MEDIA_TYPE, quality_values
+
+logger = logging.getLogger(__name__)
+
+# Compresses a chunk; final=True ends the stream, otherwise output is
+# flushed so the client can decode everything sent so far
+Compressor = Callable[[bytes, bool], bytes]
+
+# Content types worth compressing (prefix match)
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "application/geo+json",
+    "application/javascript",
+    MSGPACK_MEDIA_TYPE,
+    "application/xml",
+    "image/svg+xml",
+    "text/",
+)
+
+
+def _gzip(level: int) -> Compressor:
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)  # 31: gzip container
+
+    def compress(data: bytes, final: bool) -> bytes:
+        return compressor.compress(data) + compressor.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+    return compress
+
+
+def _brotli(level: int) -> Compressor:
+    import brotli
+
+    compressor = brotli.Compressor(quality=level)
+
+    def compress(data: bytes, final: bool) -> bytes:
+        return compressor.process(data) + (compressor.finish() if final else compressor.flush())
+    return compress
+
+
+def _zstd(level: int) -> Compressor:
+    import zstandard
+
+    compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(data: bytes, final: bool) -> bytes:
+        mode = zstandard.COMPRESSOBJ_FLUSH_FINISH if final else zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        return compressor.compress(data) + compressor.flush(mode)
+    return compress
+
+
+# Content-Encoding name -> compressor factory taking a level
+ENCODERS: Dict[str, Callable[[int], Compressor]] = {"zstd": _zstd, "br": _brotli, "gzip": _gzip}
+
+
+def parse_encodings(spec: str) -> List[Tuple[str, int]]:
+    """
+    Parse a COMPRESSION setting ("zstd:3,br:4,gzip:6") into (encoding, level)
+    pairs, in order of preference.
+
+    Encodings whose library is not installed (brotli, zstandard) are
+    skipped with a warning, so a missing optional package only narrows
+    the choice.
+    """
+    encodings = []
+    for part in spec.split(","):
+        if not part.strip():
+            continue
+        name, _, level = part.strip().partition(":")
+        if name not in ENCODERS:
+            raise ValueError(f"Unknown compression encoding: {name}")
+        try:
+            ENCODERS[name](int(level))(b"", True)
+        except ImportError:
+            logger.warning(f"Compression encoding {name} disabled: its library is not installed")
+            continue
+        encodings.append((name, int(level)))
+    return encodings
+
+
+def negotiate(accept_encoding: str, encodings: List[Tuple[str, int]]) -> Optional[Tuple[str, int]]:
+    """
+    Pick the encoding for a request's Accept-Encoding.
+
+    The client's q-values rank first and our order breaks ties (browsers
+    send every encoding at q=1); q=0 and unlisted encodings are refused
+    unless "*" allows them. None means send the body as is.
+    """
+    weights = quality_values(accept_encoding)
+    ranked = [
+        (-weights.get(name, weights.get("*", 0.0)), index, (name, level))
+        for index, (name, level) in enumerate(encodings)
+    ]
+    ranked = [item for item in ranked if item[0] < 0]
+    return min(ranked)[2] if ranked else None
+
+
+class CompressedBodies:
+    """
+    LRU of compressed response bodies, keyed by encoding, URL, content type and ETag.
+
+    A response whose ETag has been seen before is the same bytes, so it is
+    not compressed again; bodies are kept up to max_bytes in total.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._bodies: "OrderedDict[tuple, bytes]" = OrderedDict()
+        self.counters = {"hits": 0, "misses": 0, "bytes_in": 0, "bytes_out": 0}
+
+    def get(self, key: tuple) -> Optional[bytes]:
+        body = self._bodies.get(key)
+        if body is None:
+            self.counters["misses"] += 1
+            return None
+        self._bodies.move_to_end(key)
+        self.counters["hits"] += 1
+        return body
+
+    def set(self, key: tuple, body: bytes) -> None:
+        if len(body) > self.max_bytes:
+            return
+        if key in self._bodies:
+            self.size -= len(self._bodies.pop(key))
+        self._bodies[key] = body
+        self.size += len(body)
+        while self.size > self.max_bytes:
+            _, evicted = self._bodies.popitem(last=False)
+            self.size -= len(evicted)
+
+
+_bodies = CompressedBodies(settings.COMPRESSION_CACHE_BYTES)
+
+
+def stats() -> Dict[str, int]:
+    """Compressed-body cache hits and misses, and bytes before and after compression."""
+    return {**_bodies.counters, "cached_bytes": _bodies.size}
+
+
+def _compressible(status: int, headers: MutableHeaders) -> bool:
+    if status < 200 or status in (204, 304) or "content-encoding" in headers:
+        return False
+    if "no-transform" in headers.get("cache-control", ""):
+        return False
+    return headers.get("content-type", "").startswith(COMPRESSIBLE_TYPES)
+
+
+class CompressionMiddleware:
+    """
+    Compress responses with the best encoding the client accepts.
+
+    Bodies under minimum_size go out as they are. A response sent in one
+    piece is compressed in one go, and if it has an ETag, the compressed
+    bytes are kept (see CompressedBodies) so an unchanged response is
+    not compressed twice. Streaming responses are compressed chunk by
+    chunk, flushing after each, so clients still see rows as they come.
+    Strong ETags become weak, since the bytes now differ per encoding.
+    """
+
+    def __init__(self, app, encodings: Optional[List[Tuple[str, int]]] = None, minimum_size: Optional[int] = None):
+        self.app = app
+        self.encodings = parse_encodings(settings.COMPRESSION) if encodings is None else encodings
+        self.minimum_size = settings.COMPRESSION_MIN_SIZE if minimum_size is None else minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.encodings:
+            return await self.app(scope, receive, send)
+        chosen = negotiate(Headers(scope=scope).get("accept-encoding", ""), self.encodings)
+        if chosen is None:
+            return await self.app(scope, receive, send)
+        encoding, level = chosen
+
+        start: Optional[dict] = None
+        compress: Optional[Compressor] = None
+        passthrough = False
+
+        def encode_headers(headers: MutableHeaders) -> None:
+            headers["content-encoding"] = encoding
+            headers.add_vary_header("Accept-Encoding")
+            etag = headers.get("etag")
+            if etag and not etag.startswith("W/"):
+                headers["etag"] = f"W/{etag}"
+
+        async def send_compressed(message):
+            nonlocal start, compress, passthrough
+            if message["type"] == "http.response.start":
+                start = message  # held until the first body chunk shows the size
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                return await send(message)
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if compress is not None:
+                data = compress(body, not more_body)
+                _bodies.counters["bytes_in"] += len(body)
+                _bodies.counters["bytes_out"] += len(data)
+                return await send({"type": "http.response.body", "body": data, "more_body": more_body})
+
+            # Rewritten on a copy: the start message may be shared (see single_flight)
+            headers = MutableHeaders(raw=list(start["headers"]))
+            size = int(headers.get("content-length", -1)) if more_body else len(body)
+            if not _compressible(start["status"], headers) or 0 <= size < self.minimum_size:
+                passthrough = True
+                await send(start)
+                return await send(message)
+
+            encode_headers(headers)
+            if more_body:
+                # Streaming: length unknown, compress as chunks arrive
+                del headers["content-length"]
+                compress = ENCODERS[encoding](level)
+                await send({**start, "headers": headers.raw})
+                return await send_compressed(message)
+
+            etag = headers.get("etag")
+            key = None
+            if etag:
+                key = (encoding, level, scope["path"], scope.get("query_string", b""), headers["content-type"], etag)
+            data = _bodies.get(key) if key else None
+            if data is None:
+                data = ENCODERS[encoding](level)(body, True)
+                if key:
+                    _bodies.set(key, data)
+            _bodies.counters["bytes_in"] += len(body)
+            _bodies.counters["bytes_out"] += len(data)
+            headers["content-length"] = str(len(data))
+            await send({**start, "headers": headers.raw})
+            await send({"type": "http.response.body", "body": data})
+
+        await self.app(scope, receive, send_compressed)
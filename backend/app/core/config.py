@@ -1,6 +1,6 @@
 """Application configuration settings."""
 
-from typing import List
+from typing import List, Set
 from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -20,6 +20,37 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_DAYS: int = 7
     
+    # Geocoding: directory of GeoNames files (default: bundled sample) and
+    # where to keep the compiled index (default: temp directory)
+    GAZETTEER_PATH: str = ""
+    GAZETTEER_INDEX: str = ""
+    
+    # Cache: "memory" (per process), "redis" (shared, at CACHE_URL) or "none"
+    CACHE_BACKEND: str = "memory"
+    CACHE_URL: str = "redis://localhost:6379/0"
+    CACHE_MAX_ENTRIES: int = 10_000
+    CACHE_DEFAULT_TTL: int = 30
+    
+    # Analytics snapshots (Parquet) for organizer reports, and the database
+    # they are read from (a read replica; default: DATABASE_URL)
+    ANALYTICS_PATH: str = "analytics"
+    ANALYTICS_DATABASE_URL: str = ""
+    
+    # Days a /sync watermark stays valid; scripts/prune_change_log.py
+    # deletes change log entries no younger watermark needs
+    CHANGE_LOG_RETENTION_DAYS: int = 30
+    
+    # Response compression: encodings in order of preference with their
+    # level ("" disables), smallest body worth compressing, and memory for
+    # compressed bodies of responses with an ETag
+    COMPRESSION: str = "zstd:3,br:4,gzip:6"
+    COMPRESSION_MIN_SIZE: int = 1024
+    COMPRESSION_CACHE_BYTES: int = 32 * 1024 * 1024
+    
+    # Emails (comma-separated) of accounts allowed to read operational
+    # endpoints such as /stats; empty allows nobody
+    OPERATOR_EMAILS: str = ""
+    
     # CORS
     BACKEND_CORS_ORIGINS: str = ""
     
@@ -40,6 +71,10 @@ class Settings(BaseSettings):
         if not self.BACKEND_CORS_ORIGINS:
             return []
         return [origin.strip() for origin in self.BACKEND_CORS_ORIGINS.split(",")]
+    
+    def get_operator_emails(self) -> Set[str]:
+        """Parse and return operator emails, lowercased."""
+        return {email.strip().lower() for email in self.OPERATOR_EMAILS.split(",") if email.strip()}
 
 
 settings = Settings()
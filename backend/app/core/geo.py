@@ -0,0 +1,59 @@
+"""Geographic helpers for proximity filters."""
+
+import math
+from typing import Tuple
+
+# Mean kilometres per degree of latitude
+KM_PER_DEGREE = 111.32
+
+# Mean Earth radius in kilometres
+EARTH_RADIUS_KM = 6371.0
+
+
+def bounding_box(
+    latitude: float,
+    longitude: float,
+    radius_km: float
+) -> Tuple[float, float, float, float]:
+    """
+    Compute a lat/lng box that encloses a circle around a point.
+
+    The box is a cheap, index-friendly pre-filter: plain range predicates on
+    latitude/longitude columns instead of a distance expression per row.
+
+    Args:
+        latitude: Centre latitude
+        longitude: Centre longitude
+        radius_km: Radius in kilometres
+
+    Returns:
+        Tuple of (min_latitude, max_latitude, min_longitude, max_longitude)
+    """
+    lat_delta = radius_km / KM_PER_DEGREE
+    min_lat = max(latitude - lat_delta, -90.0)
+    max_lat = min(latitude + lat_delta, 90.0)
+
+    # A circle reaching a pole spans every longitude
+    if min_lat == -90.0 or max_lat == 90.0:
+        return min_lat, max_lat, -180.0, 180.0
+
+    # Longitude degrees shrink towards the poles; the widest point of the
+    # circle is on the parallel nearest the pole, so size the box there
+    cos_lat = math.cos(math.radians(max(abs(min_lat), abs(max_lat))))
+    lng_delta = min(radius_km / (KM_PER_DEGREE * cos_lat), 180.0)
+
+    return (
+        min_lat,
+        max_lat,
+        longitude - lng_delta,
+        longitude + lng_delta,
+    )
+
+
+def distance_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """Great-circle (haversine) distance between two points in kilometres."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lng2 - lng1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
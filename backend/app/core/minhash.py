@@ -0,0 +1,78 @@
+"""MinHash signatures and LSH banding for near-duplicate text detection."""
+
+import hashlib
+import random
+import re
+from typing import Iterable, List, Set
+
+# Signature length and banding: BANDS bands of ROWS values each. Two texts
+# with Jaccard similarity s share at least one band with probability
+# 1 - (1 - s**ROWS)**BANDS: ~0.99 at s = 0.7, ~0.04 at s = 0.3
+NUM_PERM = 64
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+
+# Words per shingle
+SHINGLE_SIZE = 2
+
+_PRIME = (1 << 61) - 1
+_rng = random.Random(20240601)
+_PERMUTATIONS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM)]
+_WORD = re.compile(r"\w+")
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> Set[str]:
+    """Lower-cased overlapping word n-grams of text (the whole text if shorter)."""
+    words = _WORD.findall(text.lower())
+    if len(words) <= size:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+def _hash64(data: bytes) -> int:
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "big")
+
+
+def signature(features: Iterable[str]) -> List[int]:
+    """
+    Compute the MinHash signature of a feature set.
+
+    Args:
+        features: Text features, e.g. shingles
+
+    Returns:
+        NUM_PERM minimum hash values (empty if there are no features)
+    """
+    hashes = [_hash64(feature.encode("utf-8")) for feature in set(features)]
+    if not hashes:
+        return []
+    return [min((a * h + b) % _PRIME for h in hashes) for a, b in _PERMUTATIONS]
+
+
+def band_hashes(sig: List[int], key: str = "") -> List[int]:
+    """
+    Hash each band of a signature to one value.
+
+    Args:
+        sig: Signature from signature()
+        key: Blocking key mixed into every band, so only texts with the
+            same key can share a band
+
+    Returns:
+        BANDS values as signed 64-bit integers (fit a Postgres BIGINT),
+        empty for an empty signature
+    """
+    prefix = key.encode("utf-8") + b"\x00"
+    result = []
+    for band in range(BANDS if sig else 0):
+        rows = sig[band * ROWS:(band + 1) * ROWS]
+        value = _hash64(prefix + b"".join(row.to_bytes(8, "big") for row in rows))
+        result.append(value - (1 << 64) if value >= 1 << 63 else value)
+    return result
+
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    """Jaccard similarity of two feature sets (0 when either is empty)."""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
@@ -0,0 +1,54 @@
+"""Content negotiation: Accept header parsing and the MessagePack preference."""
+
+import logging
+from functools import lru_cache
+from typing import Dict
+from starlette.datastructures import Headers
+
+logger = logging.getLogger(__name__)
+
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+# Media types clients use to ask for MessagePack
+MSGPACK_TYPES = (MSGPACK_MEDIA_TYPE, "application/x-msgpack", "application/vnd.msgpack")
+
+
+def quality_values(header: str) -> Dict[str, float]:
+    """Parse an Accept or Accept-Encoding header into {value: q}, lower-cased."""
+    weights = {}
+    for part in header.lower().split(","):
+        value, *params = [piece.strip() for piece in part.split(";")]
+        weight = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    weight = float(param[2:])
+                except ValueError:
+                    weight = 0.0
+        if value:
+            weights[value] = weight
+    return weights
+
+
+def wants_msgpack(accept: str) -> bool:
+    """Whether the client ranks MessagePack at least as high as JSON."""
+    weights = quality_values(accept)
+    msgpack_q = max(weights.get(media_type, 0.0) for media_type in MSGPACK_TYPES)
+    json_q = weights.get("application/json", weights.get("application/*", weights.get("*/*", 0.0)))
+    return msgpack_q > 0 and msgpack_q >= json_q
+
+
+@lru_cache(maxsize=1)
+def msgpack_enabled() -> bool:
+    """Whether the msgpack package is installed; without it every response stays JSON."""
+    try:
+        import msgpack  # noqa: F401
+    except ImportError:
+        logger.warning("MessagePack responses disabled: msgpack is not installed")
+        return False
+    return True
+
+
+def prefers_msgpack(headers: Headers) -> bool:
+    """Whether a request with these headers is answered with MessagePack (on routes with a response model)."""
+    return wants_msgpack(headers.get("accept", "")) and msgpack_enabled()
@@ -0,0 +1,56 @@
+"""Keyset pagination helpers for RiseUp Collective API."""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Tuple
+from app.core.exceptions import ValidationException
+
+
+def encode_cursor(*values: Any) -> str:
+    """
+    Encode the sort key of the last row on a page as an opaque cursor.
+
+    Args:
+        values: Sort key values, in the same order as the ORDER BY clause
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = [v.isoformat() if isinstance(v, datetime) else v for v in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, *types: type) -> Tuple[Any, ...]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string from a previous page
+        types: Expected type of each sort key value (datetime, int, float, str)
+
+    Returns:
+        Tuple of sort key values converted to the expected types
+
+    Raises:
+        ValidationException: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(values, list) or len(values) != len(types):
+            raise ValueError("cursor has the wrong number of values")
+        return tuple(_coerce(value, expected) for value, expected in zip(values, types))
+    except (ValueError, TypeError, binascii.Error):
+        raise ValidationException("Invalid pagination cursor", field="cursor")
+
+
+def _coerce(value: Any, expected: type) -> Any:
+    """Convert a decoded JSON value back to its sort key type."""
+    if value is None:
+        return None
+    if expected is datetime:
+        return datetime.fromisoformat(value)
+    return expected(value)
@@ -0,0 +1,30 @@
+"""Load and build only the columns a response schema shows."""
+
+from typing import Any, Type
+from pydantic import BaseModel
+from sqlalchemy.orm import load_only
+
+
+def schema_columns(model, schema: Type[BaseModel]) -> list:
+    """The model's columns that schema has a field for."""
+    columns = model.__table__.columns
+    return [getattr(model, name) for name in schema.model_fields if name in columns]
+
+
+def load_schema_columns(model, schema: Type[BaseModel]):
+    """
+    Loader option selecting only schema's columns of model.
+
+    The rest are deferred: left out of the SELECT, and only fetched (one
+    query per row) if read, so build responses with from_row.
+    """
+    return load_only(*schema_columns(model, schema))
+
+
+def from_row(schema: Type[BaseModel], row, **values: Any) -> BaseModel:
+    """Build schema from an ORM row, reading only the attributes schema has fields for."""
+    columns = row.__table__.columns
+    for name in schema.model_fields:
+        if name in columns and name not in values:
+            values[name] = getattr(row, name)
+    return schema(**values)
@@ -0,0 +1,162 @@
+"""Fast JSON and MessagePack responses for response schemas."""
+
+import logging
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Optional
+from fastapi import Response
+from pydantic import TypeAdapter, ValidationError
+from pydantic_core import to_jsonable_python
+from starlette.datastructures import Headers, MutableHeaders
+from app.core.negotiation import MSGPACK_MEDIA_TYPE, prefers_msgpack
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def adapter(schema: Any) -> TypeAdapter:
+    """TypeAdapter for a response schema (list[EventResponse], FeedItem, ...), built once per schema."""
+    return TypeAdapter(schema)
+
+
+def dump_json(schema: Any, content: Any) -> bytes:
+    """
+    Encode schema instances to JSON bytes without validating them again.
+
+    content must already be made of the schema's models (built by the
+    endpoint, so validated once); pydantic-core serializes them straight
+    to bytes, with the same output FastAPI's response_model path gives.
+    """
+    return adapter(schema).dump_json(content)
+
+
+def _msgpack_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        # Naive datetimes are UTC throughout the app
+        return value.replace(tzinfo=timezone.utc)
+    return to_jsonable_python(value)
+
+
+def dump_msgpack(schema: Any, content: Any) -> bytes:
+    """
+    Encode schema instances to MessagePack.
+
+    pydantic-core dumps content in python mode, so exactly the fields the
+    schema declares as datetimes come out as datetimes and are packed as
+    MessagePack timestamps (extension -1); strings stay strings, whatever
+    they contain. Other values JSON has no type for (enums, URLs) are
+    packed as they appear in the JSON document.
+    """
+    import msgpack
+
+    return msgpack.packb(adapter(schema).dump_python(content), datetime=True, default=_msgpack_default)
+
+
+class TrustedJSONResponse(Response):
+    """
+    JSON response for content the endpoint built from the response schema.
+
+    FastAPI validates a returned value against response_model again,
+    converts it to plain Python and only then encodes it; for a list of
+    models built one line earlier that is twice the work. Returning this
+    skips all three steps for one dump_json. Keep response_model on the
+    route for the OpenAPI schema.
+
+    Pass the endpoint's injected Response to carry headers and status set
+    by dependencies (ETag, Last-Modified), which FastAPI only merges into
+    responses it builds itself.
+
+    Requests preferring MessagePack get the same content through
+    dump_msgpack instead.
+    """
+
+    media_type = "application/json"
+
+    def __init__(self, content: Any, schema: Any, response: Optional[Response] = None, **kwargs):
+        if response is not None and response.status_code:
+            kwargs.setdefault("status_code", response.status_code)
+        self.content = content
+        self.schema = schema
+        super().__init__(dump_json(schema, content), **kwargs)
+        if response is not None:
+            self.headers.raw.extend(
+                (name, value) for name, value in response.headers.raw if name != b"content-length"
+            )
+
+    async def __call__(self, scope, receive, send):
+        if prefers_msgpack(Headers(scope=scope)):
+            self.body = dump_msgpack(self.schema, self.content)
+            self.headers["content-type"] = MSGPACK_MEDIA_TYPE
+            self.headers["content-length"] = str(len(self.body))
+        await super().__call__(scope, receive, send)
+
+
+def response_model(scope) -> Any:
+    """Response model of the route that handled a request (set once routing has run), or None."""
+    return getattr(scope.get("route"), "response_model", None)
+
+
+class MessagePackMiddleware:
+    """
+    Answer requests that prefer MessagePack (Accept: application/msgpack)
+    with the same document as MessagePack, on every route with a response
+    model, without per-endpoint code.
+
+    TrustedJSONResponse encodes its content itself. Other JSON bodies are
+    parsed back into the route's response model by pydantic-core and
+    dumped with dump_msgpack, so timestamps come from the schema, never
+    from what a string looks like. Error, streaming and non-JSON
+    responses stay JSON, as do bodies the model does not accept.
+
+    Every response of these routes carries Vary: Accept, JSON ones
+    included, so shared caches keep the formats apart; their ETags differ
+    as well (see check_validators).
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        msgpack = prefers_msgpack(Headers(scope=scope))
+
+        start = None
+        passthrough = False
+
+        async def send_negotiated(message):
+            nonlocal start, passthrough
+            if message["type"] == "http.response.start":
+                model = response_model(scope)
+                if model is not None:
+                    # Rewritten on a copy: the start message may be shared (see single_flight)
+                    headers = MutableHeaders(raw=list(message["headers"]))
+                    headers.add_vary_header("Accept")
+                    message = {**message, "headers": headers.raw}
+                if model is None or not msgpack or not 200 <= message["status"] < 300:
+                    passthrough = True
+                    return await send(message)
+                start = message  # held until the body shows whether it is one JSON document
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                return await send(message)
+
+            headers = MutableHeaders(raw=start["headers"])
+            body = message.get("body", b"")
+            if message.get("more_body", False) or not body or not headers.get("content-type", "").startswith("application/json"):
+                passthrough = True
+                await send(start)
+                return await send(message)
+
+            model = response_model(scope)
+            try:
+                body = dump_msgpack(model, adapter(model).validate_json(body))
+            except (ValidationError, TypeError, ValueError) as e:
+                logger.warning(f"Could not re-encode {scope['path']} as MessagePack: {e}")
+            else:
+                headers["content-type"] = MSGPACK_MEDIA_TYPE
+                headers["content-length"] = str(len(body))
+            await send(start)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_negotiated)
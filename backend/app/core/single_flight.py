@@ -0,0 +1,161 @@
+"""Single-flight coalescing of concurrent identical GET requests."""
+
+import asyncio
+import hashlib
+import re
+from typing import Callable, Dict, List, Optional, Pattern, Tuple
+from urllib.parse import parse_qs
+
+# Longest a request waits for an identical in-flight one before running itself
+MAX_WAIT_SECONDS = 2.0
+
+# Responses larger than this are not shared (followers run their own request)
+MAX_SHARED_BODY = 4 * 1024 * 1024
+
+# Request headers that change the response, so they are part of the key
+VARY_HEADERS = (b"accept", b"accept-encoding", b"if-none-match", b"if-modified-since")
+
+# Scope keys set by routing that outer middleware reads (e.g. the response
+# model, see serialization); followers never reach the router, so they get the leader's
+ROUTING_SCOPE_KEYS = ("route", "endpoint", "path_params")
+
+Params = Dict[str, List[str]]
+
+_counters = {"leaders": 0, "coalesced": 0, "fallbacks": 0}
+
+
+def stats() -> Dict[str, int]:
+    """Requests that ran, that shared a leader's result, and that fell back to running themselves."""
+    return dict(_counters)
+
+
+def _never(params: Params) -> bool:
+    return False
+
+
+def _includes_viewer(params: Params) -> bool:
+    return any("viewer" in value for value in params.get("include", []))
+
+
+# (path pattern, whether the response depends on who is asking)
+COALESCED_ROUTES: List[Tuple[Pattern, Callable[[Params], bool]]] = [
+    (re.compile(r"^/api/v1/events/?$"), _never),
+    (re.compile(r"^/api/v1/events/map/?$"), _never),
+    (re.compile(r"^/api/v1/events/tags/?$"), _never),
+    (re.compile(r"^/api/v1/events/\d+/?$"), _includes_viewer),
+    (re.compile(r"^/api/v1/unionized/?$"), _never),
+    (re.compile(r"^/api/v1/unionized/page/?$"), _never),
+    (re.compile(r"^/api/v1/unionized/\d+/?$"), _never),
+]
+
+
+def _copy(message: dict) -> dict:
+    """
+    A copy of a response message that later changes to the original cannot reach.
+
+    Outer middleware (compression, MessagePack) rewrites header lists in
+    place, so recorded and replayed messages must not share them.
+    """
+    if message["type"] == "http.response.start":
+        return {**message, "headers": list(message.get("headers", []))}
+    return {**message, "body": bytes(message.get("body", b""))}
+
+
+class SingleFlightMiddleware:
+    """
+    Share one in-flight computation between concurrent identical GETs.
+
+    The first request for a key (route, query, varying headers and viewer
+    class) runs normally while its response is recorded; identical
+    requests arriving meanwhile wait for it, up to MAX_WAIT_SECONDS, and
+    get the same response replayed. A follower runs its own request as a
+    fallback when the wait times out, the leader fails, the response is
+    too large to hold, or its status should not be shared (5xx, 401, 403).
+    Messages are recorded as copies taken before the leader sends them
+    on, and each follower is sent copies of its own, with the leader's
+    route set on its scope for the middleware around this one.
+
+    The viewer class is "public" unless the route says the response
+    depends on the caller, in which case it is a hash of the
+    Authorization header (or "anonymous"), so personal data is only
+    shared between requests carrying the same token. Coalescing is per
+    process; it complements the response cache, which it protects from
+    stampedes right after an invalidation.
+    """
+
+    def __init__(self, app, routes=COALESCED_ROUTES, max_wait: float = MAX_WAIT_SECONDS):
+        self.app = app
+        self.routes = routes
+        self.max_wait = max_wait
+        self._flights: Dict[str, asyncio.Future] = {}
+
+    def _key(self, scope) -> Optional[str]:
+        path = scope["path"]
+        for pattern, per_viewer in self.routes:
+            if pattern.match(path):
+                break
+        else:
+            return None
+
+        query = scope.get("query_string", b"")
+        headers = dict(scope["headers"])
+        viewer = "public"
+        if per_viewer(parse_qs(query.decode("latin-1"))):
+            authorization = headers.get(b"authorization")
+            viewer = hashlib.sha256(authorization).hexdigest() if authorization else "anonymous"
+        varying = b"\n".join(headers.get(name, b"") for name in VARY_HEADERS)
+        return hashlib.sha256(b"\0".join([path.encode(), query, varying, viewer.encode()])).hexdigest()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "GET":
+            return await self.app(scope, receive, send)
+        key = self._key(scope)
+        if key is None:
+            return await self.app(scope, receive, send)
+
+        flight = self._flights.get(key)
+        if flight is not None:
+            try:
+                result = await asyncio.wait_for(asyncio.shield(flight), self.max_wait)
+            except asyncio.TimeoutError:
+                result = None
+            if result is None:
+                _counters["fallbacks"] += 1
+                return await self.app(scope, receive, send)
+            _counters["coalesced"] += 1
+            messages, routing = result
+            scope.update(routing)
+            for message in messages:
+                await send(_copy(message))
+            return
+
+        flight = asyncio.get_running_loop().create_future()
+        self._flights[key] = flight
+        _counters["leaders"] += 1
+        recorded: Optional[List[dict]] = []
+        size = 0
+
+        async def record(message):
+            nonlocal recorded, size
+            if recorded is not None:
+                if message["type"] == "http.response.start":
+                    status = message["status"]
+                    if status >= 500 or status in (401, 403):
+                        recorded = None
+                elif message["type"] == "http.response.body":
+                    size += len(message.get("body", b""))
+                    if size > MAX_SHARED_BODY:
+                        recorded = None
+                if recorded is not None:
+                    recorded.append(_copy(message))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, record)
+        except BaseException:
+            recorded = None
+            raise
+        finally:
+            del self._flights[key]
+            routing = {name: scope[name] for name in ROUTING_SCOPE_KEYS if name in scope}
+            flight.set_result(None if recorded is None else (recorded, routing))
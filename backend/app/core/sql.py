@@ -0,0 +1,6 @@
+"""SQL helpers shared by endpoints and services."""
+
+
+def escape_like(value: str) -> str:
+    """Escape LIKE wildcards (backslash is Postgres' default escape character)."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
@@ -1,14 +1,20 @@
 """FastAPI application entry point for RiseUp Collective."""
 
 import logging
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
 from pydantic import ValidationError
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from app.core.config import settings
 from app.api.v1.api import api_router
+from app.api.conditional import NotModified
+from app.core.compression import CompressionMiddleware
+from app.core.serialization import MessagePackMiddleware
+from app.core.single_flight import SingleFlightMiddleware
+from app.services.geocoder import ensure_index
 from app.core.exceptions import (
     RiseUpException,
     ValidationException,
@@ -27,11 +33,27 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Build the gazetteer index before serving, if it is missing or stale, so no request waits on it."""
+    ensure_index()
+    yield
+
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
-    openapi_url=f"{settings.API_V1_STR}/openapi.json"
+    openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
+# Middleware added last runs first: CORS, then compression, then
+# MessagePack re-encoding, then coalescing of concurrent identical hot GETs
+app.add_middleware(SingleFlightMiddleware)
+app.add_middleware(MessagePackMiddleware)
+app.add_middleware(CompressionMiddleware)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -62,6 +84,12 @@ async def riseup_exception_handler(request: Request, exc: RiseUpException):
     )
 
 
+@app.exception_handler(NotModified)
+async def not_modified_handler(request: Request, exc: NotModified):
+    """Answer a conditional GET whose validators still match (304, no body)."""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=exc.headers)
+
+
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handle FastAPI/Pydantic validation errors (400)."""
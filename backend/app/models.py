@@ -4,7 +4,21 @@ from datetime import datetime
 from typing import Optional, List
 from enum import Enum
 from sqlmodel import Field, SQLModel, Relationship, Column
-from sqlalchemy import JSON
+from sqlalchemy import BigInteger, Boolean, Computed, ForeignKey, Index, Integer, UniqueConstraint, false, text
+from sqlalchemy.dialects.postgresql import JSONB, NUMRANGE, TSVECTOR
+
+
+# Text search configuration used for search vectors and queries
+SEARCH_CONFIG = "english"
+
+# Text that fuzzy posting search (?q=) matches against; the trigram index is
+# built on exactly this expression so the planner can use it
+POSTING_SEARCH_TEXT = "title || ' ' || organization || ' ' || location"
+
+# Top and bottom of a posting's wage range (greatest/least skip NULLs, so a
+# single posted wage is both); wage sorting and filters use these expressions
+POSTING_WAGE_TOP = "greatest(wage_min, wage_max)"
+POSTING_WAGE_BOTTOM = "least(wage_min, wage_max)"
 
 
 # Enums
@@ -47,6 +61,10 @@ class UnionStatus(str, Enum):
 class User(SQLModel, table=True):
     """User account model."""
     __tablename__ = "users"
+    __table_args__ = (
+        # Case-insensitive email lookups (bulk check-in by email)
+        Index("ix_users_email_lower", text("lower(email)")),
+    )
     
     id: Optional[int] = Field(default=None, primary_key=True)
     email: str = Field(unique=True, index=True, max_length=255)
@@ -60,17 +78,35 @@ class User(SQLModel, table=True):
     reactions: List["Reaction"] = Relationship(back_populates="user")
 
 
+# Profile name as typeahead matches and orders it; C collation lets a plain
+# btree serve both LIKE 'prefix%' and ORDER BY
+PROFILE_NAME_KEY = 'lower(name) COLLATE "C"'
+
+
 class Profile(SQLModel, table=True):
     """User profile model (individual or group)."""
     __tablename__ = "profiles"
+    __table_args__ = (
+        # Name prefix typeahead, already in result order
+        Index("ix_profiles_name_prefix", text(PROFILE_NAME_KEY), "id"),
+        # Word-start matches inside names ("oak" in "East Oakland Tenants")
+        Index("ix_profiles_name_trgm", text("lower(name) gin_trgm_ops"), postgresql_using="gin"),
+        # Containment (causes @> '["Housing Justice"]') lookups for cause filters
+        Index("ix_profiles_causes", "causes", postgresql_using="gin", postgresql_ops={"causes": "jsonb_path_ops"}),
+        # Index-only version lookups for conditional GETs
+        Index("ix_profiles_id_updated_at", "id", "updated_at"),
+    )
     
     id: Optional[int] = Field(default=None, primary_key=True)
     user_id: int = Field(foreign_key="users.id", unique=True, index=True)
     name: str = Field(max_length=255)
     bio: Optional[str] = Field(default=None, max_length=1000)
     location: Optional[str] = Field(default=None, max_length=255)
+    # Geocoded from location (app.services.geocoder)
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
     avatar_url: Optional[str] = Field(default=None, max_length=500)
-    causes: List[str] = Field(default_factory=list, sa_column=Column(JSON))
+    causes: List[str] = Field(default_factory=list, sa_column=Column(JSONB))
     profile_type: ProfileType = Field(default=ProfileType.INDIVIDUAL)
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
@@ -84,6 +120,16 @@ class Profile(SQLModel, table=True):
 class Event(SQLModel, table=True):
     """Event model for local actions."""
     __tablename__ = "events"
+    __table_args__ = (
+        # Containment (tags @> '["Housing Justice"]') lookups for tag filters
+        Index("ix_events_tags", "tags", postgresql_using="gin", postgresql_ops={"tags": "jsonb_path_ops"}),
+        # Bounding-box lookups of events near a point
+        Index("ix_events_lat_lng", "latitude", "longitude"),
+        # Index-only version lookups for conditional GETs of one event
+        Index("ix_events_id_updated_at", "id", "updated_at"),
+        # Rows changed since a watermark (incremental analytics snapshots)
+        Index("ix_events_updated_at", "updated_at"),
+    )
     
     id: Optional[int] = Field(default=None, primary_key=True)
     creator_id: int = Field(foreign_key="profiles.id", index=True)
@@ -93,7 +139,7 @@ class Event(SQLModel, table=True):
     location: str = Field(max_length=500)
     latitude: Optional[float] = None
     longitude: Optional[float] = None
-    tags: List[str] = Field(default_factory=list, sa_column=Column(JSON))
+    tags: List[str] = Field(default_factory=list, sa_column=Column(JSONB))
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
     
@@ -102,9 +148,21 @@ class Event(SQLModel, table=True):
     attendances: List["Attendance"] = Relationship(back_populates="event")
 
 
+class EventTagCount(SQLModel, table=True):
+    """Per-tag event counts, maintained by a trigger on events."""
+    __tablename__ = "event_tag_counts"
+    
+    tag: str = Field(primary_key=True, max_length=255)
+    event_count: int = Field(default=0)
+
+
 class Post(SQLModel, table=True):
     """Post model for community updates."""
     __tablename__ = "posts"
+    __table_args__ = (
+        # Index-only version lookups for conditional GETs
+        Index("ix_posts_id_updated_at", "id", "updated_at"),
+    )
     
     id: Optional[int] = Field(default=None, primary_key=True)
     creator_id: int = Field(foreign_key="profiles.id", index=True)
@@ -120,6 +178,10 @@ class Post(SQLModel, table=True):
 class Attendance(SQLModel, table=True):
     """Attendance model for event participation."""
     __tablename__ = "attendances"
+    __table_args__ = (
+        # One attendance per user per event; also the ON CONFLICT target for bulk check-in
+        UniqueConstraint("user_id", "event_id", name="uq_attendances_user_event"),
+    )
     
     id: Optional[int] = Field(default=None, primary_key=True)
     user_id: int = Field(foreign_key="users.id", index=True)
@@ -129,17 +191,15 @@ class Attendance(SQLModel, table=True):
     # Relationships
     user: Optional[User] = Relationship(back_populates="attendances")
     event: Optional[Event] = Relationship(back_populates="attendances")
-    
-    class Config:
-        # Unique constraint on user_id and event_id combination
-        schema_extra = {
-            "unique_together": [["user_id", "event_id"]]
-        }
 
 
 class Reaction(SQLModel, table=True):
     """Reaction model for solidarity gestures on events and posts."""
     __tablename__ = "reactions"
+    __table_args__ = (
+        # Per-target lookups: reaction counts and the viewer's reaction
+        Index("ix_reactions_target", "target_type", "target_id", "reaction_type"),
+    )
     
     id: Optional[int] = Field(default=None, primary_key=True)
     user_id: int = Field(foreign_key="users.id", index=True)
@@ -162,11 +222,51 @@ class Reaction(SQLModel, table=True):
 class FairWorkPosting(SQLModel, table=True):
     """Fair work posting model for Unionized section."""
     __tablename__ = "fair_work_postings"
+    __table_args__ = (
+        # Newest-first listing, alone and under the type/status filters
+        Index("ix_fair_work_postings_posted", text("posted_date DESC"), text("id DESC")),
+        Index("ix_fair_work_postings_status_posted", "union_status", text("posted_date DESC"), text("id DESC")),
+        Index(
+            "ix_fair_work_postings_type_status_posted",
+            "employment_type", "union_status", text("posted_date DESC"), text("id DESC")
+        ),
+        # Natural key for bulk imports: one posting per organization, title and
+        # location owns it; later copies are marked key_duplicate and left out
+        Index(
+            "uq_fair_work_postings_natural_key",
+            text("lower(organization)"), text("lower(title)"), text("lower(location)"),
+            unique=True,
+            postgresql_where=text("NOT key_duplicate")
+        ),
+        # Wage sorting and "pays at least" filters, by the top of the posted range
+        Index("ix_fair_work_postings_wage_top", text(f"({POSTING_WAGE_TOP}) DESC"), text("id DESC")),
+        Index(
+            "ix_fair_work_postings_status_wage_top",
+            "union_status", text(f"({POSTING_WAGE_TOP}) DESC"), text("id DESC")
+        ),
+        # Bounding-box lookups of postings near a point
+        Index("ix_fair_work_postings_lat_lng", "latitude", "longitude"),
+        # Index-only version lookups for conditional GETs
+        Index("ix_fair_work_postings_id_updated_at", "id", "updated_at"),
+        # Trigram indexes (pg_trgm) for fuzzy ?q= matching and substring location filters
+        Index(
+            "ix_fair_work_postings_search_trgm",
+            text(f"({POSTING_SEARCH_TEXT}) gin_trgm_ops"),
+            postgresql_using="gin"
+        ),
+        Index(
+            "ix_fair_work_postings_location_trgm", "location",
+            postgresql_using="gin",
+            postgresql_ops={"location": "gin_trgm_ops"}
+        ),
+    )
     
     id: Optional[int] = Field(default=None, primary_key=True)
     title: str = Field(max_length=255)
     organization: str = Field(max_length=255)
     location: str = Field(max_length=255)
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
     wage_min: Optional[float] = None
     wage_max: Optional[float] = None
     wage_text: str = Field(max_length=255)  # Required wage transparency
@@ -175,6 +275,151 @@ class FairWorkPosting(SQLModel, table=True):
     description: str = Field(max_length=2000)
     worker_notes: Optional[str] = Field(default=None, max_length=1000)
     application_url: Optional[str] = Field(default=None, max_length=500)
+    # Set when this posting nearly duplicates an older one; hidden from listings
+    duplicate_of_id: Optional[int] = Field(
+        default=None,
+        sa_column=Column(Integer, ForeignKey("fair_work_postings.id", ondelete="SET NULL"))
+    )
+    # Set when an older posting has the same organization, title and location
+    # (which owns the natural key); such postings are also flagged duplicate_of_id
+    key_duplicate: bool = Field(default=False, sa_column=Column(Boolean, nullable=False, server_default=false()))
     posted_date: datetime = Field(default_factory=datetime.utcnow)
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class FairWorkPostingBand(SQLModel, table=True):
+    """MinHash LSH band of a posting, for near-duplicate candidate lookups."""
+    __tablename__ = "fair_work_posting_bands"
+    __table_args__ = (
+        Index("ix_fair_work_posting_bands_posting_id", "posting_id"),
+    )
+    
+    band: int = Field(primary_key=True)
+    band_hash: int = Field(sa_column=Column(BigInteger, primary_key=True))
+    posting_id: int = Field(
+        sa_column=Column(
+            Integer, ForeignKey("fair_work_postings.id", ondelete="CASCADE"), primary_key=True
+        )
+    )
+
+
+class EventPostingMatch(SQLModel, table=True):
+    """Precomputed postings near an upcoming labor event, best first."""
+    __tablename__ = "event_posting_matches"
+    __table_args__ = (
+        Index("ix_event_posting_matches_event_rank", "event_id", "rank"),
+    )
+    
+    event_id: int = Field(
+        sa_column=Column(Integer, ForeignKey("events.id", ondelete="CASCADE"), primary_key=True)
+    )
+    posting_id: int = Field(
+        sa_column=Column(
+            Integer, ForeignKey("fair_work_postings.id", ondelete="CASCADE"), primary_key=True, index=True
+        )
+    )
+    rank: int  # 1 = best match for the event
+    score: float
+    distance_km: float
+
+
+class FairWorkPostingCount(SQLModel, table=True):
+    """Posting counts per facet combination, maintained by triggers on fair_work_postings."""
+    __tablename__ = "fair_work_posting_counts"
+    
+    employment_type: EmploymentType = Field(primary_key=True)
+    union_status: UnionStatus = Field(primary_key=True)
+    wage_band: str = Field(primary_key=True, max_length=20)  # "under-20", "20-30", "30-plus" or "unlisted"
+    posting_count: int = Field(default=0)
+
+
+# Id of the current transaction, as a bigint (xid8 has no direct cast)
+CURRENT_TXID = "(pg_current_xact_id()::text)::bigint"
+
+
+class ChangeLogEntry(SQLModel, table=True):
+    """
+    A change to synced data, written by triggers (see /sync).
+    
+    Entries are read in (txid, id) order, the id of the writing transaction
+    first, so a sync can stop at transactions that have not finished yet.
+    entity is "event", "post", "attendance" (entity_id is the event,
+    user_id the attendee) or "event_reactions" / "post_reactions" (counts
+    of the entity_id target changed). Entries with a user_id are only
+    synced to that user.
+    """
+    __tablename__ = "change_log"
+    __table_args__ = (
+        Index("ix_change_log_txid_id", "txid", "id"),
+    )
+    
+    id: Optional[int] = Field(default=None, sa_column=Column(BigInteger, primary_key=True))
+    txid: Optional[int] = Field(
+        default=None,
+        sa_column=Column(BigInteger, nullable=False, server_default=text(CURRENT_TXID))
+    )
+    entity: str = Field(max_length=20)
+    entity_id: int
+    user_id: Optional[int] = None
+    deleted: bool = False  # Tombstone: the row is gone
+    changed_at: datetime = Field(default_factory=datetime.utcnow, index=True)
+
+
+class CollectionVersion(SQLModel, table=True):
+    """
+    Version of a whole table, for list validators (conditional GET).
+
+    One row per table (events, posts, profiles, fair_work_postings),
+    bumped by a statement-level trigger on every insert, update and delete
+    in the same transaction as the write, so a list's version is one
+    primary key read however large the table grows.
+    """
+    __tablename__ = "collection_versions"
+    
+    name: str = Field(primary_key=True, max_length=50)
+    version: int = Field(default=0, sa_column=Column(BigInteger, nullable=False, server_default=text("0")))
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+# Full-text search vectors
+#
+# These are stored generated columns maintained by Postgres itself, so every
+# insert/update keeps them current without application code. They live on the
+# tables (for metadata and migrations) but are deliberately not mapped onto the
+# models: only the search endpoint reads them, and loading them with every
+# Event/Post would just add bytes to each row.
+EVENT_SEARCH_DOCUMENT = (
+    f"setweight(to_tsvector('{SEARCH_CONFIG}'::regconfig, coalesce(title, '')), 'A') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}'::regconfig, coalesce(tags, '[]'::jsonb)), 'B') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}'::regconfig, coalesce(location, '')), 'C') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}'::regconfig, coalesce(description, '')), 'D')"
+)
+POST_SEARCH_DOCUMENT = (
+    f"to_tsvector('{SEARCH_CONFIG}'::regconfig, coalesce(text, ''))"
+)
+
+Event.__table__.append_column(
+    Column("search_vector", TSVECTOR, Computed(EVENT_SEARCH_DOCUMENT, persisted=True))
+)
+Post.__table__.append_column(
+    Column("search_vector", TSVECTOR, Computed(POST_SEARCH_DOCUMENT, persisted=True))
+)
+Index("ix_events_search_vector", Event.__table__.c.search_vector, postgresql_using="gin")
+Index("ix_posts_search_vector", Post.__table__.c.search_vector, postgresql_using="gin")
+
+
+# Wage range
+#
+# A generated numrange over the posted wages (NULL when no wage is posted),
+# GiST-indexed for overlap queries like "pays somewhere between $20 and $30".
+# Unmapped for the same reason as the search vectors.
+POSTING_WAGE_RANGE = (
+    "CASE WHEN wage_min IS NULL AND wage_max IS NULL THEN NULL "
+    f"ELSE numrange(({POSTING_WAGE_BOTTOM})::numeric, ({POSTING_WAGE_TOP})::numeric, '[]') END"
+)
+
+FairWorkPosting.__table__.append_column(
+    Column("wage_range", NUMRANGE, Computed(POSTING_WAGE_RANGE, persisted=True))
+)
+Index("ix_fair_work_postings_wage_range", FairWorkPosting.__table__.c.wage_range, postgresql_using="gist")
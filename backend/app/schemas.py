@@ -1,11 +1,18 @@
 """Pydantic schemas for API request/response models."""
 
 from datetime import datetime
-from typing import Optional, List
+from enum import Enum
+from typing import Optional, List, Union
 from pydantic import BaseModel, EmailStr, Field, field_validator
 from app.models import ProfileType, ReactionType, TargetType, EmploymentType, UnionStatus
 
 
+class Projection(str, Enum):
+    """Named field sets for list endpoints (?fields=)."""
+    CARD = "card"  # What list and card views render; long text left out
+    FULL = "full"
+
+
 # Auth Schemas
 class UserRegister(BaseModel):
     """Schema for user registration."""
@@ -57,6 +64,14 @@ class ProfileUpdate(BaseModel):
     causes: Optional[List[str]] = None
 
 
+class ProfileCard(BaseModel):
+    """Lightweight profile card for lists of people."""
+    id: int
+    name: str
+    avatar_url: Optional[str] = None
+    profile_type: ProfileType
+
+
 class ProfileResponse(BaseModel):
     """Schema for profile data in responses."""
     id: int
@@ -65,6 +80,8 @@ class ProfileResponse(BaseModel):
     email: str  # User's email
     bio: Optional[str]
     location: Optional[str]
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
     avatar_url: Optional[str] = None  # Profile picture
     causes: List[str]
     profile_type: ProfileType
@@ -73,6 +90,11 @@ class ProfileResponse(BaseModel):
 
 
 # Event Schemas
+# Longest event tag; event_tag_counts keys tags in a varchar(255)
+TAG_MAX_LENGTH = 100
+MAX_TAGS = 20
+
+
 class EventCreate(BaseModel):
     """Schema for creating an event."""
     title: str = Field(min_length=1, max_length=255)
@@ -81,7 +103,23 @@ class EventCreate(BaseModel):
     location: str = Field(min_length=1, max_length=500)
     latitude: Optional[float] = None
     longitude: Optional[float] = None
-    tags: List[str] = Field(default_factory=list)
+    tags: List[str] = Field(default_factory=list, max_length=MAX_TAGS)
+    
+    @field_validator('tags')
+    @classmethod
+    def normalize_tags(cls, v: List[str]) -> List[str]:
+        """Trim tags and collapse inner whitespace, dropping blanks and case-insensitive repeats."""
+        tags = []
+        seen = set()
+        for tag in v:
+            tag = " ".join(tag.split())
+            if not tag or tag.casefold() in seen:
+                continue
+            if len(tag) > TAG_MAX_LENGTH:
+                raise ValueError(f'Tags can be at most {TAG_MAX_LENGTH} characters')
+            seen.add(tag.casefold())
+            tags.append(tag)
+        return tags
     
     @field_validator('event_date')
     @classmethod
@@ -108,11 +146,30 @@ class EventResponse(BaseModel):
     updated_at: datetime
 
 
+class EventCard(BaseModel):
+    """Event without its description, for compact lists."""
+    id: int
+    creator_id: int
+    title: str
+    event_date: datetime
+    location: str
+    latitude: Optional[float]
+    longitude: Optional[float]
+    tags: List[str]
+    attendee_count: int = 0
+
+
 class EventWithCreator(EventResponse):
     """Schema for event with creator information."""
     creator: ProfileResponse
 
 
+class TagCount(BaseModel):
+    """Schema for the number of events carrying a tag."""
+    tag: str
+    event_count: int
+
+
 # Post Schemas
 class PostCreate(BaseModel):
     """Schema for creating a post."""
@@ -162,12 +219,27 @@ class ReactionCounts(BaseModel):
     gratitude: int = 0
 
 
+# Event Detail Schemas
+class EventViewerState(BaseModel):
+    """Schema for the current viewer's relationship to an event."""
+    attending: bool = False
+    reaction_type: Optional[ReactionType] = None
+
+
+class EventDetail(EventWithCreator):
+    """Schema for event detail with optional embedded sections (?include=)."""
+    attendees: Optional[List[ProfileCard]] = None
+    reactions: Optional[ReactionCounts] = None
+    viewer: Optional[EventViewerState] = None
+    jobs: Optional[List["EventJobMatch"]] = None
+
+
 # Feed Schemas
 class FeedItem(BaseModel):
     """Schema for feed item (event or post)."""
     type: str  # "event" or "post"
     id: int
-    creator: ProfileResponse
+    creator: Union[ProfileResponse, ProfileCard]  # ProfileCard with ?fields=card
     created_at: datetime
     # Event-specific fields
     title: Optional[str] = None
@@ -200,12 +272,51 @@ class AttendeeListResponse(BaseModel):
     attendees: List[int]  # List of user IDs
 
 
+class CheckInStatus(str, Enum):
+    """Outcome of one row in a bulk check-in."""
+    CHECKED_IN = "checked_in"
+    ALREADY_ATTENDING = "already_attending"
+    UNKNOWN_USER = "unknown_user"
+    DUPLICATE = "duplicate"
+
+
+class BulkAttendanceRequest(BaseModel):
+    """Schema for checking many people in to an event at once."""
+    user_ids: List[int] = Field(default_factory=list, max_length=10000)
+    emails: List[str] = Field(default_factory=list, max_length=10000)
+
+
+class BulkAttendanceRow(BaseModel):
+    """Schema for the outcome of one bulk check-in row."""
+    input: str  # The user id or email as given
+    user_id: Optional[int] = None
+    status: CheckInStatus
+
+
+class BulkAttendanceResponse(BaseModel):
+    """Schema for a bulk check-in report."""
+    checked_in: int = 0
+    already_attending: int = 0
+    unknown_user: int = 0
+    duplicate: int = 0
+    results: List[BulkAttendanceRow] = Field(default_factory=list)
+
+
+class AttendeePage(BaseModel):
+    """Schema for a page of attendee profile cards."""
+    total_count: int
+    attendees: List[ProfileCard]
+    next_cursor: Optional[str] = None
+
+
 # Unionized Schemas
 class FairWorkPostingCreate(BaseModel):
     """Schema for creating a fair work posting."""
     title: str = Field(min_length=1, max_length=255)
     organization: str = Field(min_length=1, max_length=255)
     location: str = Field(min_length=1, max_length=255)
+    latitude: Optional[float] = Field(None, ge=-90, le=90)
+    longitude: Optional[float] = Field(None, ge=-180, le=180)
     wage_min: Optional[float] = None
     wage_max: Optional[float] = None
     wage_text: str = Field(min_length=1, max_length=255)
@@ -222,6 +333,8 @@ class FairWorkPostingResponse(BaseModel):
     title: str
     organization: str
     location: str
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
     wage_min: Optional[float]
     wage_max: Optional[float]
     wage_text: str
@@ -230,6 +343,146 @@ class FairWorkPostingResponse(BaseModel):
     description: str
     worker_notes: Optional[str]
     application_url: Optional[str]
+    duplicate_of_id: Optional[int] = None
     posted_date: datetime
     created_at: datetime
     updated_at: datetime
+
+
+class FairWorkPostingCard(BaseModel):
+    """Posting without description, worker notes and application URL, for compact lists."""
+    id: int
+    title: str
+    organization: str
+    location: str
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    wage_min: Optional[float]
+    wage_max: Optional[float]
+    wage_text: str
+    employment_type: EmploymentType
+    union_status: UnionStatus
+    duplicate_of_id: Optional[int] = None
+    posted_date: datetime
+
+
+class FacetCount(BaseModel):
+    """Schema for the number of postings with one facet value."""
+    value: str
+    count: int
+
+
+class PostingFacets(BaseModel):
+    """Schema for posting counts per employment type, union status and wage band."""
+    employment_type: List[FacetCount] = Field(default_factory=list)
+    union_status: List[FacetCount] = Field(default_factory=list)
+    wage_band: List[FacetCount] = Field(default_factory=list)
+
+
+class EventJobMatch(BaseModel):
+    """Schema for a fair work posting matched to a nearby labor event."""
+    posting: FairWorkPostingResponse
+    score: float
+    distance_km: float
+
+
+class PostingSort(str, Enum):
+    """Sort order for posting pages."""
+    NEWEST = "newest"
+    WAGE_DESC = "wage_desc"
+    WAGE_ASC = "wage_asc"
+
+
+class FairWorkPostingPage(BaseModel):
+    """Schema for a cursor-paginated page of postings with facet counts."""
+    items: List[Union[FairWorkPostingResponse, FairWorkPostingCard]]
+    next_cursor: Optional[str] = None
+    facets: Optional[PostingFacets] = None
+
+
+class PostingImportFormat(str, Enum):
+    """File format for bulk posting imports."""
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+class ExportFormat(str, Enum):
+    """File format for streaming exports."""
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+class PostingImportError(BaseModel):
+    """Schema for one rejected row of a bulk posting import."""
+    line: int
+    error: str
+
+
+class PostingImportReport(BaseModel):
+    """Schema for the outcome of a bulk posting import."""
+    received: int = 0
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    failed: int = 0
+    duplicates: int = 0
+    elapsed_seconds: float = 0.0
+    rows_per_second: float = 0.0
+    errors: List[PostingImportError] = Field(default_factory=list)
+
+
+EventDetail.model_rebuild()
+
+
+# Search Schemas
+class SearchResult(BaseModel):
+    """Schema for a ranked search hit (event or post)."""
+    type: TargetType
+    id: int
+    rank: float
+    creator_id: int
+    created_at: datetime
+    # Event-specific fields
+    title: Optional[str] = None
+    description: Optional[str] = None
+    event_date: Optional[datetime] = None
+    location: Optional[str] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    tags: Optional[List[str]] = None
+    # Post-specific fields
+    text: Optional[str] = None
+    image_url: Optional[str] = None
+
+
+class SearchResponse(BaseModel):
+    """Schema for a page of search results."""
+    results: List[SearchResult]
+    next_cursor: Optional[str] = None
+
+
+# Sync Schemas
+class SyncReactions(BaseModel):
+    """Schema for the current reaction counts of a synced event or post."""
+    target_type: TargetType
+    target_id: int
+    counts: ReactionCounts
+    user_reaction: Optional[ReactionType] = None  # The caller's reaction
+
+
+class SyncDeleted(BaseModel):
+    """Schema for tombstones: ids to drop from the client's copy."""
+    events: List[int] = Field(default_factory=list)
+    posts: List[int] = Field(default_factory=list)
+    attending: List[int] = Field(default_factory=list)  # Events the caller no longer attends
+
+
+class SyncResponse(BaseModel):
+    """Schema for the changes since a sync watermark."""
+    watermark: str  # Pass as ?since= on the next sync
+    has_more: bool = False  # More changes are waiting; sync again right away
+    events: List[EventResponse] = Field(default_factory=list)
+    posts: List[PostResponse] = Field(default_factory=list)
+    reactions: List[SyncReactions] = Field(default_factory=list)
+    attending: List[int] = Field(default_factory=list)  # Events the caller started attending
+    deleted: SyncDeleted = Field(default_factory=SyncDeleted)
@@ -0,0 +1 @@
+"""Business logic shared by API endpoints and maintenance scripts."""
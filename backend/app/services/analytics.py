@@ -0,0 +1,257 @@
+"""Incremental Parquet snapshots of activity tables, for reports run off the database."""
+
+import json
+import os
+from datetime import datetime, timedelta
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from sqlalchemy import Engine
+from sqlmodel import select
+from app.models import Event, Attendance, Reaction, FairWorkPosting
+from app.services.exports import EXPORT_BATCH_SIZE, stream_rows
+
+# Every part file carries the time of the snapshot that wrote it; when a
+# row was written by several snapshots, the latest copy wins on read
+SNAPSHOT_COLUMN = "_snapshot"
+
+# Parts are partitioned by the month rows were created in ("month=2026-01")
+PARTITION_COLUMN = "created_at"
+PARTITIONING = ds.partitioning(pa.schema([("month", pa.string())]), flavor="hive")
+
+# How far before the last watermark an incremental snapshot reads again,
+# so rows from transactions that committed late are not missed
+WATERMARK_OVERLAP = timedelta(minutes=10)
+
+STATE_FILE = "_state.json"
+
+INT, FLOAT, STRING, TIMESTAMP = pa.int64(), pa.float64(), pa.string(), pa.timestamp("us")
+
+
+class AnalyticsTable(NamedTuple):
+    """A table to snapshot: its model, exported columns with Arrow types, and change column."""
+    model: Any
+    fields: Dict[str, pa.DataType]
+    watermark: str  # Column that moves forward whenever a row is inserted or changed
+
+
+TABLES: Dict[str, AnalyticsTable] = {
+    "events": AnalyticsTable(
+        Event,
+        {
+            "id": INT, "creator_id": INT, "title": STRING, "event_date": TIMESTAMP, "location": STRING,
+            "latitude": FLOAT, "longitude": FLOAT, "tags": pa.list_(STRING),
+            "created_at": TIMESTAMP, "updated_at": TIMESTAMP,
+        },
+        "updated_at",
+    ),
+    "attendances": AnalyticsTable(
+        Attendance,
+        {"id": INT, "user_id": INT, "event_id": INT, "created_at": TIMESTAMP},
+        "created_at",
+    ),
+    "reactions": AnalyticsTable(
+        Reaction,
+        {
+            "id": INT, "user_id": INT, "target_type": STRING, "target_id": INT, "reaction_type": STRING,
+            "created_at": TIMESTAMP, "updated_at": TIMESTAMP,
+        },
+        "updated_at",
+    ),
+    "fair_work_postings": AnalyticsTable(
+        FairWorkPosting,
+        {
+            "id": INT, "title": STRING, "organization": STRING, "location": STRING,
+            "latitude": FLOAT, "longitude": FLOAT, "wage_min": FLOAT, "wage_max": FLOAT,
+            "employment_type": STRING, "union_status": STRING, "duplicate_of_id": INT,
+            "posted_date": TIMESTAMP, "created_at": TIMESTAMP, "updated_at": TIMESTAMP,
+        },
+        "updated_at",
+    ),
+}
+
+
+def arrow_schema(table: AnalyticsTable) -> pa.Schema:
+    """Schema of the table's part files."""
+    return pa.schema([*table.fields.items(), (SNAPSHOT_COLUMN, TIMESTAMP)])
+
+
+def load_state(root: Path) -> Dict[str, str]:
+    """Watermark (ISO datetime) each table was last snapshotted up to."""
+    path = root / STATE_FILE
+    return json.loads(path.read_text()) if path.exists() else {}
+
+
+def save_state(root: Path, state: Dict[str, str]) -> None:
+    """Write the watermarks, atomically."""
+    path = root / STATE_FILE
+    temporary = path.with_suffix(".tmp")
+    temporary.write_text(json.dumps(state, indent=2, sort_keys=True))
+    os.replace(temporary, path)
+
+
+def _cell(value: Any) -> Any:
+    return value.value if isinstance(value, Enum) else value
+
+
+class _PartWriters:
+    """One Parquet writer per month partition, renamed into place on commit."""
+
+    def __init__(self, directory: Path, schema: pa.Schema, snapshot: datetime):
+        self.directory = directory
+        self.schema = schema
+        self.filename = f"part-{snapshot:%Y%m%dT%H%M%S}.parquet"
+        self._writers: Dict[str, Tuple[pq.ParquetWriter, Path]] = {}
+
+    def write(self, month: str, batch: pa.RecordBatch) -> None:
+        if month not in self._writers:
+            path = self.directory / f"month={month}" / self.filename
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temporary = path.with_suffix(".tmp")
+            self._writers[month] = (pq.ParquetWriter(temporary, self.schema, compression="zstd"), path)
+        self._writers[month][0].write_batch(batch)
+
+    def commit(self) -> List[Path]:
+        paths = []
+        for writer, path in self._writers.values():
+            writer.close()
+            os.replace(path.with_suffix(".tmp"), path)
+            paths.append(path)
+        return paths
+
+    def abort(self) -> None:
+        for writer, path in self._writers.values():
+            writer.close()
+            path.with_suffix(".tmp").unlink(missing_ok=True)
+
+
+def snapshot_table(
+    bind: Engine,
+    root: Path,
+    name: str,
+    since: Optional[datetime],
+    snapshot: datetime
+) -> Tuple[int, Optional[datetime], List[Path]]:
+    """
+    Write one table's rows changed after since (all rows if None) as a
+    new part file in each month partition they fall in.
+
+    Rows are streamed from a server-side cursor and written as Arrow
+    record batches, so memory stays flat.
+
+    Returns:
+        (rows written, new watermark, part files written)
+    """
+    table = TABLES[name]
+    schema = arrow_schema(table)
+    statement = select(*(getattr(table.model, column) for column in table.fields))
+    watermark_column = getattr(table.model, table.watermark)
+    if since is not None:
+        statement = statement.where(watermark_column > since - WATERMARK_OVERLAP)
+
+    watermark_index = list(table.fields).index(table.watermark)
+    partition_index = list(table.fields).index(PARTITION_COLUMN)
+    writers = _PartWriters(root / name, schema, snapshot)
+    written = 0
+    watermark = since
+
+    def flush(rows: list) -> None:
+        months: Dict[str, List[int]] = {}
+        for index, row in enumerate(rows):
+            months.setdefault(f"{row[partition_index]:%Y-%m}", []).append(index)
+        arrays = [
+            pa.array([_cell(row[column]) for row in rows], type=arrow_type)
+            for column, arrow_type in enumerate(table.fields.values())
+        ]
+        arrays.append(pa.array([snapshot] * len(rows), type=TIMESTAMP))
+        batch = pa.RecordBatch.from_arrays(arrays, schema=schema)
+        for month, indices in months.items():
+            writers.write(month, batch.take(pa.array(indices)))
+
+    rows: list = []
+    try:
+        for row in stream_rows(statement, bind):
+            rows.append(row)
+            if watermark is None or row[watermark_index] > watermark:
+                watermark = row[watermark_index]
+            if len(rows) >= EXPORT_BATCH_SIZE:
+                flush(rows)
+                written += len(rows)
+                rows = []
+        if rows:
+            flush(rows)
+            written += len(rows)
+    except BaseException:
+        writers.abort()
+        raise
+    return written, watermark, writers.commit()
+
+
+def _remove_other_parts(directory: Path, keep: Iterable[Path]) -> None:
+    keep = set(keep)
+    for path in directory.glob("month=*/*.parquet"):
+        if path not in keep:
+            path.unlink()
+    for partition in directory.glob("month=*"):
+        if not any(partition.iterdir()):
+            partition.rmdir()
+
+
+def run_snapshot(
+    bind: Engine,
+    root: Path,
+    names: Optional[Iterable[str]] = None,
+    full: bool = False
+) -> Dict[str, int]:
+    """
+    Snapshot tables (all of TABLES by default) under root and advance
+    their watermarks.
+
+    Incremental runs only capture inserted and updated rows. Deleted
+    attendances and reactions are only dropped by a full run, which
+    rewrites every row and then removes the older parts.
+
+    Returns:
+        Rows written per table
+    """
+    root.mkdir(parents=True, exist_ok=True)
+    state = load_state(root)
+    snapshot = datetime.utcnow()
+    counts = {}
+    for name in names or TABLES:
+        since = None if full or name not in state else datetime.fromisoformat(state[name])
+        counts[name], watermark, paths = snapshot_table(bind, root, name, since, snapshot)
+        if full:
+            _remove_other_parts(root / name, paths)
+        if watermark is not None:
+            state[name] = watermark.isoformat()
+        save_state(root, state)
+    return counts
+
+
+def load_table(root: Path, name: str, since_month: Optional[str] = None) -> pa.Table:
+    """
+    Current rows of a snapshotted table, read from its part files.
+
+    Only partitions from since_month ("2026-01") on are read. Where
+    snapshots wrote the same row more than once, the latest copy is kept
+    (one sort and a vectorized comparison of neighbouring ids).
+    """
+    directory = root / name
+    schema = arrow_schema(TABLES[name])
+    if not directory.exists():
+        return schema.empty_table()
+    dataset = ds.dataset(directory, format="parquet", partitioning=PARTITIONING)
+    partitions = ds.field("month") >= since_month if since_month else None
+    table = dataset.to_table(columns=schema.names, filter=partitions)
+    if table.num_rows == 0:
+        return table.drop_columns([SNAPSHOT_COLUMN])
+
+    table = table.sort_by([("id", "ascending"), (SNAPSHOT_COLUMN, "descending")])
+    ids = table["id"].combine_chunks()
+    keep = pa.concat_arrays([pa.array([True]), pc.not_equal(ids[1:], ids[:-1])])
+    return table.filter(keep).drop_columns([SNAPSHOT_COLUMN])
@@ -0,0 +1,112 @@
+"""Bulk attendance (check-in / RSVP import) for organizers."""
+
+from datetime import datetime
+from typing import Dict, Iterable, List, Tuple
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import Session, select
+from app.api.conditional import touch
+from app.core.cache import invalidate, model_tag
+from app.models import User, Event, Attendance
+from app.schemas import BulkAttendanceResponse, BulkAttendanceRow, CheckInStatus
+
+# Rows per multi-row INSERT / IN (...) lookup
+BATCH_SIZE = 1000
+
+
+def _chunks(items: List, size: int = BATCH_SIZE) -> Iterable[List]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def bulk_check_in(
+    session: Session,
+    event_id: int,
+    user_ids: Iterable[int] = (),
+    emails: Iterable[str] = ()
+) -> BulkAttendanceResponse:
+    """
+    Check many people in to an event in one transaction.
+    
+    User ids and emails are resolved with a handful of IN (...) lookups, and
+    attendances are written with multi-row INSERT ... ON CONFLICT DO NOTHING,
+    so people already attending are reported rather than duplicated. The
+    event's updated_at is bumped in the same transaction when anyone is
+    checked in, and its cached responses are invalidated after the commit.
+    The caller is responsible for verifying the event and permissions.
+    
+    Args:
+        session: Database session (committed on success)
+        event_id: Event to check people in to
+        user_ids: User ids to check in
+        emails: User emails to check in (matched case-insensitively)
+        
+    Returns:
+        Per-row outcomes in input order, with totals per status
+    """
+    # Input rows in order: (raw input, lookup key); repeats are flagged, not re-inserted
+    rows: List[Tuple[str, tuple]] = []
+    for user_id in user_ids:
+        rows.append((str(user_id), ("id", int(user_id))))
+    for email in emails:
+        email = email.strip()
+        if email:
+            rows.append((email, ("email", email.lower())))
+    
+    # Resolve ids and emails in bulk
+    wanted_ids = list({key[1] for _, key in rows if key[0] == "id"})
+    wanted_emails = list({key[1] for _, key in rows if key[0] == "email"})
+    resolved: Dict[tuple, int] = {}
+    
+    for chunk in _chunks(wanted_ids):
+        for user_id in session.exec(select(User.id).where(User.id.in_(chunk))):
+            resolved[("id", user_id)] = user_id
+    for chunk in _chunks(wanted_emails):
+        statement = select(User.id, func.lower(User.email)).where(func.lower(User.email).in_(chunk))
+        for user_id, email in session.exec(statement):
+            resolved[("email", email)] = user_id
+    
+    # Insert every resolved user once, keeping track of who was newly added
+    to_insert: List[int] = []
+    seen = set()
+    for _, key in rows:
+        user_id = resolved.get(key)
+        if user_id is not None and user_id not in seen:
+            seen.add(user_id)
+            to_insert.append(user_id)
+    
+    now = datetime.utcnow()
+    inserted = set()
+    for chunk in _chunks(to_insert):
+        statement = (
+            insert(Attendance)
+            .values([{"user_id": user_id, "event_id": event_id, "created_at": now} for user_id in chunk])
+            .on_conflict_do_nothing(index_elements=["user_id", "event_id"])
+            .returning(Attendance.user_id)
+        )
+        inserted.update(session.execute(statement).scalars())
+    if inserted:
+        touch(session, Event, event_id)
+    session.commit()
+    invalidate(model_tag(Event, event_id), model_tag(Event))
+    
+    # Report per-row outcomes in input order
+    report = BulkAttendanceResponse()
+    reported = set()
+    for raw, key in rows:
+        user_id = resolved.get(key)
+        if user_id is None:
+            status = CheckInStatus.UNKNOWN_USER
+        elif user_id in reported:
+            status = CheckInStatus.DUPLICATE
+        elif user_id in inserted:
+            status = CheckInStatus.CHECKED_IN
+        else:
+            status = CheckInStatus.ALREADY_ATTENDING
+        if user_id is not None:
+            reported.add(user_id)
+        
+        setattr(report, status.value, getattr(report, status.value) + 1)
+        report.results.append(BulkAttendanceRow(input=raw, user_id=user_id, status=status))
+    
+    return report
@@ -0,0 +1,138 @@
+"""Streaming exports of events, attendees and postings as NDJSON or CSV."""
+
+import csv
+import io
+import logging
+from datetime import datetime
+from enum import Enum
+from typing import Any, Iterable, Iterator, Optional
+import orjson
+from sqlalchemy import Engine, Select
+from sqlmodel import select
+from app.db.session import engine
+from app.core.projections import schema_columns
+from app.models import Event, Attendance, Profile, FairWorkPosting
+from app.schemas import EventResponse, ExportFormat, FairWorkPostingResponse
+
+logger = logging.getLogger(__name__)
+
+# Rows fetched per round trip from the server-side cursor
+EXPORT_BATCH_SIZE = 2000
+
+# Bytes buffered before a chunk is written to the response
+EXPORT_CHUNK_BYTES = 64 * 1024
+
+# Longest a single export statement (the query, or one fetch) may run
+EXPORT_STATEMENT_TIMEOUT = "60s"
+
+# Leading characters spreadsheets read as a formula
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def events_export() -> Select:
+    """Every event, with the columns of EventResponse, oldest first."""
+    return select(*schema_columns(Event, EventResponse)).order_by(Event.id)
+
+
+def postings_export() -> Select:
+    """Every posting, duplicates included (see duplicate_of_id), oldest first."""
+    return select(*schema_columns(FairWorkPosting, FairWorkPostingResponse)).order_by(FairWorkPosting.id)
+
+
+def attendees_export(creator_id: int, event_id: Optional[int] = None) -> Select:
+    """Attendees of one organizer's events (or of one of them), by event in join order."""
+    statement = (
+        select(
+            Attendance.event_id,
+            Event.title.label("event_title"),
+            Profile.id.label("profile_id"),
+            Profile.name,
+            Attendance.created_at.label("joined_at"),
+        )
+        .join(Event, Event.id == Attendance.event_id)
+        .join(Profile, Profile.user_id == Attendance.user_id)
+        .where(Event.creator_id == creator_id)
+        .order_by(Attendance.event_id, Attendance.id)
+    )
+    if event_id is not None:
+        statement = statement.where(Attendance.event_id == event_id)
+    return statement
+
+
+def stream_rows(statement: Select, bind: Engine = engine) -> Iterator[Any]:
+    """
+    Run statement in a read-only transaction and yield its rows.
+
+    Rows come from a server-side cursor EXPORT_BATCH_SIZE at a time, so
+    memory stays flat however many there are. The export has its own
+    connection, as it outlives the request's session.
+    """
+    with bind.connect() as connection:
+        if connection.dialect.name == "postgresql":
+            connection.exec_driver_sql("SET TRANSACTION READ ONLY")
+            connection.exec_driver_sql(f"SET LOCAL statement_timeout = '{EXPORT_STATEMENT_TIMEOUT}'")
+        result = connection.execution_options(stream_results=True, yield_per=EXPORT_BATCH_SIZE).execute(statement)
+        yield from result
+
+
+def _csv_cell(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, list):
+        value = "; ".join(str(item) for item in value)
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value  # keep user text from running as a spreadsheet formula
+    return value
+
+
+def _ndjson_lines(rows: Iterable[Any]) -> Iterator[bytes]:
+    for row in rows:
+        yield orjson.dumps(dict(row._mapping)) + b"\n"
+
+
+def _csv_lines(columns: list, rows: Iterable[Any]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def line(values: list) -> bytes:
+        writer.writerow(values)
+        data = buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+        return data
+
+    yield line(columns)
+    for row in rows:
+        yield line([_csv_cell(value) for value in row])
+
+
+def export_chunks(statement: Select, format: ExportFormat) -> Iterator[bytes]:
+    """
+    Encode statement's rows as NDJSON or CSV (with a header row), in
+    chunks of about EXPORT_CHUNK_BYTES for a StreamingResponse.
+
+    A failure mid-export can only cut the response short (its status is
+    already sent), so it is logged and the body ends early.
+    """
+    rows = stream_rows(statement)
+    if format == ExportFormat.CSV:
+        lines = _csv_lines(list(statement.selected_columns.keys()), rows)
+    else:
+        lines = _ndjson_lines(rows)
+
+    chunk = bytearray()
+    try:
+        for line in lines:
+            chunk += line
+            if len(chunk) >= EXPORT_CHUNK_BYTES:
+                yield bytes(chunk)
+                chunk.clear()
+    except Exception:
+        logger.exception("Export failed part way through")
+        raise
+    if chunk:
+        yield bytes(chunk)
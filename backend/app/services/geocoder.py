@@ -0,0 +1,391 @@
+"""Offline geocoding of free-text locations against a bundled gazetteer."""
+
+import heapq
+import logging
+import mmap
+import os
+import re
+import struct
+import tempfile
+import unicodedata
+import zlib
+from functools import lru_cache
+from pathlib import Path
+from itertools import islice
+from typing import BinaryIO, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Bundled GeoNames-format sample files (cities, postcodes, admin1 names)
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+# Distinct strings kept in the geocode() LRU cache
+CACHE_SIZE = 50_000
+
+# A lone word ("Springfield") only resolves to a place at least this big,
+# so street or venue words do not turn into small towns of the same name
+MIN_SINGLE_WORD_POPULATION = 50_000
+
+# Longest place name, in words, tried against the index
+MAX_NAME_WORDS = 4
+
+# Entries scanned per suggest() prefix before ranking
+SUGGEST_SCAN_LIMIT = 2_000
+
+# Entries sorted in memory at a time while building; larger inputs are
+# sorted in runs spilled to temporary files and merged
+BUILD_RUN_SIZE = 500_000
+
+INDEX_MAGIC = b"GZIX2"
+_HEADER = struct.Struct("<5sQ")
+_OFFSET = struct.Struct("<Q")
+# latitude, longitude, population, kind, display name length
+_RECORD = struct.Struct("<ddIBB")
+
+KIND_CITY = 1
+KIND_POSTCODE = 2
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+_POSTCODE = re.compile(r"^\d{5}$")
+
+
+class Place(NamedTuple):
+    """A gazetteer hit."""
+    name: str
+    latitude: float
+    longitude: float
+    population: int
+    kind: int
+
+
+def normalize(text: str) -> str:
+    """Accent-folded, lower-cased words joined by single spaces ("São Paulo, SP" -> "sao paulo sp")."""
+    folded = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+    return " ".join(_TOKEN.findall(folded.lower()))
+
+
+def _name_variants(name: str) -> List[str]:
+    key = normalize(name)
+    variants = [key]
+    if key.startswith("saint "):
+        variants.append("st " + key[len("saint "):])
+    elif key.startswith("st "):
+        variants.append("saint " + key[len("st "):])
+    return variants
+
+
+def _rows(path: Path) -> Iterator[List[str]]:
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip() and not line.startswith("#"):
+                yield line.rstrip("\n").split("\t")
+
+
+def read_sources(
+    cities: Sequence[Path],
+    postcodes: Sequence[Path] = (),
+    admin1: Sequence[Path] = ()
+) -> Iterator[Tuple[str, Place]]:
+    """
+    Read GeoNames dumps into (key, place) index entries.
+
+    Each city is keyed by its name and alternate names, alone and followed
+    by its admin1 code or name ("oakland", "oakland ca", "oakland
+    california"). Postcodes are keyed by the code itself.
+
+    Args:
+        cities: Files in the cities*.txt / allCountries.txt format
+        postcodes: Files in the postal code dump format
+        admin1: admin1CodesASCII.txt files, mapping "US.CA" to "California"
+    """
+    regions: Dict[str, str] = {}
+    for path in admin1:
+        for row in _rows(path):
+            regions[row[0]] = row[2] or row[1]
+
+    for path in cities:
+        for row in _rows(path):
+            name, country, region = row[1], row[8], row[10]
+            place = Place(f"{name}, {region}" if region else name, float(row[4]), float(row[5]),
+                          int(row[14] or 0), KIND_CITY)
+            names = {name, row[2], *(alt for alt in row[3].split(",") if alt)}
+            suffixes = {""}
+            if region:
+                suffixes.add(normalize(region))
+                if f"{country}.{region}" in regions:
+                    suffixes.add(normalize(regions[f"{country}.{region}"]))
+            for variant in {v for n in names for v in _name_variants(n) if v}:
+                for suffix in suffixes:
+                    yield (f"{variant} {suffix}" if suffix else variant), place
+
+    for path in postcodes:
+        for row in _rows(path):
+            name = f"{row[2]}, {row[4]} {row[1]}" if row[4] else f"{row[2]} {row[1]}"
+            yield normalize(row[1]), Place(name, float(row[9]), float(row[10]), 0, KIND_POSTCODE)
+
+
+def _encode(key: bytes, place: Place) -> bytes:
+    name = place.name.encode("utf-8")[:255]
+    return (
+        bytes([len(key)]) + key
+        + _RECORD.pack(place.latitude, place.longitude, place.population, place.kind, len(name))
+        + name
+    )
+
+
+def _read_run(f: BinaryIO) -> Iterator[Tuple[bytes, int, bytes]]:
+    """(key, -population, record) for each record of a sorted run file."""
+    while True:
+        key_len = f.read(1)
+        if not key_len:
+            return
+        key = f.read(key_len[0])
+        fields = f.read(_RECORD.size)
+        _latitude, _longitude, population, _kind, name_len = _RECORD.unpack(fields)
+        yield key, -population, key_len + key + fields + f.read(name_len)
+
+
+def _sorted_runs(entries: Iterable[Tuple[str, Place]], directory: Path) -> Tuple[List[BinaryIO], int]:
+    """Spill entries to temporary files of BUILD_RUN_SIZE records each, every file sorted; (files, entry count)."""
+    runs, count = [], 0
+    entries = iter(entries)
+    while True:
+        chunk = [(key.encode("utf-8")[:255], place) for key, place in islice(entries, BUILD_RUN_SIZE)]
+        if not chunk:
+            return runs, count
+        count += len(chunk)
+        chunk.sort(key=lambda entry: (entry[0], -entry[1].population))
+        run = tempfile.TemporaryFile(dir=directory)
+        for key, place in chunk:
+            run.write(_encode(key, place))
+        run.seek(0)
+        runs.append(run)
+
+
+def build_index(entries: Iterable[Tuple[str, Place]], path: Path) -> int:
+    """
+    Write a sorted, memory-mappable index of gazetteer entries.
+
+    Layout: header (magic, entry count), a table of little-endian uint64
+    record offsets in key order, then the records (key length, key,
+    latitude, longitude, population, kind, name length, name). Entries
+    sharing a key are ordered by population, biggest first, so the first
+    match is the best one. The file is written next to path and renamed,
+    so readers never see a partial index.
+
+    Entries are sorted in runs of BUILD_RUN_SIZE spilled to temporary
+    files, then merged straight into the index, so memory use does not
+    grow with the size of the dump.
+
+    Returns:
+        Number of entries written
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    runs, count = _sorted_runs(entries, path.parent)
+    try:
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as table, open(tmp, "r+b") as records:
+            table.write(_HEADER.pack(INDEX_MAGIC, count))
+            offset = _HEADER.size + _OFFSET.size * count
+            records.seek(offset)
+            for _key, _population, record in heapq.merge(*(_read_run(run) for run in runs)):
+                table.write(_OFFSET.pack(offset))
+                records.write(record)
+                offset += len(record)
+        os.replace(tmp, path)
+    finally:
+        for run in runs:
+            run.close()
+    return count
+
+
+class Gazetteer:
+    """
+    Read-only view of a compiled index.
+
+    The file is memory-mapped, so opening it costs nothing up front and
+    worker processes share its pages. Lookups binary-search the offset
+    table; prefix scans walk forward from the first key at or after the
+    prefix.
+    """
+
+    def __init__(self, path: Path):
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.size = _HEADER.unpack_from(self._map, 0)
+        if magic != INDEX_MAGIC:
+            raise ValueError(f"{path} is not a gazetteer index")
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _offset(self, i: int) -> int:
+        return _OFFSET.unpack_from(self._map, _HEADER.size + _OFFSET.size * i)[0]
+
+    def _key(self, i: int) -> bytes:
+        offset = self._offset(i)
+        return self._map[offset + 1:offset + 1 + self._map[offset]]
+
+    def _place(self, i: int) -> Place:
+        offset = self._offset(i)
+        offset += 1 + self._map[offset]
+        latitude, longitude, population, kind, name_len = _RECORD.unpack_from(self._map, offset)
+        offset += _RECORD.size
+        name = self._map[offset:offset + name_len].decode("utf-8")
+        return Place(name, latitude, longitude, population, kind)
+
+    def _lower_bound(self, key: bytes) -> int:
+        lo, hi = 0, self.size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def lookup(self, key: str) -> Optional[Place]:
+        """Most populous place with exactly this normalized key."""
+        encoded = key.encode("utf-8")
+        i = self._lower_bound(encoded)
+        if i < self.size and self._key(i) == encoded:
+            return self._place(i)
+        return None
+
+    def prefix(self, prefix: str, limit: int = 10) -> List[Place]:
+        """Distinct places whose key starts with a normalized prefix, most populous first."""
+        encoded = prefix.encode("utf-8")
+        places: Dict[str, Place] = {}
+        i = self._lower_bound(encoded)
+        end = min(self.size, i + SUGGEST_SCAN_LIMIT)
+        while i < end and self._key(i).startswith(encoded):
+            place = self._place(i)
+            places.setdefault(place.name, place)
+            i += 1
+        return sorted(places.values(), key=lambda place: (-place.population, place.name))[:limit]
+
+
+def source_files(directory: Path) -> Tuple[List[Path], List[Path], List[Path]]:
+    """
+    (cities, postcodes, admin1) GeoNames files found in a directory.
+
+    Postal code dumps must be named postcodes*.txt and admin1 files
+    admin1*.txt; every other .txt file is read as a cities dump.
+    """
+    files = sorted(p for p in Path(directory).glob("*.txt"))
+    admin1 = [p for p in files if p.name.startswith("admin1")]
+    postcodes = [p for p in files if p.name.startswith("postcodes")]
+    cities = [p for p in files if p not in admin1 and p not in postcodes]
+    return cities, postcodes, admin1
+
+
+def index_path() -> Path:
+    """Where the compiled index lives (GAZETTEER_INDEX, or a temp file keyed on the source directory)."""
+    if settings.GAZETTEER_INDEX:
+        return Path(settings.GAZETTEER_INDEX)
+    source = Path(settings.GAZETTEER_PATH or DATA_DIR).resolve()
+    return Path(tempfile.gettempdir()) / f"gazetteer-{zlib.crc32(str(source).encode()):08x}.idx"
+
+
+def _is_current(path: Path) -> bool:
+    with open(path, "rb") as f:
+        return f.read(len(INDEX_MAGIC)) == INDEX_MAGIC
+
+
+def ensure_index() -> Path:
+    """
+    Build the index from the source files if it is missing, older than
+    them or in an older format. Slow for a full GeoNames dump, so it runs
+    at startup and from scripts/build_gazetteer.py, never on a request.
+
+    Returns:
+        Path of the index
+    """
+    path = index_path()
+    source = Path(settings.GAZETTEER_PATH or DATA_DIR)
+    cities, postcodes, admin1 = source_files(source)
+    newest = max((p.stat().st_mtime for p in (*cities, *postcodes, *admin1)), default=0)
+    if not path.exists() or path.stat().st_mtime < newest or not _is_current(path):
+        logger.info("Building gazetteer index %s from %s", path, source)
+        build_index(read_sources(cities, postcodes, admin1), path)
+    return path
+
+
+@lru_cache(maxsize=1)
+def _open(path: Path) -> Gazetteer:
+    return Gazetteer(path)
+
+
+def get_gazetteer() -> Optional[Gazetteer]:
+    """
+    Open the compiled index (built by ensure_index), or None if it has not
+    been built, in which case nothing geocodes.
+    """
+    path = index_path()
+    if not path.exists():
+        logger.warning("Gazetteer index %s is missing; run scripts/build_gazetteer.py", path)
+        return None
+    return _open(path)
+
+
+def _resolve(gazetteer: Gazetteer, text: str) -> Optional[Place]:
+    tokens = normalize(text).split()
+    if not tokens:
+        return None
+
+    # A postcode is the most precise thing a free-text location can carry
+    for token in tokens:
+        if _POSTCODE.match(token):
+            place = gazetteer.lookup(token)
+            if place:
+                return place
+
+    # Otherwise the place name, usually at the end ("Union Hall, 12 Main St, Oakland CA"):
+    # try word runs ending at the last word first, longest first
+    words = [token for token in tokens if not token.isdigit()]
+    for end in range(len(words), 0, -1):
+        for start in range(max(0, end - MAX_NAME_WORDS), end):
+            place = gazetteer.lookup(" ".join(words[start:end]))
+            if place is None:
+                continue
+            if end - start == 1 and len(words) > 1 and place.population < MIN_SINGLE_WORD_POPULATION:
+                continue
+            return place
+    return None
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _geocode(text: str) -> Optional[Place]:
+    return _resolve(_open(index_path()), text)
+
+
+def geocode(text: str) -> Optional[Place]:
+    """
+    Resolve a free-text location ("Oakland, CA", "94612", "Union Hall,
+    Oakland") to a place, or None. Works fully offline; results are cached.
+    """
+    if get_gazetteer() is None:
+        return None
+    return _geocode(text)
+
+
+def geocode_many(texts: Iterable[Optional[str]]) -> List[Optional[Place]]:
+    """Batch form of geocode for backfills: one result per input, each distinct string resolved once."""
+    texts = list(texts)
+    resolved = {text: geocode(text) for text in set(texts) if text}
+    return [resolved.get(text) if text else None for text in texts]
+
+
+def coordinates(text: Optional[str]) -> Tuple[Optional[float], Optional[float]]:
+    """(latitude, longitude) of a free-text location, or (None, None)."""
+    place = geocode(text) if text else None
+    return (place.latitude, place.longitude) if place else (None, None)
+
+
+def suggest(prefix: str, limit: int = 10) -> List[Place]:
+    """Places whose name starts with prefix, most populous first."""
+    key = normalize(prefix)
+    gazetteer = get_gazetteer()
+    return gazetteer.prefix(key, limit) if key and gazetteer else []
@@ -0,0 +1,194 @@
+"""Precomputed matches between upcoming labor events and nearby fair work postings."""
+
+import math
+import re
+from datetime import datetime
+from typing import Iterable, List, Set
+from sqlalchemy import delete, or_
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import Session, select
+from app.core.geo import bounding_box, distance_km
+from app.models import Event, EventPostingMatch, FairWorkPosting
+from app.schemas import EventJobMatch, FairWorkPostingResponse
+
+# Postings kept per event
+MATCH_LIMIT = 10
+
+# Postings further than this from an event are never matched
+MATCH_RADIUS_KM = 50.0
+
+# Nearest postings (by bounding-box rank) scored per event
+CANDIDATE_LIMIT = 500
+
+# Score = GEO_WEIGHT * closeness + KEYWORD_WEIGHT * keyword overlap, both 0..1
+GEO_WEIGHT = 0.6
+KEYWORD_WEIGHT = 0.4
+
+# Event tags that make an event a labor action
+LABOR_TAGS = (
+    "Workers Rights", "Union Building", "Fair Wages", "Restaurant Workers",
+    "Labor", "Union", "Strike", "Picket Line",
+)
+
+_WORD = re.compile(r"[a-z]{3,}")
+_STOPWORDS = {
+    "the", "and", "for", "with", "our", "you", "your", "are", "will", "from", "this",
+    "that", "all", "join", "come", "who", "more", "about", "into", "their", "have",
+}
+
+
+def keywords(*texts: str) -> Set[str]:
+    """Lower-cased words of three or more letters, without common stopwords."""
+    words = set()
+    for text in texts:
+        words.update(_WORD.findall((text or "").lower()))
+    return words - _STOPWORDS
+
+
+def event_keywords(event: Event) -> Set[str]:
+    return keywords(event.title, event.description, *event.tags)
+
+
+def posting_keywords(posting: FairWorkPosting) -> Set[str]:
+    return keywords(posting.title, posting.organization, posting.description)
+
+
+def is_labor_tagged(tags: Iterable[str]) -> bool:
+    """Whether any of an event's tags marks it as a labor action."""
+    return any(tag in LABOR_TAGS for tag in tags)
+
+
+def match_score(distance: float, event_words: Set[str], posting_words: Set[str]) -> float:
+    """
+    Relevance of a posting to an event.
+
+    Closeness falls linearly to 0 at MATCH_RADIUS_KM; keyword overlap is
+    the cosine similarity of the two word sets.
+    """
+    closeness = max(0.0, 1.0 - distance / MATCH_RADIUS_KM)
+    overlap = 0.0
+    if event_words and posting_words:
+        overlap = len(event_words & posting_words) / math.sqrt(len(event_words) * len(posting_words))
+    return GEO_WEIGHT * closeness + KEYWORD_WEIGHT * overlap
+
+
+def labor_event_conditions() -> list:
+    """Conditions for upcoming labor-tagged events with coordinates (tag lookups use ix_events_tags)."""
+    return [
+        Event.event_date >= datetime.utcnow(),
+        Event.latitude.is_not(None),
+        Event.longitude.is_not(None),
+        or_(*(Event.tags.contains([tag]) for tag in LABOR_TAGS)),
+    ]
+
+
+def refresh_event_matches(session: Session, event_ids: Iterable[int]) -> None:
+    """
+    Recompute the top MATCH_LIMIT postings for each event. The caller commits.
+
+    Events that are past, have no coordinates or carry no labor tag end up
+    with no matches. Candidates come from a bounding-box query on the
+    posting coordinate index, so only postings near the event are scored.
+    """
+    event_ids = list(event_ids)
+    if not event_ids:
+        return
+    session.execute(delete(EventPostingMatch).where(EventPostingMatch.event_id.in_(event_ids)))
+
+    events = session.exec(select(Event).where(Event.id.in_(event_ids), *labor_event_conditions())).all()
+    rows = []
+    for event in events:
+        min_lat, max_lat, min_lng, max_lng = bounding_box(event.latitude, event.longitude, MATCH_RADIUS_KM)
+        # Nearest first by squared degree offset, a cheap stand-in for distance
+        offset = (
+            (FairWorkPosting.latitude - event.latitude) * (FairWorkPosting.latitude - event.latitude)
+            + (FairWorkPosting.longitude - event.longitude) * (FairWorkPosting.longitude - event.longitude)
+        )
+        candidates = session.exec(
+            select(FairWorkPosting)
+            .where(
+                FairWorkPosting.latitude.between(min_lat, max_lat),
+                FairWorkPosting.longitude.between(min_lng, max_lng),
+                FairWorkPosting.duplicate_of_id.is_(None),
+            )
+            .order_by(offset)
+            .limit(CANDIDATE_LIMIT)
+        ).all()
+
+        words = event_keywords(event)
+        scored = []
+        for posting in candidates:
+            distance = distance_km(event.latitude, event.longitude, posting.latitude, posting.longitude)
+            if distance <= MATCH_RADIUS_KM:
+                scored.append((match_score(distance, words, posting_keywords(posting)), distance, posting.id))
+        scored.sort(key=lambda match: (-match[0], match[1], match[2]))
+
+        for rank, (score, distance, posting_id) in enumerate(scored[:MATCH_LIMIT], start=1):
+            rows.append({
+                "event_id": event.id,
+                "posting_id": posting_id,
+                "rank": rank,
+                "score": score,
+                "distance_km": distance,
+            })
+
+    if rows:
+        session.execute(insert(EventPostingMatch).values(rows))
+
+
+def refresh_posting_matches(session: Session, posting_ids: Iterable[int]) -> None:
+    """
+    Update matches after postings were created, changed or flagged. The caller commits.
+
+    Only events that currently match one of the postings, or upcoming
+    labor events within MATCH_RADIUS_KM of one, are recomputed.
+    """
+    posting_ids = list(posting_ids)
+    if not posting_ids:
+        return
+
+    affected = set(session.exec(
+        select(EventPostingMatch.event_id).where(EventPostingMatch.posting_id.in_(posting_ids))
+    ).all())
+
+    points = session.exec(
+        select(FairWorkPosting.latitude, FairWorkPosting.longitude).where(
+            FairWorkPosting.id.in_(posting_ids),
+            FairWorkPosting.latitude.is_not(None),
+            FairWorkPosting.longitude.is_not(None),
+            FairWorkPosting.duplicate_of_id.is_(None),
+        )
+    ).all()
+    if points:
+        events = select(Event.id, Event.latitude, Event.longitude).where(*labor_event_conditions())
+        if len(points) == 1:
+            min_lat, max_lat, min_lng, max_lng = bounding_box(*points[0], MATCH_RADIUS_KM)
+            events = events.where(
+                Event.latitude.between(min_lat, max_lat),
+                Event.longitude.between(min_lng, max_lng),
+            )
+        # Upcoming labor events are few, so a bulk import checks them all in memory
+        for event_id, lat, lng in session.exec(events):
+            if any(distance_km(lat, lng, p_lat, p_lng) <= MATCH_RADIUS_KM for p_lat, p_lng in points):
+                affected.add(event_id)
+
+    refresh_event_matches(session, sorted(affected))
+
+
+def event_jobs(session: Session, event_id: int, limit: int = MATCH_LIMIT) -> List[EventJobMatch]:
+    """Matched postings for an event, best first, read from event_posting_matches."""
+    statement = (
+        select(FairWorkPosting, EventPostingMatch.score, EventPostingMatch.distance_km)
+        .join(EventPostingMatch, EventPostingMatch.posting_id == FairWorkPosting.id)
+        .where(EventPostingMatch.event_id == event_id)
+        .order_by(EventPostingMatch.rank)
+        .limit(limit)
+    )
+    return [
+        EventJobMatch(
+            posting=FairWorkPostingResponse(**posting.model_dump()),
+            score=score,
+            distance_km=distance,
+        )
+        for posting, score, distance in session.exec(statement)
+    ]
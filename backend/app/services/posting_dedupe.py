@@ -0,0 +1,157 @@
+"""Near-duplicate detection for fair work postings."""
+
+import re
+from datetime import datetime
+from typing import Any, Dict, List, Sequence, Set, Tuple
+from sqlalchemy import Integer, column, delete, update, values
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import Session, select
+from app.core.minhash import band_hashes, jaccard, shingles, signature
+from app.models import FairWorkPosting, FairWorkPostingBand
+
+# Shingle similarity at or above which a posting duplicates an older one
+DUPLICATE_SIMILARITY = 0.8
+
+# Rows per multi-row INSERT / IN (...) lookup
+BATCH_SIZE = 1000
+
+_WORD = re.compile(r"\w+")
+
+PostingText = Dict[str, Any]
+
+
+def posting_features(posting: PostingText) -> Set[str]:
+    """
+    Shingles of a posting's title, organization and description.
+
+    Shingles are tagged with their field, so the same words in the title
+    and in the description count as different features.
+    """
+    features = set()
+    for field in ("title", "organization", "description"):
+        features.update(f"{field[0]}:{shingle}" for shingle in shingles(posting[field] or ""))
+    return features
+
+
+def location_key(location: str) -> str:
+    """Normalized location ("Oakland, CA" and "oakland ca" are the same place)."""
+    return " ".join(_WORD.findall(location.lower()))
+
+
+def _chunks(items: List, size: int = BATCH_SIZE):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def index_postings(session: Session, postings: Sequence[Tuple[int, PostingText]]) -> None:
+    """
+    Replace the LSH band rows of postings. The caller commits.
+
+    Bands are keyed on the posting's location as well as its MinHash
+    signature, so the same job in two cities is never a candidate pair.
+    """
+    ids = [posting_id for posting_id, _ in postings]
+    for chunk in _chunks(ids):
+        session.execute(delete(FairWorkPostingBand).where(FairWorkPostingBand.posting_id.in_(chunk)))
+
+    rows = [
+        {"band": band, "band_hash": band_hash, "posting_id": posting_id}
+        for posting_id, posting in postings
+        for band, band_hash in enumerate(
+            band_hashes(signature(posting_features(posting)), key=location_key(posting["location"]))
+        )
+    ]
+    for chunk in _chunks(rows):
+        session.execute(insert(FairWorkPostingBand).values(chunk).on_conflict_do_nothing())
+
+
+def _candidate_pairs(session: Session, ids: List[int]) -> List[Tuple[int, int]]:
+    """(posting, older canonical posting sharing a band with it) pairs for ids."""
+    pairs = set()
+    for chunk in _chunks(ids):
+        probe = (
+            select(FairWorkPostingBand.posting_id, FairWorkPostingBand.band, FairWorkPostingBand.band_hash)
+            .where(FairWorkPostingBand.posting_id.in_(chunk))
+            .subquery("probe")
+        )
+        statement = (
+            select(probe.c.posting_id, FairWorkPostingBand.posting_id)
+            .distinct()
+            .join(
+                FairWorkPostingBand,
+                (FairWorkPostingBand.band == probe.c.band)
+                & (FairWorkPostingBand.band_hash == probe.c.band_hash)
+                & (FairWorkPostingBand.posting_id < probe.c.posting_id),
+            )
+            .join(FairWorkPosting, FairWorkPosting.id == FairWorkPostingBand.posting_id)
+            .where(FairWorkPosting.duplicate_of_id.is_(None))
+        )
+        pairs.update(tuple(row) for row in session.exec(statement))
+    return list(pairs)
+
+
+def flag_duplicates(session: Session, postings: Sequence[Tuple[int, PostingText]]) -> Dict[int, int]:
+    """
+    Index postings and mark those that nearly duplicate an older canonical posting.
+
+    Candidates come from the band table (MinHash LSH): only postings
+    sharing a band are fetched, never the whole table. Each candidate pair
+    is then confirmed with the exact shingle similarity. A posting is
+    flagged with duplicate_of_id pointing at the oldest confirmed match;
+    postings are processed oldest first, so one flagged earlier in the
+    same call is not used as a match. The caller commits.
+
+    Args:
+        session: Database session
+        postings: (id, fields) of postings to check; fields need title,
+            organization, location and description
+
+    Returns:
+        Mapping of flagged posting id to the id it duplicates
+    """
+    if not postings:
+        return {}
+    index_postings(session, postings)
+
+    texts = {posting_id: posting for posting_id, posting in postings}
+    candidates: Dict[int, List[int]] = {}
+    for posting_id, candidate_id in _candidate_pairs(session, list(texts)):
+        candidates.setdefault(posting_id, []).append(candidate_id)
+
+    # Load the text of older candidates that were not passed in
+    missing = list({c for ids in candidates.values() for c in ids} - texts.keys())
+    for chunk in _chunks(missing):
+        statement = select(
+            FairWorkPosting.id, FairWorkPosting.title, FairWorkPosting.organization,
+            FairWorkPosting.location, FairWorkPosting.description,
+        ).where(FairWorkPosting.id.in_(chunk))
+        for row in session.exec(statement):
+            texts[row.id] = row._asdict()
+
+    features: Dict[int, Set[str]] = {}
+
+    def features_of(posting_id: int) -> Set[str]:
+        if posting_id not in features:
+            features[posting_id] = posting_features(texts[posting_id])
+        return features[posting_id]
+
+    flagged: Dict[int, int] = {}
+    for posting_id in sorted(candidates):
+        for candidate_id in sorted(candidates[posting_id]):
+            if candidate_id in flagged or candidate_id not in texts:
+                continue
+            if jaccard(features_of(posting_id), features_of(candidate_id)) >= DUPLICATE_SIMILARITY:
+                flagged[posting_id] = candidate_id
+                break
+
+    if flagged:
+        rows = values(
+            column("posting_id", Integer), column("canonical_id", Integer), name="flags"
+        ).data(list(flagged.items()))
+        session.execute(
+            update(FairWorkPosting)
+            .where(FairWorkPosting.id == rows.c.posting_id)
+            .values(duplicate_of_id=rows.c.canonical_id, updated_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+    return flagged
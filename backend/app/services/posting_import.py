@@ -0,0 +1,249 @@
+"""Bulk import of fair work postings from NDJSON or CSV."""
+
+import codecs
+import csv
+import json
+import time
+from datetime import datetime
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from pydantic import ValidationError
+from sqlalchemy import func, literal_column, or_
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import Session
+from app.core.cache import invalidate, model_tag
+from app.models import FairWorkPosting
+from app.schemas import (
+    FairWorkPostingCreate, PostingImportError, PostingImportFormat, PostingImportReport
+)
+from app.services.posting_dedupe import flag_duplicates
+from app.services.geocoder import geocode_many
+from app.services.job_matching import refresh_posting_matches
+
+# Rows validated and written per multi-row upsert (and per commit)
+CHUNK_SIZE = 1000
+
+# Rejected rows listed in the report; the rest are only counted
+MAX_REPORTED_ERRORS = 100
+
+# Bytes read at a time when checking an upload's encoding
+READ_BLOCK_SIZE = 1 << 16
+
+# Columns an import writes, and may overwrite on an existing posting
+IMPORT_COLUMNS = tuple(FairWorkPostingCreate.model_fields)
+
+# CSV cells that may be left empty
+OPTIONAL_COLUMNS = {"latitude", "longitude", "wage_min", "wage_max", "worker_notes", "application_url"}
+
+Record = Tuple[int, Any]
+
+
+def detect_format(filename: Optional[str]) -> Optional[PostingImportFormat]:
+    """Guess the import format from a file name's extension."""
+    name = (filename or "").lower()
+    if name.endswith(".csv"):
+        return PostingImportFormat.CSV
+    if name.endswith((".ndjson", ".jsonl")):
+        return PostingImportFormat.NDJSON
+    return None
+
+
+def is_utf8(file: BinaryIO) -> bool:
+    """
+    Whether a seekable binary file decodes as UTF-8 (with or without a BOM).
+
+    The file is read in blocks and rewound afterwards, so an upload can be
+    rejected before any of its chunks are committed.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    try:
+        for block in iter(lambda: file.read(READ_BLOCK_SIZE), b""):
+            decoder.decode(block)
+        decoder.decode(b"", final=True)
+    except UnicodeDecodeError:
+        return False
+    finally:
+        file.seek(0)
+    return True
+
+
+def read_records(lines: Iterable[str], fmt: PostingImportFormat) -> Iterator[Record]:
+    """
+    Parse import lines one record at a time.
+
+    Args:
+        lines: Text lines (a file object, stdin or a decoded upload)
+        fmt: NDJSON (one JSON object per line) or CSV with a header row
+            naming FairWorkPostingCreate fields
+
+    Yields:
+        (line number, record dict), or (line number, error message) for
+        lines that cannot be parsed
+    """
+    if fmt == PostingImportFormat.NDJSON:
+        for line_no, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                yield line_no, f"Invalid JSON: {e}"
+                continue
+            if not isinstance(record, dict):
+                yield line_no, "Expected a JSON object"
+                continue
+            yield line_no, record
+        return
+
+    reader = csv.DictReader(lines)
+    for row in reader:
+        if None in row:
+            yield reader.line_num, "Too many columns"
+            continue
+        yield reader.line_num, {
+            key: (None if value == "" and key in OPTIONAL_COLUMNS else value)
+            for key, value in row.items()
+        }
+
+
+def _describe(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in e['loc']) or 'row'}: {e['msg']}" for e in error.errors()
+    )
+
+
+def _natural_key(posting: Dict[str, Any]) -> Tuple[str, str, str]:
+    """Python mirror of uq_fair_work_postings_natural_key."""
+    return (
+        posting["organization"].lower(),
+        posting["title"].lower(),
+        posting["location"].lower(),
+    )
+
+
+def _upsert(session: Session, postings: List[Dict[str, Any]]) -> Tuple[int, List[int], int]:
+    """
+    Write one chunk with a multi-row INSERT ... ON CONFLICT DO UPDATE.
+
+    Rows identical to the stored posting are skipped by the WHERE clause,
+    so re-importing an unchanged file writes nothing. Written rows are
+    re-indexed, checked for near-duplicates and matched to nearby events.
+    Rows without coordinates are geocoded from their location first.
+
+    Returns:
+        (inserted count, ids of updated postings, count flagged as near-duplicates)
+    """
+    now = datetime.utcnow()
+    table = FairWorkPosting.__table__
+    ungeocoded = [p for p in postings if p["latitude"] is None or p["longitude"] is None]
+    for posting, place in zip(ungeocoded, geocode_many(p["location"] for p in ungeocoded)):
+        if place:
+            posting["latitude"], posting["longitude"] = place.latitude, place.longitude
+    statement = insert(table).values([
+        {**posting, "posted_date": now, "created_at": now, "updated_at": now}
+        for posting in postings
+    ])
+    excluded = statement.excluded
+    statement = statement.on_conflict_do_update(
+        index_elements=[
+            func.lower(table.c.organization),
+            func.lower(table.c.title),
+            func.lower(table.c.location),
+        ],
+        index_where=~table.c.key_duplicate,
+        set_={
+            **{column: excluded[column] for column in IMPORT_COLUMNS},
+            "duplicate_of_id": None,
+            "updated_at": excluded.updated_at,
+        },
+        where=or_(*(table.c[column].is_distinct_from(excluded[column]) for column in IMPORT_COLUMNS)),
+    ).returning(
+        table.c.id,
+        table.c.organization,
+        table.c.title,
+        table.c.location,
+        # xmax is 0 only for freshly inserted row versions
+        literal_column("xmax = 0").label("inserted"),
+    )
+
+    rows = session.execute(statement).all()
+    inserted = sum(1 for row in rows if row.inserted)
+    by_key = {_natural_key(posting): posting for posting in postings}
+    flagged = flag_duplicates(session, [(row.id, by_key[_natural_key(row._asdict())]) for row in rows])
+    refresh_posting_matches(session, [row.id for row in rows])
+    return inserted, [row.id for row in rows if not row.inserted], len(flagged)
+
+
+def import_postings(
+    session: Session,
+    records: Iterable[Record],
+    chunk_size: int = CHUNK_SIZE,
+    on_chunk: Optional[Callable[[PostingImportReport], None]] = None
+) -> PostingImportReport:
+    """
+    Validate and upsert postings chunk by chunk.
+
+    Records are consumed lazily, so memory use is bounded by chunk_size no
+    matter how large the input is. Postings are keyed on (organization,
+    title, location), case-insensitively: a known posting is updated in
+    place and an unchanged one is left alone. Each chunk is committed on
+    its own, so an interrupted import keeps its finished chunks and
+    re-running it only writes what is still missing.
+
+    Within one chunk, a later row with the same key replaces an earlier
+    one, which is counted as unchanged. Written postings that nearly
+    duplicate an older posting are flagged (see posting_dedupe) and
+    counted under duplicates.
+
+    Args:
+        session: Database session (committed after every chunk)
+        records: (line number, record dict or parse error) pairs, as
+            produced by read_records
+        chunk_size: Rows per validation batch, upsert and commit
+        on_chunk: Called with the running report after each commit
+
+    Returns:
+        Totals, throughput and the first MAX_REPORTED_ERRORS row errors
+    """
+    report = PostingImportReport()
+    started = time.perf_counter()
+
+    def reject(line_no: int, message: str) -> None:
+        report.failed += 1
+        if len(report.errors) < MAX_REPORTED_ERRORS:
+            report.errors.append(PostingImportError(line=line_no, error=message))
+
+    def flush(chunk: Dict[Tuple[str, str, str], Dict[str, Any]], valid: int) -> None:
+        inserted, updated, duplicates = _upsert(session, list(chunk.values())) if chunk else (0, [], 0)
+        session.commit()
+        invalidate(model_tag(FairWorkPosting), *(model_tag(FairWorkPosting, posting_id) for posting_id in updated))
+        report.inserted += inserted
+        report.updated += len(updated)
+        report.duplicates += duplicates
+        report.unchanged += valid - inserted - len(updated)
+        report.elapsed_seconds = time.perf_counter() - started
+        if report.elapsed_seconds > 0:
+            report.rows_per_second = report.received / report.elapsed_seconds
+        if on_chunk:
+            on_chunk(report)
+
+    chunk: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+    valid = 0
+    for line_no, record in records:
+        report.received += 1
+        if isinstance(record, str):
+            reject(line_no, record)
+            continue
+        try:
+            posting = FairWorkPostingCreate.model_validate(record).model_dump()
+        except ValidationError as e:
+            reject(line_no, _describe(e))
+            continue
+
+        chunk[_natural_key(posting)] = posting
+        valid += 1
+        if valid >= chunk_size:
+            flush(chunk, valid)
+            chunk, valid = {}, 0
+
+    flush(chunk, valid)
+    return report
@@ -0,0 +1,221 @@
+"""Query building for Unionized fair work postings."""
+
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import Numeric, cast, func, literal_column, tuple_
+from sqlalchemy.sql import Select
+from sqlmodel import Session, select
+from app.models import FairWorkPosting, FairWorkPostingCount, EmploymentType, UnionStatus
+from app.schemas import FacetCount, PostingFacets, PostingSort
+from app.core.exceptions import ValidationException
+from app.core.pagination import encode_cursor, decode_cursor
+
+wage_range = FairWorkPosting.__table__.c.wage_range
+
+
+def posting_search_text():
+    """
+    Text that ?q= is matched against: title, organization and location.
+    
+    Mirrors POSTING_SEARCH_TEXT in app.models, which the trigram index is
+    built on, so the planner can use the index for fuzzy matches.
+    """
+    space = literal_column("' '")
+    return (
+        FairWorkPosting.title + space
+        + FairWorkPosting.organization + space
+        + FairWorkPosting.location
+    )
+
+
+def wage_top():
+    """
+    Top of a posting's wage range (the only wage, if just one is posted).
+    
+    Mirrors POSTING_WAGE_TOP in app.models, which the wage sort indexes
+    are built on.
+    """
+    return func.greatest(FairWorkPosting.wage_min, FairWorkPosting.wage_max)
+
+
+def filter_postings(
+    statement: Select,
+    *,
+    q: Optional[str] = None,
+    location: Optional[str] = None,
+    employment_type: Optional[EmploymentType] = None,
+    union_status: Optional[UnionStatus] = None,
+    min_wage: Optional[float] = None,
+    max_wage: Optional[float] = None
+) -> Select:
+    """
+    Apply the Unionized list filters to a posting query.
+    
+    Postings flagged as near-duplicates of an older posting are always
+    left out.
+    
+    Args:
+        statement: Query selecting from fair_work_postings
+        q: Free text; fuzzy (trigram word similarity) match on title,
+           organization and location, so small typos still match
+        location: Substring match on location (trigram indexed)
+        employment_type: Exact employment type
+        union_status: Exact union status
+        min_wage: Keep postings whose wage range reaches at least this much
+        max_wage: Keep postings whose wage range starts at or below this
+                  much; with min_wage, postings overlapping the range
+        
+    Returns:
+        The filtered query
+        
+    Raises:
+        ValidationException: If min_wage is above max_wage
+    """
+    if min_wage is not None and max_wage is not None and min_wage > max_wage:
+        raise ValidationException("min_wage must not be above max_wage", field="min_wage")
+    statement = statement.where(FairWorkPosting.duplicate_of_id.is_(None))
+    if q:
+        # text %> q: q is similar to some word extent of text (pg_trgm word_similarity)
+        statement = statement.where(posting_search_text().op("%>")(q))
+    if location:
+        statement = statement.where(FairWorkPosting.location.ilike(f"%{location}%"))
+    if employment_type:
+        statement = statement.where(FairWorkPosting.employment_type == employment_type)
+    if union_status:
+        statement = statement.where(FairWorkPosting.union_status == union_status)
+    if max_wage is not None:
+        # Overlap with [min_wage, max_wage] on the GiST-indexed wage_range;
+        # a NULL bound leaves that side of the range open
+        wanted = func.numrange(cast(min_wage, Numeric), cast(max_wage, Numeric), "[]")
+        statement = statement.where(wage_range.op("&&")(wanted))
+    elif min_wage is not None:
+        # "Pays at least": a range scan on the wage_top btree indexes
+        statement = statement.where(wage_top() >= min_wage)
+    return statement
+
+
+def wage_band():
+    """Wage band of a posting, via the posting_wage_band() SQL function."""
+    return func.posting_wage_band(FairWorkPosting.wage_min, FairWorkPosting.wage_max)
+
+
+def _sort_key(sort: PostingSort):
+    """Column the given sort orders by, ahead of the id tie-breaker."""
+    if sort == PostingSort.NEWEST:
+        return FairWorkPosting.posted_date
+    return wage_top()
+
+
+def sort_postings(statement: Select, sort: PostingSort) -> Select:
+    """
+    Order a posting query for keyset pages.
+    
+    Wage sorts leave out postings without a posted wage, so the sort key
+    is never NULL and the keyset comparison stays a plain index range.
+    """
+    key = _sort_key(sort)
+    if sort == PostingSort.NEWEST:
+        return statement.order_by(key.desc(), FairWorkPosting.id.desc())
+    statement = statement.where(key.is_not(None))
+    if sort == PostingSort.WAGE_DESC:
+        return statement.order_by(key.desc(), FairWorkPosting.id.desc())
+    return statement.order_by(key.asc(), FairWorkPosting.id.asc())
+
+
+def after_cursor(statement: Select, sort: PostingSort, cursor: str) -> Select:
+    """
+    Keyset condition for the page after cursor: rows strictly past its (key, id).
+    
+    Raises:
+        ValidationException: If the cursor is malformed or was issued for
+            a different sort order
+    """
+    key_type = datetime if sort == PostingSort.NEWEST else float
+    cursor_sort, last_key, last_id = decode_cursor(cursor, str, key_type, int)
+    if cursor_sort != sort.value or last_key is None:
+        raise ValidationException("Invalid pagination cursor", field="cursor")
+    
+    row = tuple_(_sort_key(sort), FairWorkPosting.id)
+    last = tuple_(last_key, last_id)
+    if sort == PostingSort.WAGE_ASC:
+        return statement.where(row > last)
+    return statement.where(row < last)
+
+
+def next_cursor(posting: FairWorkPosting, sort: PostingSort) -> str:
+    """Cursor for the page after posting, the last row of the current page."""
+    if sort == PostingSort.NEWEST:
+        key = posting.posted_date
+    else:
+        key = max(wage for wage in (posting.wage_min, posting.wage_max) if wage is not None)
+    return encode_cursor(sort.value, key, posting.id)
+
+
+def posting_facets(
+    session: Session,
+    *,
+    q: Optional[str] = None,
+    location: Optional[str] = None,
+    employment_type: Optional[EmploymentType] = None,
+    union_status: Optional[UnionStatus] = None,
+    min_wage: Optional[float] = None,
+    max_wage: Optional[float] = None
+) -> PostingFacets:
+    """
+    Count postings per employment type, union status and wage band.
+    
+    All three facets come from one GROUPING SETS query under the current
+    filters. Without text or wage filters the counts are read from the
+    small trigger-maintained fair_work_posting_counts table instead of
+    scanning postings; otherwise the postings are narrowed through their
+    trigram and wage indexes before grouping.
+    """
+    if q or location or min_wage is not None or max_wage is not None:
+        facet_type = FairWorkPosting.employment_type
+        facet_status = FairWorkPosting.union_status
+        facet_band = wage_band()
+        measure = func.count()
+        statement = filter_postings(
+            select(),
+            q=q,
+            location=location,
+            employment_type=employment_type,
+            union_status=union_status,
+            min_wage=min_wage,
+            max_wage=max_wage,
+        ).select_from(FairWorkPosting)
+    else:
+        facet_type = FairWorkPostingCount.employment_type
+        facet_status = FairWorkPostingCount.union_status
+        facet_band = FairWorkPostingCount.wage_band
+        measure = func.sum(FairWorkPostingCount.posting_count)
+        statement = select().select_from(FairWorkPostingCount)
+        if employment_type:
+            statement = statement.where(FairWorkPostingCount.employment_type == employment_type)
+        if union_status:
+            statement = statement.where(FairWorkPostingCount.union_status == union_status)
+    
+    statement = statement.add_columns(
+        facet_type.label("employment_type"),
+        facet_status.label("union_status"),
+        facet_band.label("wage_band"),
+        measure.label("postings"),
+    ).group_by(
+        func.grouping_sets(tuple_(facet_type), tuple_(facet_status), tuple_(facet_band))
+    )
+    
+    # Each row belongs to exactly one grouping set: the one column that is not NULL
+    facets = PostingFacets()
+    for row in session.exec(statement):
+        if not row.postings:
+            continue
+        if row.employment_type is not None:
+            facets.employment_type.append(FacetCount(value=row.employment_type.value, count=row.postings))
+        elif row.union_status is not None:
+            facets.union_status.append(FacetCount(value=row.union_status.value, count=row.postings))
+        elif row.wage_band is not None:
+            facets.wage_band.append(FacetCount(value=row.wage_band, count=row.postings))
+    
+    for values in (facets.employment_type, facets.union_status, facets.wage_band):
+        values.sort(key=lambda facet: (-facet.count, facet.value))
+    return facets
@@ -0,0 +1,53 @@
+"""Cached creator profiles embedded in events, posts and the feed."""
+
+from typing import Dict, Iterable
+from sqlmodel import Session, select
+from app.core.cache import get_cache, model_key, model_tag
+from app.models import Profile, User
+from app.schemas import ProfileResponse
+
+# Creator profiles are invalidated on every profile update, so they can be
+# kept longer than generic responses
+PROFILE_CARD_TTL = 300
+
+
+def _card_key(profile_id: int) -> str:
+    return model_key(Profile, profile_id, "card")
+
+
+def creator_profiles(session: Session, profile_ids: Iterable[int]) -> Dict[int, ProfileResponse]:
+    """
+    Profiles (with their user's email) to embed as creators, by profile id.
+
+    Cards come from the application cache; the ids a page is missing are
+    loaded with one profiles/users join and cached together. Entries are
+    tagged with the profile, so update_my_profile drops them, and share
+    the cache's LRU bound. Ids with no profile are left out.
+    """
+    ids = set(profile_ids)
+    if not ids:
+        return {}
+    cache = get_cache()
+    cached = cache.get_many(_card_key(profile_id) for profile_id in ids)
+    cards = {card["id"]: ProfileResponse.model_validate(card) for card in cached.values()}
+
+    missing = ids - cards.keys()
+    if missing:
+        statement = (
+            select(Profile, User.email)
+            .join(User, User.id == Profile.user_id)
+            .where(Profile.id.in_(missing))
+        )
+        loaded = {
+            profile.id: ProfileResponse(**profile.model_dump(), email=email)
+            for profile, email in session.exec(statement)
+        }
+        cache.set_many(
+            {
+                _card_key(profile_id): (card.model_dump(mode="json"), [model_tag(Profile, profile_id)])
+                for profile_id, card in loaded.items()
+            },
+            ttl=PROFILE_CARD_TTL,
+        )
+        cards.update(loaded)
+    return cards
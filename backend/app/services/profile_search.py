@@ -0,0 +1,69 @@
+"""Profile directory search: name typeahead filtered by cause and type."""
+
+from typing import List, Optional
+from sqlalchemy import func
+from sqlmodel import Session, select
+from app.core.sql import escape_like
+from app.models import Profile, ProfileType
+from app.schemas import ProfileCard
+
+# Shortest query that also matches words inside names; shorter ones have
+# too few trigrams for the index to narrow anything down
+MIN_WORD_MATCH_LENGTH = 3
+
+
+def profile_name_key():
+    """
+    Lower-cased name in C collation.
+
+    Mirrors PROFILE_NAME_KEY in app.models, so a prefix LIKE and the
+    ORDER BY both run off ix_profiles_name_prefix.
+    """
+    return func.lower(Profile.name).collate("C")
+
+
+def search_profiles(
+    session: Session,
+    *,
+    q: Optional[str] = None,
+    causes: Optional[List[str]] = None,
+    profile_type: Optional[ProfileType] = None,
+    limit: int = 10
+) -> List[ProfileCard]:
+    """
+    Find profiles for the directory and autocomplete.
+
+    Names starting with q come first, alphabetically, read in order from
+    the name index so no rows are sorted. If that leaves the page short,
+    names with a later word starting with q ("oak" finds "East Oakland
+    Tenants") fill it, via the trigram index. Only card columns are read.
+
+    Args:
+        session: Database session
+        q: Case-insensitive name prefix (all profiles if omitted)
+        causes: Only profiles supporting every one of these causes
+        profile_type: Only individuals or only groups
+        limit: Maximum number of cards
+    """
+    statement = select(Profile.id, Profile.name, Profile.avatar_url, Profile.profile_type)
+    if causes:
+        statement = statement.where(Profile.causes.contains(causes))
+    if profile_type:
+        statement = statement.where(Profile.profile_type == profile_type)
+
+    key = profile_name_key()
+    prefix = escape_like(q.lower()) if q else ""
+    rows = session.exec(
+        statement.where(key.like(f"{prefix}%")).order_by(key, Profile.id).limit(limit)
+    ).all()
+
+    if len(rows) < limit and len(prefix) >= MIN_WORD_MATCH_LENGTH:
+        seen = [row.id for row in rows]
+        rows += session.exec(
+            statement
+            .where(func.lower(Profile.name).like(f"% {prefix}%"), Profile.id.not_in(seen))
+            .order_by(key, Profile.id)
+            .limit(limit - len(rows))
+        ).all()
+
+    return [ProfileCard(**row._mapping) for row in rows]
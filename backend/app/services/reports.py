@@ -0,0 +1,67 @@
+"""Organizer reports aggregated from the analytics snapshots (see app.services.analytics)."""
+
+from pathlib import Path
+from typing import Optional
+import pyarrow as pa
+import pyarrow.compute as pc
+from app.services.analytics import load_table
+
+
+def attendance_per_event(root: Path, since_month: Optional[str] = None) -> pa.Table:
+    """
+    Attendees per event, most attended first.
+
+    Columns: event_id, title, event_date, attendees. With since_month,
+    only attendances created from that month on are counted.
+    """
+    attendances = load_table(root, "attendances", since_month)
+    events = load_table(root, "events").select(["id", "title", "event_date"])
+    counts = (
+        attendances.group_by("event_id")
+        .aggregate([("id", "count")])
+        .select(["event_id", "id_count"])
+        .rename_columns(["event_id", "attendees"])
+    )
+    report = counts.join(events, keys="event_id", right_keys="id", join_type="left outer")
+    return report.select(["event_id", "title", "event_date", "attendees"]).sort_by(
+        [("attendees", "descending"), ("event_id", "ascending")]
+    )
+
+
+def reactions_per_week(root: Path, since_month: Optional[str] = None) -> pa.Table:
+    """
+    Reactions given per week (starting Monday), by target type and reaction type.
+
+    Columns: week, target_type, reaction_type, reactions.
+    """
+    reactions = load_table(root, "reactions", since_month)
+    week = pc.floor_temporal(reactions["created_at"], unit="week", week_starts_monday=True)
+    report = (
+        reactions.append_column("week", week)
+        .group_by(["week", "target_type", "reaction_type"])
+        .aggregate([("id", "count")])
+        .select(["week", "target_type", "reaction_type", "id_count"])
+        .rename_columns(["week", "target_type", "reaction_type", "reactions"])
+    )
+    return report.sort_by(
+        [("week", "ascending"), ("target_type", "ascending"), ("reaction_type", "ascending")]
+    )
+
+
+def postings_by_union_status(root: Path, since_month: Optional[str] = None) -> pa.Table:
+    """
+    Postings per union status with their average posted wage range,
+    leaving out postings flagged as duplicates.
+
+    Columns: union_status, postings, avg_wage_min, avg_wage_max. With
+    since_month, only postings created from that month on are counted.
+    """
+    postings = load_table(root, "fair_work_postings", since_month)
+    postings = postings.filter(pc.is_null(postings["duplicate_of_id"]))
+    report = (
+        postings.group_by("union_status")
+        .aggregate([("id", "count"), ("wage_min", "mean"), ("wage_max", "mean")])
+        .select(["union_status", "id_count", "wage_min_mean", "wage_max_mean"])
+        .rename_columns(["union_status", "postings", "avg_wage_min", "avg_wage_max"])
+    )
+    return report.sort_by([("postings", "descending"), ("union_status", "ascending")])
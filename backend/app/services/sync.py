@@ -0,0 +1,194 @@
+"""Delta sync for the mobile app, read from the trigger-maintained change_log."""
+
+from datetime import datetime, timedelta
+from typing import Dict, Set, Tuple
+from sqlalchemy import delete, or_, text, tuple_
+from sqlmodel import Session, func, select
+from app.core.config import settings
+from app.core.exceptions import ValidationException
+from app.core.pagination import encode_cursor, decode_cursor
+from app.core.projections import from_row
+from app.models import ChangeLogEntry, Event, Post, Attendance, Reaction, TargetType
+from app.schemas import (
+    EventResponse, PostResponse, ReactionCounts, SyncReactions, SyncResponse
+)
+
+# Change log entries read per sync; has_more tells the client to sync again
+SYNC_PAGE_SIZE = 1000
+
+# Change log entries deleted per statement when pruning
+PRUNE_BATCH_SIZE = 10_000
+
+# Entries are kept this much longer than the retention a watermark is
+# honoured for, covering transactions that were open when it was issued
+PRUNE_MARGIN = timedelta(days=1)
+
+# Oldest transaction still running: every transaction below it has
+# finished, so all of its change log entries are visible
+SNAPSHOT_XMIN = "SELECT (pg_snapshot_xmin(pg_current_snapshot())::text)::bigint"
+
+REACTION_ENTITIES = {"event_reactions": TargetType.EVENT, "post_reactions": TargetType.POST}
+
+
+class ChangesPruned(Exception):
+    """Raised when changes after a watermark may have been pruned (answered with 410)."""
+
+
+def current_watermark(session: Session) -> str:
+    """A watermark for the current state, to sync from after a full refetch."""
+    xmin = session.execute(text(SNAPSHOT_XMIN)).scalar_one()
+    return encode_cursor(datetime.utcnow(), xmin, 0)
+
+
+def _decode_watermark(since: str) -> Tuple[datetime, int, int]:
+    """(time issued, txid, id) of the last change the client has."""
+    try:
+        return decode_cursor(since, datetime, int, int)
+    except ValidationException:
+        raise ValidationException("Invalid sync watermark", field="since")
+
+
+def changes_since(session: Session, user_id: int, since: str, limit: int = SYNC_PAGE_SIZE) -> SyncResponse:
+    """
+    Everything the user's copy is missing since a watermark.
+
+    Reads at most limit change log entries after the watermark, in
+    (txid, id) order and only from finished transactions, so a change
+    committed late is never skipped. Entries are collapsed per row and
+    the rows' current state is read with one IN (...) query per kind:
+    the work grows with the number of changes, not with the tables.
+    Rows that no longer exist come back as tombstones.
+
+    Raises:
+        ValidationException: If the watermark is malformed
+        ChangesPruned: If the watermark is older than the change log retention
+    """
+    issued, txid, entry_id = _decode_watermark(since)
+    now = datetime.utcnow()
+    if issued < now - timedelta(days=settings.CHANGE_LOG_RETENTION_DAYS):
+        raise ChangesPruned()
+
+    xmin = session.execute(text(SNAPSHOT_XMIN)).scalar_one()
+    statement = select(
+        ChangeLogEntry.txid, ChangeLogEntry.id, ChangeLogEntry.entity, ChangeLogEntry.entity_id
+    ).where(
+        tuple_(ChangeLogEntry.txid, ChangeLogEntry.id) > tuple_(txid, entry_id),
+        ChangeLogEntry.txid < xmin,
+        or_(ChangeLogEntry.user_id.is_(None), ChangeLogEntry.user_id == user_id)
+    ).order_by(ChangeLogEntry.txid, ChangeLogEntry.id).limit(limit + 1)
+    entries = session.exec(statement).all()
+
+    has_more = len(entries) > limit
+    entries = entries[:limit]
+    if has_more:
+        # Mid-way through the finished transactions: resume after the last entry
+        watermark = encode_cursor(issued, entries[-1].txid, entries[-1].id)
+    else:
+        watermark = encode_cursor(now, xmin, 0)
+
+    changed: Dict[str, Set[int]] = {}
+    for entry in entries:
+        changed.setdefault(entry.entity, set()).add(entry.entity_id)
+
+    result = SyncResponse(watermark=watermark, has_more=has_more)
+    _sync_events(session, changed.get("event", set()), result)
+    _sync_posts(session, changed.get("post", set()), result)
+    _sync_attendances(session, user_id, changed.get("attendance", set()), result)
+    _sync_reactions(session, user_id, changed, result)
+    return result
+
+
+def _sync_events(session: Session, ids: Set[int], result: SyncResponse) -> None:
+    if not ids:
+        return
+    events = session.exec(select(Event).where(Event.id.in_(ids)).order_by(Event.id)).all()
+    attendee_counts = dict(session.exec(
+        select(Attendance.event_id, func.count(Attendance.id))
+        .where(Attendance.event_id.in_(ids))
+        .group_by(Attendance.event_id)
+    ).all())
+    result.events = [
+        from_row(EventResponse, event, attendee_count=attendee_counts.get(event.id, 0)) for event in events
+    ]
+    result.deleted.events = sorted(ids - {event.id for event in events})
+
+
+def _sync_posts(session: Session, ids: Set[int], result: SyncResponse) -> None:
+    if not ids:
+        return
+    posts = session.exec(select(Post).where(Post.id.in_(ids)).order_by(Post.id)).all()
+    result.posts = [from_row(PostResponse, post) for post in posts]
+    result.deleted.posts = sorted(ids - {post.id for post in posts})
+
+
+def _sync_attendances(session: Session, user_id: int, event_ids: Set[int], result: SyncResponse) -> None:
+    if not event_ids:
+        return
+    attending = set(session.exec(
+        select(Attendance.event_id).where(Attendance.user_id == user_id, Attendance.event_id.in_(event_ids))
+    ).all())
+    result.attending = sorted(attending)
+    result.deleted.attending = sorted(event_ids - attending)
+
+
+def _sync_reactions(session: Session, user_id: int, changed: Dict[str, Set[int]], result: SyncResponse) -> None:
+    gone = {TargetType.EVENT: set(result.deleted.events), TargetType.POST: set(result.deleted.posts)}
+    targets = {
+        target_type: changed[entity] - gone[target_type]
+        for entity, target_type in REACTION_ENTITIES.items()
+        if changed.get(entity)
+    }
+    if not targets:
+        return
+    in_targets = or_(*(
+        (Reaction.target_type == target_type) & Reaction.target_id.in_(ids)
+        for target_type, ids in targets.items()
+    ))
+
+    counts: Dict[Tuple[TargetType, int], ReactionCounts] = {
+        (target_type, target_id): ReactionCounts()
+        for target_type, ids in targets.items() for target_id in ids
+    }
+    rows = session.exec(
+        select(Reaction.target_type, Reaction.target_id, Reaction.reaction_type, func.count(Reaction.id))
+        .where(in_targets)
+        .group_by(Reaction.target_type, Reaction.target_id, Reaction.reaction_type)
+    ).all()
+    for target_type, target_id, reaction_type, count in rows:
+        setattr(counts[(target_type, target_id)], reaction_type.value, count)
+
+    own = {
+        (target_type, target_id): reaction_type
+        for target_type, target_id, reaction_type in session.exec(
+            select(Reaction.target_type, Reaction.target_id, Reaction.reaction_type)
+            .where(in_targets, Reaction.user_id == user_id)
+        ).all()
+    }
+    result.reactions = [
+        SyncReactions(
+            target_type=target_type,
+            target_id=target_id,
+            counts=target_counts,
+            user_reaction=own.get((target_type, target_id))
+        )
+        for (target_type, target_id), target_counts in sorted(counts.items())
+    ]
+
+
+def prune_change_log(session: Session, retention_days: int) -> int:
+    """
+    Delete change log entries no watermark younger than retention_days
+    can still need, in batches of short transactions.
+
+    Returns:
+        Entries deleted
+    """
+    cutoff = datetime.utcnow() - timedelta(days=retention_days) - PRUNE_MARGIN
+    deleted = 0
+    while True:
+        batch = select(ChangeLogEntry.id).where(ChangeLogEntry.changed_at < cutoff).limit(PRUNE_BATCH_SIZE)
+        count = session.execute(delete(ChangeLogEntry).where(ChangeLogEntry.id.in_(batch.scalar_subquery()))).rowcount
+        session.commit()
+        deleted += count
+        if count < PRUNE_BATCH_SIZE:
+            return deleted
@@ -0,0 +1,54 @@
+"""Print organizer reports from the analytics snapshots.
+
+Usage:
+    python scripts/analytics_report.py attendance --limit 20
+    python scripts/analytics_report.py reactions --since 2026-01
+    python scripts/analytics_report.py postings --csv postings.csv
+
+Reports run over the Parquet files written by scripts/snapshot_analytics.py
+(app.services.reports), so they never touch the database.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import argparse
+import pyarrow.csv as pacsv
+from app.core.config import settings
+from app.services.reports import attendance_per_event, reactions_per_week, postings_by_union_status
+
+REPORTS = {
+    "attendance": attendance_per_event,
+    "reactions": reactions_per_week,
+    "postings": postings_by_union_status,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Print organizer reports from analytics snapshots")
+    parser.add_argument("report", choices=sorted(REPORTS))
+    parser.add_argument("--path", default=settings.ANALYTICS_PATH, help="Snapshot directory")
+    parser.add_argument("--since", help="First month to include (YYYY-MM)")
+    parser.add_argument("--limit", type=int, default=50, help="Rows to print")
+    parser.add_argument("--csv", help="Also write the full report to this CSV file")
+    args = parser.parse_args()
+
+    report = REPORTS[args.report](Path(args.path), args.since)
+    if args.csv:
+        pacsv.write_csv(report, args.csv)
+        print(f"💾 Wrote {report.num_rows:,} rows to {args.csv}")
+
+    rows = report.slice(0, args.limit).to_pylist()
+    widths = {name: max([len(name)] + [len(f"{row[name]}") for row in rows]) for name in report.column_names}
+    print("  ".join(name.ljust(widths[name]) for name in report.column_names))
+    for row in rows:
+        print("  ".join(f"{row[name]}".ljust(widths[name]) for name in report.column_names))
+    if report.num_rows > args.limit:
+        print(f"... {report.num_rows - args.limit:,} more rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Benchmark response compression: CPU cost against bytes saved, per endpoint.
+
+Usage:
+    python scripts/bench_compression.py --token <jwt>
+    python scripts/bench_compression.py --base-url https://api.example.org/api/v1 --bandwidth 0.5
+    python scripts/bench_compression.py --file feed.json --file events.json
+
+Fetches each endpoint's body uncompressed from a running API (or reads
+saved bodies with --file) and compresses it with every encoding and level
+the CompressionMiddleware supports, using the same compressors. For each,
+it reports the compressed size, milliseconds of CPU, and the estimated
+time to deliver the body at --bandwidth (CPU + transfer), to pick the
+COMPRESSION setting: the fastest total wins on slow mobile links, the
+lowest CPU on a busy server.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import argparse
+import statistics
+import time
+import httpx
+from app.core.compression import ENCODERS
+
+# Large list endpoints (paths under --base-url)
+ENDPOINTS = [
+    "/feed?limit=100",
+    "/events",
+    "/events?fields=card",
+    "/events/map",
+    "/unionized/?limit=100",
+    "/unionized/page?limit=100",
+]
+
+# Levels tried per encoding
+LEVELS = {
+    "gzip": [1, 4, 6, 9],
+    "br": [1, 4, 6, 9, 11],
+    "zstd": [1, 3, 6, 12, 19],
+}
+
+
+def fetch(base_url: str, token: str) -> dict:
+    """Uncompressed bodies of ENDPOINTS."""
+    headers = {"Accept-Encoding": "identity"}
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    bodies = {}
+    with httpx.Client(base_url=base_url, headers=headers, timeout=30) as client:
+        for path in ENDPOINTS:
+            response = client.get(path)
+            if response.status_code != 200:
+                print(f"⚠️  {path}: HTTP {response.status_code}, skipped")
+                continue
+            bodies[path] = response.content
+    return bodies
+
+
+def bench(body: bytes, encoding: str, level: int, repeats: int):
+    """Compressed size and median milliseconds to compress body."""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        compressed = ENCODERS[encoding](level)(body, True)
+        timings.append((time.perf_counter() - start) * 1000)
+    return len(compressed), statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark response compression")
+    parser.add_argument("--base-url", default="http://localhost:8000/api/v1")
+    parser.add_argument("--token", default="", help="Bearer token (the feed requires one)")
+    parser.add_argument("--file", action="append", default=[], help="Saved response body instead of fetching")
+    parser.add_argument("--bandwidth", type=float, default=1.0, help="Client bandwidth in Mbit/s")
+    parser.add_argument("--repeats", type=int, default=20, help="Runs per encoding and level")
+    args = parser.parse_args()
+
+    if args.file:
+        bodies = {path: Path(path).read_bytes() for path in args.file}
+    else:
+        bodies = fetch(args.base_url, args.token)
+
+    bytes_per_ms = args.bandwidth * 1_000_000 / 8 / 1000
+    available = []
+    for encoding, levels in LEVELS.items():
+        try:
+            ENCODERS[encoding](levels[0])(b"", True)
+        except ImportError:
+            print(f"⚠️  {encoding}: library not installed, skipped")
+            continue
+        available += [(encoding, level) for level in levels]
+
+    for path, body in bodies.items():
+        print(f"\n📦 {path}: {len(body):,} bytes, {len(body) / bytes_per_ms:,.0f} ms at {args.bandwidth} Mbit/s")
+        print(f"   {'encoding':<10} {'bytes':>10} {'ratio':>7} {'cpu ms':>8} {'total ms':>9}")
+        for encoding, level in available:
+            size, cpu = bench(body, encoding, level, args.repeats)
+            total = cpu + size / bytes_per_ms
+            print(f"   {encoding + ':' + str(level):<10} {size:>10,} {len(body) / size:>7.1f} {cpu:>8.2f} {total:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Compare JSON and MessagePack responses: size and decode time.
+
+Usage:
+    python scripts/bench_msgpack.py --token <jwt> --event-id 42
+
+Fetches the heaviest mobile responses from a running API twice, as JSON
+and as MessagePack (Accept: application/msgpack), and reports for both
+formats the raw and gzip-compressed size and the median time to decode
+them. "json+dates" is JSON decoding plus parsing the datetime fields
+(named *_at or *_date, as the mobile client does), which MessagePack
+timestamps make unnecessary. Decode times are CPython's; use them to
+compare the formats, not as mobile timings.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import argparse
+import gzip
+import statistics
+import time
+from datetime import datetime
+from typing import Any
+import httpx
+import msgpack
+import orjson
+from app.core.negotiation import MSGPACK_MEDIA_TYPE
+
+
+def endpoints(event_id: int) -> list:
+    """Paths of the heaviest mobile responses."""
+    return ["/feed?limit=100", "/events/map", f"/events/{event_id}/attendees/profiles"]
+
+
+def with_dates(value: Any) -> Any:
+    """Decoded JSON with its *_at and *_date fields parsed, as a client would."""
+    if isinstance(value, list):
+        return [with_dates(item) for item in value]
+    if isinstance(value, dict):
+        return {
+            key: datetime.fromisoformat(item)
+            if isinstance(item, str) and key.endswith(("_at", "_date")) else with_dates(item)
+            for key, item in value.items()
+        }
+    return value
+
+
+def fetch(base_url: str, token: str, paths: list, accept: str) -> dict:
+    """Bodies of paths in the accepted format."""
+    headers = {"Accept": accept, "Accept-Encoding": "identity"}
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    bodies = {}
+    with httpx.Client(base_url=base_url, headers=headers, timeout=30) as client:
+        for path in paths:
+            response = client.get(path)
+            if response.status_code != 200:
+                print(f"⚠️  {path}: HTTP {response.status_code}, skipped")
+                continue
+            bodies[path] = response.content
+    return bodies
+
+
+def median_ms(function, repeats: int) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare JSON and MessagePack responses")
+    parser.add_argument("--base-url", default="http://localhost:8000/api/v1")
+    parser.add_argument("--token", default="", help="Bearer token (the feed requires one)")
+    parser.add_argument("--event-id", type=int, default=1, help="Event whose attendee list to fetch")
+    parser.add_argument("--repeats", type=int, default=50, help="Decodes per format")
+    args = parser.parse_args()
+
+    paths = endpoints(args.event_id)
+    bodies = fetch(args.base_url, args.token, paths, "application/json")
+    packed_bodies = fetch(args.base_url, args.token, paths, MSGPACK_MEDIA_TYPE)
+
+    for path, body in bodies.items():
+        packed = packed_bodies.get(path)
+        if packed is None:
+            continue
+        print(f"\n📦 {path}")
+        print(f"   {'format':<11} {'bytes':>10} {'gzip bytes':>11} {'decode ms':>10}")
+        rows = [
+            ("json", body, lambda: orjson.loads(body)),
+            ("json+dates", body, lambda: with_dates(orjson.loads(body))),
+            ("msgpack", packed, lambda: msgpack.unpackb(packed, timestamp=3)),
+        ]
+        for name, data, decode in rows:
+            compressed = len(gzip.compress(data, compresslevel=6))
+            print(f"   {name:<11} {len(data):>10,} {compressed:>11,} {median_ms(decode, args.repeats):>10.3f}")
+        print(f"   ✅ msgpack is {len(packed) / len(body):.0%} of the JSON size")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Benchmark profile directory search against a large synthetic table.
+
+Usage:
+    python scripts/bench_profile_search.py --rows 1000000 --load
+    python scripts/bench_profile_search.py --repeats 1000
+
+--load appends synthetic users and profiles to the configured DATABASE_URL,
+so point it at a scratch database. Every scenario runs the same queries
+GET /profiles/search does (app.services.profile_search) and reports latency
+percentiles; typeahead needs p99 well under 20 ms.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import argparse
+import statistics
+import time
+from sqlalchemy import text
+from sqlmodel import Session, create_engine
+from app.models import ProfileType
+from app.core.config import settings
+from app.services.profile_search import search_profiles
+
+# Create engine
+engine = create_engine(settings.DATABASE_URL, echo=False)
+
+LOAD_BATCH = 100_000
+
+# Users first (profiles.user_id is unique), then one profile per user
+LOAD_USERS_SQL = text("""
+    INSERT INTO users (email, hashed_password, created_at, updated_at)
+    SELECT 'bench' || i || '@example.org', 'x', now(), now()
+    FROM generate_series(:start, :stop) AS i
+""")
+LOAD_PROFILES_SQL = text("""
+    INSERT INTO profiles (user_id, name, causes, profile_type, created_at, updated_at)
+    SELECT
+        u.id,
+        (ARRAY['East Oakland', 'Mission', 'Southside', 'Harbor', 'Northgate', 'Riverside',
+               'Maple', 'Union Square', 'Westlake', 'Bayview'])[1 + u.id % 10]
+        || ' ' ||
+        (ARRAY['Tenants Union', 'Food Not Bombs', 'Mutual Aid', 'Workers Center',
+               'Climate Coalition', 'Parents Network', 'Youth Collective'])[1 + (u.id / 10) % 7]
+        || ' ' || u.id,
+        jsonb_build_array(
+            (ARRAY['Housing Justice', 'Food Security', 'Climate Action', 'Workers Rights',
+                   'Education', 'Immigrant Rights'])[1 + u.id % 6],
+            (ARRAY['Mutual Aid', 'Disability Justice', 'Public Transit'])[1 + u.id % 3]
+        ),
+        (ARRAY['INDIVIDUAL', 'GROUP'])[1 + (u.id % 5 = 0)::int]::profiletype,
+        now(),
+        now()
+    FROM users AS u
+    WHERE u.email LIKE 'bench%@example.org'
+      AND NOT EXISTS (SELECT 1 FROM profiles AS p WHERE p.user_id = u.id)
+""")
+
+SCENARIOS = [
+    ("first keystroke", {"q": "e"}),
+    ("prefix", {"q": "east oak"}),
+    ("word inside name", {"q": "tenan"}),
+    ("no match", {"q": "zzzz"}),
+    ("prefix + cause", {"q": "mission", "causes": ["Housing Justice"]}),
+    ("prefix + groups", {"q": "harbor", "profile_type": ProfileType.GROUP}),
+    ("cause only", {"causes": ["Climate Action", "Public Transit"]}),
+]
+
+
+def load(rows: int) -> None:
+    """Append synthetic users and profiles in batches."""
+    with engine.begin() as conn:
+        start = conn.execute(text("SELECT coalesce(max(id), 0) FROM users")).scalar() + 1
+    for offset in range(0, rows, LOAD_BATCH):
+        stop = min(offset + LOAD_BATCH, rows)
+        t0 = time.perf_counter()
+        with engine.begin() as conn:
+            conn.execute(LOAD_USERS_SQL, {"start": start + offset, "stop": start + stop - 1})
+            conn.execute(LOAD_PROFILES_SQL)
+        print(f"   loaded {stop:,}/{rows:,} profiles ({time.perf_counter() - t0:.1f}s)")
+    with engine.begin() as conn:
+        conn.execute(text("ANALYZE users"))
+        conn.execute(text("ANALYZE profiles"))
+
+
+def run(repeats: int, limit: int) -> None:
+    """Time every scenario and print latency percentiles."""
+    with Session(engine) as session:
+        total = session.execute(text("SELECT count(*) FROM profiles")).scalar()
+        print(f"📊 {total:,} profiles, {limit} cards, {repeats} runs per scenario\n")
+        print(f"{'scenario':<20} {'rows':>5} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+
+        for name, filters in SCENARIOS:
+            timings = []
+            for _ in range(repeats):
+                t0 = time.perf_counter()
+                cards = search_profiles(session, limit=limit, **filters)
+                timings.append((time.perf_counter() - t0) * 1000)
+            timings.sort()
+            p99 = timings[min(len(timings) - 1, int(len(timings) * 0.99))]
+            print(
+                f"{name:<20} {len(cards):>5} {statistics.median(timings):>8.2f} "
+                f"{p99:>8.2f} {timings[-1]:>8.2f}"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark profile directory search")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Profiles to load with --load")
+    parser.add_argument("--load", action="store_true", help="Append synthetic profiles first")
+    parser.add_argument("--repeats", type=int, default=200, help="Runs per scenario")
+    parser.add_argument("--limit", type=int, default=10, help="Cards per search")
+    args = parser.parse_args()
+
+    if args.load:
+        print(f"🌱 Loading {args.rows:,} synthetic profiles...")
+        load(args.rows)
+
+    run(args.repeats, args.limit)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""Benchmark response serialization for large list endpoints.
+
+Usage:
+    python scripts/bench_serialization.py
+    python scripts/bench_serialization.py --items 5000 --repeats 50
+
+Builds synthetic EventResponse, FeedItem and FairWorkPostingResponse lists
+(no database needed) and times turning each into a response body:
+
+    response_model  FastAPI's path: validate against response_model again,
+                    convert to plain Python, encode with stdlib json
+    orjson          the same path with ORJSONResponse (the app default)
+    trusted         TrustedJSONResponse: one pydantic-core dump_json
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import datetime, timedelta
+from typing import List
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from app.models import ProfileType, EmploymentType, UnionStatus
+from app.schemas import EventResponse, FeedItem, FairWorkPostingResponse, ProfileResponse
+from app.core.serialization import TrustedJSONResponse
+
+NOW = datetime(2026, 1, 1, 12, 0)
+
+
+def make_events(count: int) -> List[EventResponse]:
+    return [
+        EventResponse(
+            id=i,
+            creator_id=i % 500,
+            title=f"Tenant meeting {i}",
+            description="Monthly meeting of the building association. " * 4,
+            event_date=NOW + timedelta(days=i % 90),
+            location="East Oakland Community Center",
+            latitude=37.77,
+            longitude=-122.2,
+            tags=["housing", "tenants"],
+            attendee_count=i % 40,
+            created_at=NOW,
+            updated_at=NOW,
+        )
+        for i in range(count)
+    ]
+
+
+def make_feed(count: int) -> List[FeedItem]:
+    creator = ProfileResponse(
+        id=1,
+        user_id=1,
+        name="East Oakland Tenants Union",
+        bio="Organizing tenants since 2009.",
+        location="Oakland, CA",
+        causes=["Housing Justice", "Mutual Aid"],
+        profile_type=ProfileType.GROUP,
+        email="tenants@example.org",
+        created_at=NOW,
+        updated_at=NOW,
+    )
+    reactions = [{"reaction_type": "SUPPORT", "count": 12, "user_reacted": True}]
+    return [
+        FeedItem(
+            type="post",
+            id=i,
+            creator=creator,
+            created_at=NOW - timedelta(minutes=i),
+            text="Rent strike update: the landlord agreed to meet on Friday. " * 2,
+            reactions=reactions,
+        )
+        for i in range(count)
+    ]
+
+
+def make_postings(count: int) -> List[FairWorkPostingResponse]:
+    return [
+        FairWorkPostingResponse(
+            id=i,
+            title="Warehouse Associate",
+            organization="Bay Area Food Co-op",
+            location="Oakland, CA",
+            latitude=37.8,
+            longitude=-122.27,
+            wage_min=24.0,
+            wage_max=29.5,
+            wage_text="$24-29.50/hr",
+            employment_type=EmploymentType.FULL_TIME,
+            union_status=UnionStatus.UNIONIZED,
+            description="Receive, stock and ship orders for member stores. " * 3,
+            worker_notes="Shift differential for nights.",
+            application_url="https://example.org/jobs",
+            posted_date=NOW,
+            created_at=NOW,
+            updated_at=NOW,
+        )
+        for i in range(count)
+    ]
+
+
+def time_it(function, repeats: int) -> List[float]:
+    """Milliseconds per call."""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark response serialization")
+    parser.add_argument("--items", type=int, default=1000, help="Items per list")
+    parser.add_argument("--repeats", type=int, default=30, help="Runs per scenario")
+    args = parser.parse_args()
+
+    loop = asyncio.new_event_loop()
+    lists = [
+        ("EventResponse", EventResponse, make_events(args.items)),
+        ("FeedItem", FeedItem, make_feed(args.items)),
+        ("FairWorkPostingResponse", FairWorkPostingResponse, make_postings(args.items)),
+    ]
+
+    print(f"📦 {args.items} items per list, {args.repeats} runs per scenario (ms)")
+    for name, model, items in lists:
+        schema = list[model]
+        field = create_response_field(name=f"Response_{name}", type_=schema)
+
+        def response_model_path(response_class):
+            content = loop.run_until_complete(
+                serialize_response(field=field, response_content=items, is_coroutine=True)
+            )
+            return response_class(content).body
+
+        scenarios = {
+            "response_model": lambda: response_model_path(JSONResponse),
+            "orjson": lambda: response_model_path(ORJSONResponse),
+            "trusted": lambda: TrustedJSONResponse(items, schema).body,
+        }
+        # Same document either way (stdlib json only differs in whitespace)
+        assert scenarios["orjson"]() == scenarios["trusted"](), f"{name}: trusted output differs"
+
+        print(f"\n{name}")
+        baseline = None
+        for scenario, function in scenarios.items():
+            timings = time_it(function, args.repeats)
+            median = statistics.median(timings)
+            baseline = baseline or median
+            print(f"   {scenario:<15} median {median:8.2f}   min {min(timings):8.2f}   x{baseline / median:5.1f}")
+
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
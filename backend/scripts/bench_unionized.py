@@ -0,0 +1,157 @@
+"""Benchmark Unionized posting queries against a large synthetic table.
+
+Usage:
+    python scripts/bench_unionized.py --rows 1000000 --load
+    python scripts/bench_unionized.py --explain
+
+--load appends synthetic postings to fair_work_postings in the configured
+DATABASE_URL, so point it at a scratch database. Every scenario runs the same
+query the API builds (app.services.postings) and reports latency percentiles.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import argparse
+import statistics
+import time
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+from sqlmodel import Session, create_engine, select
+from app.models import FairWorkPosting, EmploymentType, UnionStatus
+from app.core.config import settings
+from app.services.postings import filter_postings, posting_facets
+
+# Create engine
+engine = create_engine(settings.DATABASE_URL, echo=False)
+
+LOAD_BATCH = 100_000
+
+# Synthetic rows built server-side from small vocabularies
+LOAD_SQL = text("""
+    INSERT INTO fair_work_postings (
+        title, organization, location, wage_min, wage_max, wage_text,
+        employment_type, union_status, description, posted_date, created_at, updated_at
+    )
+    SELECT
+        (ARRAY['Line Cook', 'Warehouse Associate', 'Home Care Aide', 'Bus Operator',
+               'Barista', 'Nurse Assistant', 'Electrician Apprentice', 'Teacher Aide',
+               'Delivery Driver', 'Custodian'])[1 + i % 10] || ' ' || (i % 997) || ' #' || i,
+        (ARRAY['Local 2 Hotel Workers', 'Teamsters Local 70', 'SEIU 1021', 'Oakland Co-op',
+               'Bay Transit', 'Mission Bakery Collective', 'IBEW Local 6', 'City Schools'])[1 + i % 8],
+        (ARRAY['Oakland, CA', 'Brooklyn, NY', 'Chicago, IL', 'Detroit, MI', 'Houston, TX',
+               'Seattle, WA', 'Portland, OR', 'Atlanta, GA', 'Denver, CO', 'Boston, MA'])[1 + (i / 7) % 10],
+        15 + (i % 30),
+        20 + (i % 40),
+        '$' || (15 + i % 30) || '-' || (20 + i % 40) || '/hr',
+        (ARRAY['FULL_TIME', 'PART_TIME', 'CONTRACT', 'GIG'])[1 + i % 4]::employmenttype,
+        (ARRAY['UNIONIZED', 'UNION_FRIENDLY', 'NOT_LISTED'])[1 + (i / 3) % 3]::unionstatus,
+        'Synthetic posting for benchmarking.',
+        now() - make_interval(mins => i),
+        now(),
+        now()
+    FROM generate_series(:start, :stop) AS i
+""")
+
+SCENARIOS = [
+    ("newest first", {}),
+    ("union_status", {"union_status": UnionStatus.UNIONIZED}),
+    ("employment_type + union_status", {
+        "employment_type": EmploymentType.FULL_TIME,
+        "union_status": UnionStatus.UNIONIZED,
+    }),
+    ("location substring", {"location": "Oakland"}),
+    ("q exact", {"q": "Oakland"}),
+    ("q with typo", {"q": "Oakand"}),
+    ("q + filters", {
+        "q": "Teamstrs",
+        "employment_type": EmploymentType.PART_TIME,
+        "union_status": UnionStatus.UNIONIZED,
+    }),
+    ("union jobs paying >= $25", {"union_status": UnionStatus.UNIONIZED, "min_wage": 25}),
+    ("wage overlap $20-$30", {"min_wage": 20, "max_wage": 30}),
+]
+
+
+def load(rows: int) -> None:
+    """Append synthetic postings in batches."""
+    with engine.begin() as conn:
+        start = conn.execute(text("SELECT coalesce(max(id), 0) FROM fair_work_postings")).scalar() + 1
+    for offset in range(0, rows, LOAD_BATCH):
+        stop = min(offset + LOAD_BATCH, rows)
+        t0 = time.perf_counter()
+        with engine.begin() as conn:
+            conn.execute(LOAD_SQL, {"start": start + offset, "stop": start + stop - 1})
+        print(f"   loaded {stop:,}/{rows:,} rows ({time.perf_counter() - t0:.1f}s)")
+    with engine.begin() as conn:
+        conn.execute(text("ANALYZE fair_work_postings"))
+
+
+def build_query(filters: dict, limit: int):
+    """Build the same query GET /unionized/ runs."""
+    query = filter_postings(select(FairWorkPosting), **filters)
+    return query.order_by(FairWorkPosting.posted_date.desc(), FairWorkPosting.id.desc()).limit(limit)
+
+
+def timed(fn, repeats: int):
+    """Run fn repeats times; return (last result, sorted timings in ms)."""
+    timings = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        result = fn()
+        timings.append((time.perf_counter() - t0) * 1000)
+    timings.sort()
+    return result, timings
+
+
+def summary(timings) -> str:
+    p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+    return f"{statistics.median(timings):>8.2f} {p95:>8.2f} {timings[-1]:>8.2f}"
+
+
+def run(repeats: int, limit: int, explain: bool) -> None:
+    """Time every scenario and print latency percentiles."""
+    with Session(engine) as session:
+        total = session.execute(text("SELECT count(*) FROM fair_work_postings")).scalar()
+        print(f"📊 {total:,} postings, page size {limit}, {repeats} runs per scenario\n")
+        print(f"{'scenario':<34} {'rows':>5} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8}")
+
+        for name, filters in SCENARIOS:
+            query = build_query(filters, limit)
+            rows, timings = timed(lambda: session.exec(query).all(), repeats)
+            print(f"{name:<34} {len(rows):>5} {summary(timings)}")
+
+            if explain:
+                compiled = query.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+                # Sent without parameters, so undo the pyformat %-escaping
+                sql = str(compiled).replace("%%", "%")
+                plan = session.connection().exec_driver_sql(f"EXPLAIN (ANALYZE, BUFFERS) {sql}").all()
+                print("\n".join(f"      {line[0]}" for line in plan) + "\n")
+
+        print(f"\n{'facets':<34} {'':>5} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8}")
+        for name, filters in SCENARIOS:
+            _, timings = timed(lambda: posting_facets(session, **filters), repeats)
+            print(f"{name:<34} {'':>5} {summary(timings)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Unionized posting queries")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Rows to load with --load")
+    parser.add_argument("--load", action="store_true", help="Append synthetic postings first")
+    parser.add_argument("--repeats", type=int, default=20, help="Runs per scenario")
+    parser.add_argument("--limit", type=int, default=50, help="Page size")
+    parser.add_argument("--explain", action="store_true", help="Print EXPLAIN ANALYZE for each scenario")
+    args = parser.parse_args()
+
+    if args.load:
+        print(f"🌱 Loading {args.rows:,} synthetic postings...")
+        load(args.rows)
+
+    run(args.repeats, args.limit, args.explain)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Compile GeoNames dumps into the memory-mapped gazetteer index.
+
+Usage:
+    python scripts/build_gazetteer.py
+    python scripts/build_gazetteer.py /path/to/geonames --out /var/lib/riseup/gazetteer.idx
+
+The directory holds cities files (cities15000.txt, allCountries.txt ...),
+postal code dumps renamed to postcodes*.txt and optionally
+admin1CodesASCII.txt, all from https://download.geonames.org/export/.
+The source and output default to GAZETTEER_PATH (or the bundled sample)
+and GAZETTEER_INDEX, the files the API reads. Run it when deploying: the
+API only builds a missing or stale index at startup, never per request.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import argparse
+import time
+from app.core.config import settings
+from app.services.geocoder import DATA_DIR, build_index, index_path, read_sources, source_files
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the offline gazetteer index")
+    parser.add_argument(
+        "source", nargs="?", default=settings.GAZETTEER_PATH or str(DATA_DIR), help="Directory of GeoNames .txt files"
+    )
+    parser.add_argument("--out", default=str(index_path()), help="Index file to write")
+    args = parser.parse_args()
+
+    cities, postcodes, admin1 = source_files(Path(args.source))
+    if not cities and not postcodes:
+        print(f"❌ No GeoNames files in {args.source}")
+        sys.exit(1)
+
+    started = time.perf_counter()
+    count = build_index(read_sources(cities, postcodes, admin1), Path(args.out))
+    print(f"✅ Wrote {count:,} entries to {args.out} in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Check people in to an event from a list of user ids and/or emails.
+
+Usage:
+    python scripts/bulk_checkin.py EVENT_ID attendees.txt
+
+The file holds one user id or email per line (blank lines and lines starting
+with # are ignored). Use "-" to read from stdin.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import argparse
+from sqlmodel import Session, create_engine
+from app.models import Event
+from app.core.config import settings
+from app.schemas import CheckInStatus
+from app.services.attendance import bulk_check_in
+
+# Create engine
+engine = create_engine(settings.DATABASE_URL, echo=False)
+
+
+def read_entries(lines):
+    """Split input lines into user ids and emails."""
+    user_ids, emails, skipped = [], [], []
+    for line in lines:
+        value = line.strip()
+        if not value or value.startswith("#"):
+            continue
+        if value.isdigit():
+            user_ids.append(int(value))
+        elif "@" in value:
+            emails.append(value)
+        else:
+            skipped.append(value)
+    return user_ids, emails, skipped
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk check-in for an event")
+    parser.add_argument("event_id", type=int, help="Event to check people in to")
+    parser.add_argument("path", help="File with one user id or email per line, or - for stdin")
+    parser.add_argument("--quiet", action="store_true", help="Only print totals")
+    args = parser.parse_args()
+
+    if args.path == "-":
+        user_ids, emails, skipped = read_entries(sys.stdin)
+    else:
+        with open(args.path, encoding="utf-8") as f:
+            user_ids, emails, skipped = read_entries(f)
+
+    for value in skipped:
+        print(f"⚠️  Skipping unrecognised line: {value}")
+
+    with Session(engine) as session:
+        if not session.get(Event, args.event_id):
+            print(f"❌ Event {args.event_id} not found")
+            sys.exit(1)
+
+        report = bulk_check_in(session, args.event_id, user_ids, emails)
+
+    if not args.quiet:
+        for row in report.results:
+            if row.status != CheckInStatus.CHECKED_IN:
+                print(f"   {row.input}: {row.status.value}")
+
+    print(f"✅ Checked in {report.checked_in}")
+    print(f"   Already attending: {report.already_attending}")
+    print(f"   Unknown users: {report.unknown_user}")
+    print(f"   Duplicates in list: {report.duplicate}")
+
+
+if __name__ == "__main__":
+    main()
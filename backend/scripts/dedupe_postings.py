@@ -0,0 +1,126 @@
+"""Index existing fair work postings for deduplication and flag near-duplicates.
+
+Usage:
+    python scripts/dedupe_postings.py
+    python scripts/dedupe_postings.py --reset --delete
+
+Canonical postings that have not been indexed yet (or all of them, with
+--reset) are checked oldest first through the MinHash band table, so the
+job never compares every pair. Flagged postings stay in the table (hidden
+from listings) unless --delete is given. Postings that share another
+posting's natural key (organization, title, location) keep their flag.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import argparse
+import time
+from datetime import datetime
+from typing import List, Tuple
+from sqlalchemy import delete, exists, update
+from sqlmodel import Session, create_engine, select
+from app.models import FairWorkPosting, FairWorkPostingBand
+from app.core.cache import invalidate, model_tag
+from app.core.config import settings
+from app.services.posting_dedupe import flag_duplicates
+from app.services.job_matching import refresh_posting_matches
+
+# Create engine
+engine = create_engine(settings.DATABASE_URL, echo=False)
+
+
+def flag_all(session: Session, batch_size: int, everything: bool) -> Tuple[int, int]:
+    """
+    Walk canonical postings oldest first, indexing them and flagging near-duplicates.
+
+    Without everything, only postings that have no LSH bands yet are
+    visited (those created before deduplication existed). Event matches
+    and cached responses of flagged postings are refreshed per batch.
+
+    Returns:
+        (postings checked, postings flagged)
+    """
+    checked = flagged = 0
+    last_id = 0
+    while True:
+        statement = (
+            select(
+                FairWorkPosting.id, FairWorkPosting.title, FairWorkPosting.organization,
+                FairWorkPosting.location, FairWorkPosting.description,
+            )
+            .where(FairWorkPosting.duplicate_of_id.is_(None), FairWorkPosting.id > last_id)
+            .order_by(FairWorkPosting.id)
+            .limit(batch_size)
+        )
+        if not everything:
+            statement = statement.where(
+                ~exists().where(FairWorkPostingBand.posting_id == FairWorkPosting.id)
+            )
+        rows = session.exec(statement).all()
+        if not rows:
+            return checked, flagged
+        flagged_ids = list(flag_duplicates(session, [(row.id, row._asdict()) for row in rows]))
+        refresh_posting_matches(session, flagged_ids)
+        session.commit()
+        invalidate_postings(flagged_ids)
+        flagged += len(flagged_ids)
+        checked += len(rows)
+        last_id = rows[-1].id
+        print(f"   checked {checked:,} postings, {flagged:,} near-duplicates")
+
+
+def invalidate_postings(posting_ids: List[int]) -> None:
+    """Drop cached listings and details of postings whose flags changed."""
+    if posting_ids:
+        invalidate(model_tag(FairWorkPosting), *(model_tag(FairWorkPosting, posting_id) for posting_id in posting_ids))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Flag near-duplicate fair work postings")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Postings per batch and commit")
+    parser.add_argument("--reset", action="store_true", help="Clear existing flags and re-check everything")
+    parser.add_argument("--delete", action="store_true", help="Delete flagged duplicates afterwards")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    with Session(engine) as session:
+        if args.reset:
+            # Natural-key duplicates keep pointing at their key owner
+            cleared = session.execute(
+                update(FairWorkPosting)
+                .where(FairWorkPosting.duplicate_of_id.is_not(None), ~FairWorkPosting.key_duplicate)
+                .values(duplicate_of_id=None, updated_at=datetime.utcnow())
+                .returning(FairWorkPosting.id)
+            ).scalars().all()
+            refresh_posting_matches(session, cleared)
+            session.commit()
+            invalidate_postings(cleared)
+            print(f"🔄 Cleared {len(cleared)} near-duplicate flags")
+
+        print("🧹 Flagging near-duplicates...")
+        checked, flagged = flag_all(session, args.batch_size, everything=args.reset)
+
+        deleted = 0
+        if args.delete:
+            deleted_ids = session.execute(
+                delete(FairWorkPosting)
+                .where(FairWorkPosting.duplicate_of_id.is_not(None))
+                .returning(FairWorkPosting.id)
+            ).scalars().all()
+            session.commit()
+            invalidate_postings(deleted_ids)
+            deleted = len(deleted_ids)
+
+    print(f"✅ Done in {time.perf_counter() - started:.1f}s")
+    print(f"   Checked: {checked}")
+    print(f"   Flagged as near-duplicates: {flagged}")
+    if args.delete:
+        print(f"   Deleted: {deleted}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Geocode existing events, profiles and fair work postings that have no coordinates.
+
+Usage:
+    python scripts/geocode_backfill.py
+    python scripts/geocode_backfill.py --table postings --batch-size 5000
+
+Rows are read in id order, resolved in bulk against the offline gazetteer
+(app.services.geocoder) and written back with one UPDATE ... FROM (VALUES)
+per batch. Rows whose location cannot be resolved are left as they are.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import argparse
+import time
+from datetime import datetime
+from typing import List, Tuple
+from sqlalchemy import Float, Integer, column, update, values
+from sqlmodel import Session, create_engine, select
+from app.models import Event, FairWorkPosting, Profile
+from app.core.config import settings
+from app.services.geocoder import ensure_index, geocode_many, get_gazetteer
+from app.services.job_matching import is_labor_tagged, refresh_event_matches, refresh_posting_matches
+
+# Create engine
+engine = create_engine(settings.DATABASE_URL, echo=False)
+
+TABLES = {"events": Event, "profiles": Profile, "postings": FairWorkPosting}
+
+
+def backfill(session: Session, model, batch_size: int) -> Tuple[int, int, List[int]]:
+    """
+    Geocode rows of one table that have a location but no coordinates.
+
+    Returns:
+        (rows checked, rows geocoded, ids of geocoded rows)
+    """
+    checked = 0
+    geocoded: List[int] = []
+    last_id = 0
+    while True:
+        rows = session.exec(
+            select(model.id, model.location)
+            .where(
+                model.id > last_id,
+                model.location.is_not(None),
+                (model.latitude.is_(None)) | (model.longitude.is_(None)),
+            )
+            .order_by(model.id)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            return checked, len(geocoded), geocoded
+
+        found = [
+            (row.id, place.latitude, place.longitude)
+            for row, place in zip(rows, geocode_many(row.location for row in rows))
+            if place
+        ]
+        if found:
+            points = values(
+                column("id", Integer), column("latitude", Float), column("longitude", Float), name="points"
+            ).data(found)
+            session.execute(
+                update(model)
+                .where(model.id == points.c.id)
+                .values(latitude=points.c.latitude, longitude=points.c.longitude, updated_at=datetime.utcnow())
+                .execution_options(synchronize_session=False)
+            )
+            session.commit()
+        checked += len(rows)
+        geocoded.extend(row_id for row_id, _, _ in found)
+        last_id = rows[-1].id
+        print(f"   checked {checked:,} rows, geocoded {len(geocoded):,}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Geocode stored locations offline")
+    parser.add_argument("--table", choices=sorted(TABLES), action="append", help="Only these tables (repeatable)")
+    parser.add_argument("--batch-size", type=int, default=2000, help="Rows per batch and commit")
+    args = parser.parse_args()
+
+    ensure_index()
+    print(f"📥 Gazetteer: {len(get_gazetteer()):,} index entries")
+    with Session(engine) as session:
+        for name in args.table or sorted(TABLES):
+            print(f"🔄 Geocoding {name}...")
+            started = time.perf_counter()
+            checked, count, ids = backfill(session, TABLES[name], args.batch_size)
+            print(f"✅ {name}: {count}/{checked} geocoded in {time.perf_counter() - started:.1f}s")
+
+            # Newly placed rows can now be matched to nearby labor events
+            if name == "postings" and ids:
+                refresh_posting_matches(session, ids)
+                session.commit()
+            elif name == "events" and ids:
+                events = session.exec(select(Event.id, Event.tags).where(Event.id.in_(ids))).all()
+                refresh_event_matches(session, [e.id for e in events if is_labor_tagged(e.tags)])
+                session.commit()
+            if ids and name != "profiles":
+                print("🔗 Refreshed event/job matches")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Bulk import fair work postings from an NDJSON or CSV file.
+
+Usage:
+    python scripts/import_postings.py postings.csv
+    python scripts/import_postings.py - --format ndjson < postings.ndjson
+
+Rows are upserted on (organization, title, location), so re-running an
+import only writes postings that are new or changed.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import argparse
+from sqlmodel import Session, create_engine
+from app.core.config import settings
+from app.schemas import PostingImportFormat
+from app.services.posting_import import CHUNK_SIZE, detect_format, read_records, import_postings
+
+# Create engine
+engine = create_engine(settings.DATABASE_URL, echo=False)
+
+
+def progress(report):
+    print(f"   {report.received:,} rows, {report.rows_per_second:,.0f} rows/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk import fair work postings")
+    parser.add_argument("path", help="NDJSON or CSV file, or - for stdin")
+    parser.add_argument(
+        "--format", choices=[f.value for f in PostingImportFormat],
+        help="File format (default: from the file extension)"
+    )
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="Rows per upsert and commit")
+    parser.add_argument("--quiet", action="store_true", help="Only print totals")
+    args = parser.parse_args()
+
+    fmt = PostingImportFormat(args.format) if args.format else detect_format(args.path)
+    if fmt is None:
+        print("❌ Unknown file format; pass --format ndjson or --format csv")
+        sys.exit(1)
+
+    print(f"📥 Importing {args.path} ({fmt.value})...")
+    with Session(engine) as session:
+        if args.path == "-":
+            report = import_postings(
+                session, read_records(sys.stdin, fmt), args.chunk_size,
+                on_chunk=None if args.quiet else progress
+            )
+        else:
+            with open(args.path, encoding="utf-8-sig", newline="") as f:
+                report = import_postings(
+                    session, read_records(f, fmt), args.chunk_size,
+                    on_chunk=None if args.quiet else progress
+                )
+
+    if not args.quiet:
+        for error in report.errors:
+            print(f"   line {error.line}: {error.error}")
+        if report.failed > len(report.errors):
+            print(f"   ... and {report.failed - len(report.errors)} more errors")
+
+    print(f"✅ Imported {report.received:,} rows in {report.elapsed_seconds:.1f}s "
+          f"({report.rows_per_second:,.0f} rows/s)")
+    print(f"   Inserted: {report.inserted}")
+    print(f"   Updated: {report.updated}")
+    print(f"   Unchanged: {report.unchanged}")
+    print(f"   Failed: {report.failed}")
+    print(f"   Flagged as near-duplicates: {report.duplicates}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Delete change log entries that no valid /sync watermark still needs.
+
+Usage:
+    python scripts/prune_change_log.py
+    python scripts/prune_change_log.py --days 14
+
+Run daily, e.g. from cron:
+
+    30 4 * * *  cd /app && python scripts/prune_change_log.py
+
+Watermarks older than CHANGE_LOG_RETENTION_DAYS get 410 Gone from /sync,
+and their clients refetch their lists. Entries are deleted in short
+batches, so writers to the synced tables are not held up.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import argparse
+import time
+from sqlmodel import Session, create_engine
+from app.core.config import settings
+from app.services.sync import prune_change_log
+
+# Create engine
+engine = create_engine(settings.DATABASE_URL, echo=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prune the /sync change log")
+    parser.add_argument(
+        "--days", type=int, default=settings.CHANGE_LOG_RETENTION_DAYS,
+        help="Days watermarks stay valid (default: CHANGE_LOG_RETENTION_DAYS)"
+    )
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    print(f"🧹 Pruning change log entries no watermark younger than {args.days} days needs...")
+    with Session(engine) as session:
+        deleted = prune_change_log(session, args.days)
+    print(f"✅ Deleted {deleted:,} entries in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
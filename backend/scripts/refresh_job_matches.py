@@ -0,0 +1,54 @@
+"""Recompute job posting matches for every upcoming labor event.
+
+Usage:
+    python scripts/refresh_job_matches.py
+
+Matches are normally kept current as events and postings change; run this
+after a migration, after backfilling coordinates, or on a schedule to drop
+matches of events that have passed.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import time
+from sqlalchemy import delete, func
+from sqlmodel import Session, create_engine, select
+from app.models import Event, EventPostingMatch
+from app.core.config import settings
+from app.services.job_matching import labor_event_conditions, refresh_event_matches
+
+# Create engine
+engine = create_engine(settings.DATABASE_URL, echo=False)
+
+BATCH_SIZE = 100
+
+
+def main():
+    started = time.perf_counter()
+    with Session(engine) as session:
+        event_ids = session.exec(select(Event.id).where(*labor_event_conditions()).order_by(Event.id)).all()
+        print(f"🔗 Matching postings to {len(event_ids)} upcoming labor events...")
+
+        # Events that no longer qualify (past, untagged) lose their matches
+        stale = session.execute(
+            delete(EventPostingMatch).where(EventPostingMatch.event_id.not_in(event_ids))
+        ).rowcount
+        session.commit()
+
+        for start in range(0, len(event_ids), BATCH_SIZE):
+            refresh_event_matches(session, event_ids[start:start + BATCH_SIZE])
+            session.commit()
+
+        matches = session.exec(select(func.count()).select_from(EventPostingMatch)).one()
+
+    print(f"✅ Done in {time.perf_counter() - started:.1f}s")
+    print(f"   Matches: {matches}")
+    print(f"   Stale matches removed: {stale}")
+
+
+if __name__ == "__main__":
+    main()
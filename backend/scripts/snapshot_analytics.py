@@ -0,0 +1,53 @@
+"""Write incremental Parquet snapshots of events, attendances, reactions and postings.
+
+Usage:
+    python scripts/snapshot_analytics.py
+    python scripts/snapshot_analytics.py --table attendances --table reactions
+    python scripts/snapshot_analytics.py --full
+
+Meant to run on a schedule, e.g. hourly from cron, with a weekly --full:
+
+    15 * * * *  cd /app && python scripts/snapshot_analytics.py
+    45 3 * * 0  cd /app && python scripts/snapshot_analytics.py --full
+
+Each run appends the rows inserted or changed since the last one as
+<ANALYTICS_PATH>/<table>/month=YYYY-MM/part-<time>.parquet and records
+its watermarks in _state.json. Deleted attendances and reactions only
+disappear on a --full run. Rows are read in a read-only transaction from
+ANALYTICS_DATABASE_URL (point it at a read replica) or DATABASE_URL.
+Run reports over the files with scripts/analytics_report.py.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import argparse
+import time
+from sqlmodel import create_engine
+from app.core.config import settings
+from app.services.analytics import TABLES, run_snapshot
+
+# Create engine
+engine = create_engine(settings.ANALYTICS_DATABASE_URL or settings.DATABASE_URL, echo=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write Parquet snapshots for organizer reports")
+    parser.add_argument("--path", default=settings.ANALYTICS_PATH, help="Snapshot directory")
+    parser.add_argument("--table", action="append", choices=sorted(TABLES), help="Only these tables (repeatable)")
+    parser.add_argument("--full", action="store_true", help="Rewrite every row, dropping deleted ones")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    print(f"📸 {'Full' if args.full else 'Incremental'} snapshot into {args.path}")
+    counts = run_snapshot(engine, Path(args.path), args.table, full=args.full)
+    for name, count in counts.items():
+        print(f"   {name}: {count:,} rows")
+    print(f"✅ Done in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
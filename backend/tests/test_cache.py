@@ -0,0 +1,248 @@
+"""Tests for the cache backends and the cached() decorator."""
+
+import asyncio
+import os
+import uuid
+import pytest
+from app.core import cache as cache_module
+from app.core.cache import MAX_TTL, Cache, MemoryCache, NullCache, RedisCache, cached
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.models import User
+
+TEST_REDIS_URL = os.environ.get("TEST_REDIS_URL", "redis://localhost:6379/15")
+
+
+class Clock:
+    """Stand-in for time.monotonic that only moves when told to."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cache_module.time, "monotonic", clock)
+    return clock
+
+
+@pytest.fixture
+def memory_cache(monkeypatch):
+    """A MemoryCache that get_cache() returns."""
+    cache = MemoryCache(max_entries=3, default_ttl=30)
+    monkeypatch.setattr(cache_module, "get_cache", lambda: cache)
+    return cache
+
+
+def test_cache_is_abstract():
+    class Incomplete(Cache):
+        def get(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        Cache(30)
+    with pytest.raises(TypeError):
+        Incomplete(30)
+
+
+def test_null_cache_always_misses():
+    cache = NullCache(30)
+    cache.set("key", 1)
+
+    assert cache.get("key") is None
+    assert cache.stats()["misses"] == 1
+
+
+def test_memory_cache_evicts_least_recently_used(memory_cache):
+    for key in ("a", "b", "c"):
+        memory_cache.set(key, key)
+    memory_cache.get("a")
+    memory_cache.set("d", "d")
+
+    assert memory_cache.get("b") is None
+    assert [memory_cache.get(key) for key in ("a", "c", "d")] == ["a", "c", "d"]
+    assert memory_cache.stats()["evictions"] == 1
+
+
+def test_memory_cache_expires_entries(memory_cache, clock):
+    memory_cache.set("short", 1, ttl=5)
+    memory_cache.set("default", 2)
+    memory_cache.set("capped", 3, ttl=MAX_TTL * 2)
+
+    clock.now += 10
+    assert memory_cache.get("short") is None
+    assert memory_cache.get("default") == 2
+
+    clock.now += 30
+    assert memory_cache.get("default") is None
+
+    clock.now += MAX_TTL
+    assert memory_cache.get("capped") is None
+    assert memory_cache.stats()["entries"] == 0
+
+
+def test_memory_cache_invalidates_by_tag(memory_cache):
+    memory_cache.set("events:1", {"id": 1}, tags=["events", "events:1"])
+    memory_cache.set("events:2", {"id": 2}, tags=["events", "events:2"])
+    memory_cache.set("posts:1", {"id": 1}, tags=["posts"])
+
+    memory_cache.invalidate("events:1")
+    assert memory_cache.get("events:1") is None
+    assert memory_cache.get("events:2") == {"id": 2}
+
+    memory_cache.invalidate("events")
+    assert memory_cache.get("events:2") is None
+    assert memory_cache.get("posts:1") == {"id": 1}
+    assert memory_cache.stats()["invalidations"] == 2
+
+
+def test_memory_cache_overwrite_drops_old_tags(memory_cache):
+    memory_cache.set("key", 1, tags=["old"])
+    memory_cache.set("key", 2, tags=["new"])
+
+    memory_cache.invalidate("old")
+
+    assert memory_cache.get("key") == 2
+
+
+def test_memory_cache_stats_hit_ratio(memory_cache):
+    memory_cache.set("key", 1)
+    memory_cache.get("key")
+    memory_cache.get("missing")
+
+    stats = memory_cache.stats()
+    assert (stats["hits"], stats["misses"], stats["hit_ratio"]) == (1, 1, 0.5)
+    assert stats["backend"] == "MemoryCache"
+
+
+def test_cached_stores_encoded_results_and_tags(memory_cache):
+    calls = []
+
+    @cached(key=lambda event_id: f"events:{event_id}", tags=lambda value: [f"events:{value['id']}"])
+    def get_event(event_id):
+        calls.append(event_id)
+        return {"id": event_id, "tags": ("strike",)}
+
+    assert get_event(event_id=7) == {"id": 7, "tags": ["strike"]}
+    assert get_event(event_id=7) == {"id": 7, "tags": ["strike"]}
+    assert calls == [7]
+
+    memory_cache.invalidate("events:7")
+    get_event(event_id=7)
+    assert calls == [7, 7]
+
+
+def test_cached_bypasses_the_cache_when_key_is_none(memory_cache):
+    calls = []
+
+    @cached(key=lambda user_id: None if user_id else "anonymous")
+    def feed(user_id):
+        calls.append(user_id)
+        return [user_id]
+
+    feed(user_id=5)
+    feed(user_id=5)
+    feed(user_id=None)
+    feed(user_id=None)
+
+    assert calls == [5, 5, None]
+    assert memory_cache.stats()["entries"] == 1
+
+
+def test_cached_wraps_async_endpoints(memory_cache):
+    calls = []
+
+    @cached(key=lambda q: f"search:{q}")
+    async def search(q):
+        calls.append(q)
+        return {"q": q}
+
+    assert asyncio.run(search(q="rent")) == {"q": "rent"}
+    assert asyncio.run(search(q="rent")) == {"q": "rent"}
+    assert calls == ["rent"]
+
+
+@pytest.fixture
+def redis_cache():
+    """RedisCache on TEST_REDIS_URL under a prefix of its own, removed afterwards."""
+    cache = RedisCache(TEST_REDIS_URL, default_ttl=30, prefix=f"riseup:test:{uuid.uuid4().hex}:")
+    try:
+        cache._client.ping()
+    except cache._redis.RedisError:
+        pytest.skip(f"No Redis at TEST_REDIS_URL ({TEST_REDIS_URL})")
+    yield cache
+    cache.clear()
+    cache._client.close()
+
+
+@pytest.mark.redis
+def test_redis_cache_round_trip_and_expiry(redis_cache):
+    redis_cache.set("events:1", {"id": 1, "title": "Rally"}, ttl=60)
+
+    assert redis_cache.get("events:1") == {"id": 1, "title": "Rally"}
+    assert redis_cache.get("events:2") is None
+    assert 0 < redis_cache._client.ttl(redis_cache.prefix + "events:1") <= 60
+    assert (redis_cache.stats()["hits"], redis_cache.stats()["misses"]) == (1, 1)
+
+
+@pytest.mark.redis
+def test_redis_cache_many_and_tag_invalidation(redis_cache):
+    redis_cache.set_many({
+        "events:1": ({"id": 1}, ["events", "events:1"]),
+        "events:2": ({"id": 2}, ["events", "events:2"]),
+        "posts:1": ({"id": 1}, ["posts"]),
+    })
+
+    assert redis_cache.get_many(["events:1", "events:2", "missing"]) == {"events:1": {"id": 1}, "events:2": {"id": 2}}
+
+    redis_cache.invalidate("events")
+
+    assert redis_cache.get_many(["events:1", "events:2", "posts:1"]) == {"posts:1": {"id": 1}}
+    assert redis_cache.stats()["invalidations"] == 2
+
+
+@pytest.mark.redis
+def test_redis_cache_clear_only_touches_its_prefix(redis_cache):
+    other = f"riseup:other:{uuid.uuid4().hex}"
+    redis_cache._client.set(other, "keep")
+    redis_cache.set("key", 1, tags=["tag"])
+
+    redis_cache.clear()
+
+    assert redis_cache.get("key") is None
+    assert redis_cache._client.get(other) == b"keep"
+    redis_cache._client.delete(other)
+
+
+def test_redis_errors_are_misses_not_failures():
+    cache = RedisCache("redis://127.0.0.1:1/0", default_ttl=30)
+
+    cache.set("key", 1, tags=["tag"])
+    cache.invalidate("tag")
+
+    assert cache.get("key") is None
+    assert cache.get_many(["key"]) == {}
+
+
+@pytest.mark.postgres
+def test_process_stats_require_authentication(client):
+    assert client.get("/api/v1/stats").status_code in (401, 403)
+
+
+@pytest.mark.postgres
+def test_process_stats_are_for_operators_only(client, db_session, monkeypatch):
+    user = User(email="Ops@example.org", hashed_password="x")
+    db_session.add(user)
+    db_session.flush()
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': str(user.id)})}"}
+
+    assert client.get("/api/v1/stats", headers=headers).status_code == 403
+
+    monkeypatch.setattr(settings, "OPERATOR_EMAILS", "ops@example.org")
+    response = client.get("/api/v1/stats", headers=headers)
+    assert response.status_code == 200
+    assert set(response.json()) == {"cache", "coalescing", "compression"}
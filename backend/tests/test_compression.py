@@ -0,0 +1,208 @@
+"""Tests for Accept-Encoding negotiation and the compression middleware."""
+
+import asyncio
+import gzip
+import brotli
+import pytest
+import zstandard
+from app.core import compression, single_flight
+from app.core.compression import CompressedBodies, CompressionMiddleware, negotiate, parse_encodings
+from app.core.single_flight import SingleFlightMiddleware
+
+ENCODINGS = [("zstd", 3), ("br", 4), ("gzip", 6)]
+
+JSON = b'[' + b','.join(b'{"id": %d, "title": "Rent strike rally"}' % i for i in range(100)) + b']'
+
+
+@pytest.mark.parametrize("accept_encoding, expected", [
+    ("gzip, deflate, br, zstd", "zstd"),
+    ("gzip, br", "br"),
+    ("gzip", "gzip"),
+    ("br;q=0.5, gzip", "gzip"),
+    ("zstd;q=0, br;q=0, gzip", "gzip"),
+    ("*", "zstd"),
+    ("*;q=0.1, gzip;q=0.5", "gzip"),
+    ("gzip;q=0, *", "zstd"),
+    ("identity", None),
+    ("", None),
+    ("gzip;q=0", None),
+])
+def test_negotiate(accept_encoding, expected):
+    chosen = negotiate(accept_encoding, ENCODINGS)
+
+    assert (chosen[0] if chosen else None) == expected
+
+
+def test_parse_encodings():
+    assert parse_encodings("zstd:3, br:4,gzip:6,") == ENCODINGS
+    assert parse_encodings("") == []
+    with pytest.raises(ValueError):
+        parse_encodings("deflate:6")
+
+
+def test_parse_encodings_skips_missing_libraries(monkeypatch):
+    def unavailable(level):
+        raise ImportError("brotli")
+
+    monkeypatch.setitem(compression.ENCODERS, "br", unavailable)
+
+    assert parse_encodings("br:4,gzip:6") == [("gzip", 6)]
+
+
+def test_compressed_bodies_evict_least_recently_used():
+    bodies = CompressedBodies(max_bytes=10)
+    bodies.set("a", b"aaaa")
+    bodies.set("b", b"bbbb")
+    bodies.get("a")
+    bodies.set("c", b"cccc")
+    bodies.set("huge", b"x" * 11)
+
+    assert bodies.get("b") is None
+    assert bodies.get("a") == b"aaaa" and bodies.get("c") == b"cccc"
+    assert bodies.get("huge") is None
+    assert bodies.size == 8
+
+
+def app_sending(*chunks, status=200, headers=()):
+    """ASGI app sending a fixed response; several chunks stream it."""
+    async def app(scope, receive, send):
+        raw = [(b"content-type", b"application/json"), *headers]
+        if len(chunks) == 1:
+            raw.append((b"content-length", str(len(chunks[0])).encode()))
+        await send({"type": "http.response.start", "status": status, "headers": raw})
+        for index, chunk in enumerate(chunks):
+            await send({"type": "http.response.body", "body": chunk, "more_body": index < len(chunks) - 1})
+    return app
+
+
+def call(app, accept_encoding="gzip, br, zstd", path="/api/v1/events"):
+    """(start message, body chunks) of app behind the middleware."""
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http", "method": "GET", "path": path, "query_string": b"",
+        "headers": [(b"accept-encoding", accept_encoding.encode())],
+    }
+    middleware = CompressionMiddleware(app, encodings=ENCODINGS, minimum_size=100)
+    asyncio.run(middleware(scope, None, send))
+    start, *bodies = messages
+    return start, {k.decode(): v.decode() for k, v in start["headers"]}, [m.get("body", b"") for m in bodies]
+
+
+@pytest.mark.parametrize("accept_encoding, decompress", [
+    ("zstd", lambda data: zstandard.ZstdDecompressor().decompressobj().decompress(data)),
+    ("br", brotli.decompress),
+    ("gzip", gzip.decompress),
+])
+def test_compresses_with_the_negotiated_encoding(accept_encoding, decompress):
+    _, headers, bodies = call(app_sending(JSON), accept_encoding)
+
+    assert headers["content-encoding"] == accept_encoding
+    assert headers["vary"] == "Accept-Encoding"
+    assert int(headers["content-length"]) == len(bodies[0]) < len(JSON)
+    assert decompress(bodies[0]) == JSON
+
+
+@pytest.mark.parametrize("body, accept_encoding, headers, status", [
+    (b"[]", "gzip", [], 200),
+    (JSON, "identity", [], 200),
+    (JSON, "gzip", [(b"cache-control", b"no-transform")], 200),
+    (b"", "gzip", [], 304),
+    (JSON, "gzip", [(b"content-encoding", b"br")], 200),
+])
+def test_leaves_small_refused_or_unsuitable_responses_alone(body, accept_encoding, headers, status):
+    _, sent_headers, bodies = call(app_sending(body, status=status, headers=headers), accept_encoding)
+
+    assert sent_headers.get("content-encoding") == ("br" if headers and headers[0][0] == b"content-encoding" else None)
+    assert "vary" not in sent_headers
+    assert bodies == [body]
+
+
+def test_leaves_non_compressible_types_alone():
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"image/png")]})
+        await send({"type": "http.response.body", "body": b"\x89PNG" * 100})
+
+    _, headers, bodies = call(app)
+
+    assert "content-encoding" not in headers
+    assert bodies == [b"\x89PNG" * 100]
+
+
+def test_weakens_etags_and_reuses_compressed_bodies(monkeypatch):
+    monkeypatch.setattr(compression, "_bodies", CompressedBodies(1 << 20))
+    app = app_sending(JSON, headers=[(b"etag", b'"v1"')])
+
+    _, headers, first = call(app, "gzip")
+    _, _, second = call(app, "gzip")
+
+    assert headers["etag"] == 'W/"v1"'
+    assert first == second
+    assert compression.stats()["hits"] == 1 and compression.stats()["misses"] == 1
+
+
+def test_streams_chunk_by_chunk():
+    chunks = [JSON[:300], JSON[300:900], JSON[900:]]
+
+    start, headers, bodies = call(app_sending(*chunks), "gzip")
+
+    assert "content-length" not in headers
+    assert len(bodies) == 3
+    decompressor = gzip.zlib.decompressobj(31)
+    assert decompressor.decompress(bodies[0]) == chunks[0]
+    assert decompressor.decompress(bodies[1] + bodies[2]) == chunks[1] + chunks[2]
+
+
+def test_leaves_the_apps_start_message_unchanged():
+    sent = []
+
+    async def app(scope, receive, send):
+        start = {"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/json")]}
+        sent.append(start)
+        await send(start)
+        await send({"type": "http.response.body", "body": JSON})
+
+    _, headers, _ = call(app, "gzip")
+
+    assert headers["content-encoding"] == "gzip"
+    assert sent[0]["headers"] == [(b"content-type", b"application/json")]
+
+
+def test_coalesced_requests_are_each_compressed_intact(monkeypatch):
+    counters = {"leaders": 0, "coalesced": 0, "fallbacks": 0}
+    monkeypatch.setattr(single_flight, "_counters", counters)
+    inner = app_sending(JSON)
+
+    async def slow(scope, receive, send):
+        await asyncio.sleep(0.05)
+        await inner(scope, receive, send)
+
+    middleware = CompressionMiddleware(SingleFlightMiddleware(slow), encodings=ENCODINGS, minimum_size=100)
+    scope = {
+        "type": "http", "method": "GET", "path": "/api/v1/events", "query_string": b"",
+        "headers": [(b"accept-encoding", b"gzip")],
+    }
+
+    async def one():
+        messages = []
+
+        async def send(message):
+            messages.append(message)
+
+        await middleware(dict(scope), None, send)
+        return messages
+
+    async def main():
+        return await asyncio.gather(one(), one(), one())
+
+    responses = asyncio.run(main())
+
+    assert counters["coalesced"] == 2
+    for start, body in responses:
+        headers = {k.decode(): v.decode() for k, v in start["headers"]}
+        assert headers["content-encoding"] == "gzip" and headers["vary"] == "Accept-Encoding"
+        assert int(headers["content-length"]) == len(body["body"])
+        assert gzip.decompress(body["body"]) == JSON
@@ -0,0 +1,128 @@
+"""Tests for list validators backed by the collection_versions triggers (Postgres)."""
+
+from datetime import datetime
+import pytest
+from sqlalchemy import text
+from app.core.security import create_access_token
+from app.models import User, Profile, Event, FairWorkPosting
+
+pytestmark = pytest.mark.postgres
+
+@pytest.fixture
+def user(db_session):
+    user = User(email="member@example.org", hashed_password="x")
+    db_session.add(user)
+    db_session.flush()
+    profile = Profile(user_id=user.id, name="Member", causes=[])
+    db_session.add(profile)
+    db_session.flush()
+    return user
+
+
+@pytest.fixture
+def auth_headers(user):
+    return {"Authorization": f"Bearer {create_access_token({'sub': str(user.id)})}"}
+
+
+def add_event(session, user, title="Rally"):
+    event = Event(
+        creator_id=user.profile.id, title=title, description="Meet at the hall",
+        event_date=datetime(2026, 11, 1, 18, 0), location="Union Hall", tags=[]
+    )
+    session.add(event)
+    session.flush()
+    return event
+
+
+def etag(client, url, headers=None):
+    response = client.get(url, headers=headers or {})
+    assert response.status_code == 200, response.text
+    return response.headers["etag"]
+
+
+def assert_not_modified(client, url, tag, headers=None):
+    response = client.get(url, headers={**(headers or {}), "If-None-Match": tag})
+    assert response.status_code == 304
+
+
+def test_lists_carry_no_validators_without_version_rows(client, db_session):
+    db_session.execute(text("DELETE FROM collection_versions"))
+
+    assert "etag" not in client.get("/api/v1/events").headers
+
+
+def test_events_list_version_follows_inserts_updates_and_deletes(client, db_session, user):
+    url = "/api/v1/events"
+    first = etag(client, url)
+    assert_not_modified(client, url, first)
+
+    event = add_event(db_session, user)
+    inserted = etag(client, url)
+    assert inserted != first
+    assert_not_modified(client, url, inserted)
+
+    event.title = "Bigger rally"
+    db_session.add(event)
+    db_session.flush()
+    updated = etag(client, url)
+    assert updated != inserted
+
+    db_session.delete(event)
+    db_session.flush()
+    assert etag(client, url) not in (first, inserted, updated)
+
+
+def test_events_list_and_map_have_different_tags(client):
+    assert etag(client, "/api/v1/events") != etag(client, "/api/v1/events/map")
+
+
+def test_posting_lists_have_validators_per_query(client, db_session):
+    for url in ("/api/v1/unionized/", "/api/v1/unionized/page"):
+        first = etag(client, url)
+        assert_not_modified(client, url, first)
+        assert etag(client, url + "?limit=5") != first
+
+    db_session.add(FairWorkPosting(
+        title="Baker", organization="Bakery Co-op", location="Oakland, CA", wage_text="$25/hour",
+        employment_type="full-time", union_status="unionized", description="Early shifts"
+    ))
+    db_session.flush()
+    assert etag(client, "/api/v1/unionized/") != first
+
+
+def test_feed_version_covers_creators_and_viewer(client, db_session, user, auth_headers):
+    url = "/api/v1/feed"
+    add_event(db_session, user)
+    first = etag(client, url, auth_headers)
+    assert_not_modified(client, url, first, auth_headers)
+
+    profile = user.profile
+    profile.name = "Renamed Member"
+    db_session.add(profile)
+    db_session.flush()
+    renamed = etag(client, url, auth_headers)
+    assert renamed != first
+
+    other = User(email="other@example.org", hashed_password="x")
+    db_session.add(other)
+    db_session.flush()
+    other_headers = {"Authorization": f"Bearer {create_access_token({'sub': str(other.id)})}"}
+    assert etag(client, url, other_headers) != renamed
+
+
+def test_msgpack_and_json_copies_have_different_tags(client, db_session, user):
+    url = "/api/v1/events"
+    add_event(db_session, user)
+    msgpack_headers = {"Accept": "application/msgpack"}
+    json_tag = etag(client, url)
+    msgpack_tag = etag(client, url, msgpack_headers)
+
+    assert json_tag != msgpack_tag
+    assert client.get(url, headers=msgpack_headers).headers["content-type"] == "application/msgpack"
+    assert client.get(url, headers={**msgpack_headers, "If-None-Match": json_tag}).status_code == 200
+    assert client.get(url, headers={"If-None-Match": msgpack_tag}).status_code == 200
+    assert_not_modified(client, url, msgpack_tag, msgpack_headers)
+
+    response = client.get(url, headers={"If-None-Match": json_tag})
+    assert response.status_code == 304
+    assert response.headers["vary"] == "Accept"
@@ -0,0 +1,54 @@
+"""Tests for event list endpoints against Postgres."""
+
+from datetime import datetime
+import pytest
+from sqlalchemy import event as sa_event
+from app.models import User, Profile, Event, Attendance
+
+pytestmark = pytest.mark.postgres
+
+
+@pytest.fixture
+def events(db_session):
+    """Three events with 0, 1 and 2 attendees (by title)."""
+    users = []
+    for i in range(3):
+        user = User(email=f"member{i}@example.org", hashed_password="x")
+        db_session.add(user)
+        users.append(user)
+    db_session.flush()
+    profile = Profile(user_id=users[0].id, name="Organizer", causes=[])
+    db_session.add(profile)
+    db_session.flush()
+
+    events = []
+    for attendees in range(3):
+        event = Event(
+            creator_id=profile.id, title=str(attendees), description="Meet at the hall",
+            event_date=datetime(2026, 11, 1, 18, 0), location="Union Hall",
+            latitude=37.8, longitude=-122.27, tags=[]
+        )
+        db_session.add(event)
+        db_session.flush()
+        db_session.add_all(Attendance(user_id=user.id, event_id=event.id) for user in users[:attendees])
+        events.append(event)
+    db_session.flush()
+    db_session.expire_all()
+    return events
+
+
+def count_statements(db_session):
+    statements = []
+    sa_event.listen(db_session.connection(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+    return statements
+
+
+@pytest.mark.parametrize("url", ["/api/v1/events", "/api/v1/events?fields=card", "/api/v1/events/map"])
+def test_lists_count_attendees_without_a_query_per_event(client, db_session, events, url):
+    statements = count_statements(db_session)
+
+    response = client.get(url)
+
+    assert response.status_code == 200, response.text
+    assert {event["title"]: event["attendee_count"] for event in response.json()} == {"0": 0, "1": 1, "2": 2}
+    assert not [s for s in statements if "FROM attendances" in s and "count(" not in s]
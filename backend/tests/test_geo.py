@@ -0,0 +1,38 @@
+"""Tests for the proximity helpers."""
+
+import math
+import pytest
+from app.core.geo import EARTH_RADIUS_KM, bounding_box, distance_km
+
+
+def destination(latitude, longitude, bearing, km):
+    """Point km away from (latitude, longitude) along bearing (degrees)."""
+    phi, lam, theta = math.radians(latitude), math.radians(longitude), math.radians(bearing)
+    delta = km / EARTH_RADIUS_KM
+    phi2 = math.asin(math.sin(phi) * math.cos(delta) + math.cos(phi) * math.sin(delta) * math.cos(theta))
+    lam2 = lam + math.atan2(
+        math.sin(theta) * math.sin(delta) * math.cos(phi), math.cos(delta) - math.sin(phi) * math.sin(phi2)
+    )
+    return math.degrees(phi2), (math.degrees(lam2) + 540) % 360 - 180
+
+
+def test_distance_between_known_cities():
+    # London to Paris
+    assert distance_km(51.5074, -0.1278, 48.8566, 2.3522) == pytest.approx(343.5, abs=1)
+    assert distance_km(10, 20, 10, 20) == 0
+
+
+@pytest.mark.parametrize("latitude", [0.0, 37.8, -60.0, 75.0, 89.9, -89.95])
+def test_bounding_box_encloses_the_radius(latitude):
+    radius_km = 50
+    min_lat, max_lat, min_lng, max_lng = bounding_box(latitude, 10.0, radius_km)
+
+    for bearing in range(0, 360, 15):
+        point_lat, point_lng = destination(latitude, 10.0, bearing, radius_km * 0.99)
+        assert distance_km(latitude, 10.0, point_lat, point_lng) <= radius_km
+        assert min_lat <= point_lat <= max_lat
+        assert min_lng <= point_lng <= max_lng
+
+
+def test_bounding_box_spans_every_longitude_over_a_pole():
+    assert bounding_box(89.9, 10.0, 100) == (pytest.approx(89.9 - 100 / 111.32), 90.0, -180.0, 180.0)
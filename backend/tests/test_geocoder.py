@@ -0,0 +1,87 @@
+"""Tests for the offline gazetteer index and geocoding."""
+
+import pytest
+from app.core.config import settings
+from app.services import geocoder
+from app.services.geocoder import (
+    INDEX_MAGIC, KIND_CITY, KIND_POSTCODE, Gazetteer, Place, build_index, ensure_index, geocode,
+    get_gazetteer, normalize, suggest
+)
+
+
+def place(name, population=0, kind=KIND_CITY):
+    return Place(name, 1.5, -2.5, population, kind)
+
+
+@pytest.fixture
+def index_file(tmp_path, monkeypatch):
+    """Point GAZETTEER_INDEX at a fresh path and reset the open index and lookup caches."""
+    path = tmp_path / "gazetteer.idx"
+    monkeypatch.setattr(settings, "GAZETTEER_INDEX", str(path))
+    geocoder._open.cache_clear()
+    geocoder._geocode.cache_clear()
+    yield path
+    geocoder._open.cache_clear()
+    geocoder._geocode.cache_clear()
+
+
+def test_normalize_folds_accents_case_and_punctuation():
+    assert normalize("São Paulo, SP") == "sao paulo sp"
+
+
+@pytest.mark.parametrize("run_size", [2, 1000])
+def test_build_index_sorts_keys_and_population_across_runs(tmp_path, monkeypatch, run_size):
+    monkeypatch.setattr(geocoder, "BUILD_RUN_SIZE", run_size)
+    entries = [
+        ("springfield", place("Springfield, MO", 170_000)),
+        ("portland", place("Portland, ME", 68_000)),
+        ("springfield", place("Springfield, IL", 114_000)),
+        ("portland", place("Portland, OR", 650_000)),
+        ("94612", place("Oakland, CA 94612", kind=KIND_POSTCODE)),
+    ]
+    path = tmp_path / "index.idx"
+
+    assert build_index(entries, path) == 5
+
+    gazetteer = Gazetteer(path)
+    assert len(gazetteer) == 5
+    assert [gazetteer._key(i) for i in range(5)] == [
+        b"94612", b"portland", b"portland", b"springfield", b"springfield"
+    ]
+    assert gazetteer.lookup("portland").name == "Portland, OR"
+    assert gazetteer.lookup("springfield").name == "Springfield, MO"
+    assert gazetteer.lookup("94612") == place("Oakland, CA 94612", kind=KIND_POSTCODE)
+    assert gazetteer.lookup("port") is None
+    assert [p.name for p in gazetteer.prefix("port")] == ["Portland, OR", "Portland, ME"]
+
+
+def test_empty_index(tmp_path):
+    path = tmp_path / "index.idx"
+
+    assert build_index([], path) == 0
+    assert Gazetteer(path).lookup("oakland") is None
+
+
+def test_geocoding_does_not_build_a_missing_index(index_file):
+    assert get_gazetteer() is None
+    assert geocode("Oakland, CA") is None
+    assert suggest("oak") == []
+    assert not index_file.exists()
+
+
+def test_ensure_index_builds_then_geocodes_bundled_sample(index_file):
+    ensure_index()
+
+    assert geocode("Oakland, CA").name.startswith("Oakland")
+    assert geocode("Union Hall, 12 Main St, 94612").kind == KIND_POSTCODE
+    assert geocode("Nowhere in particular") is None
+    assert any(p.name.startswith("Oakland") for p in suggest("oakl"))
+
+
+def test_ensure_index_rebuilds_an_older_format(index_file):
+    index_file.write_bytes(b"GZIX1" + bytes(4))
+
+    ensure_index()
+
+    assert index_file.read_bytes().startswith(INDEX_MAGIC)
+    assert len(get_gazetteer()) > 0
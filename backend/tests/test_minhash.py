@@ -0,0 +1,64 @@
+"""Tests for MinHash signatures and LSH banding."""
+
+from app.core.minhash import BANDS, NUM_PERM, band_hashes, jaccard, shingles, signature
+from app.services.posting_dedupe import location_key, posting_features
+
+TEXT = "Worker-owned bakery hiring a full time baker for early morning shifts with union benefits"
+
+
+def test_shingles_are_lowercased_word_pairs():
+    assert shingles("Rent Strike now!") == {"rent strike", "strike now"}
+
+
+def test_short_and_empty_texts():
+    assert shingles("Picket") == {"picket"}
+    assert shingles("  ...  ") == set()
+    assert signature(set()) == []
+    assert band_hashes([]) == []
+
+
+def test_signature_is_deterministic_and_order_free():
+    features = shingles(TEXT)
+
+    sig = signature(features)
+
+    assert len(sig) == NUM_PERM
+    assert signature(sorted(features, reverse=True)) == sig
+
+
+def test_band_hashes_fit_a_signed_bigint():
+    bands = band_hashes(signature(shingles(TEXT)))
+
+    assert len(bands) == BANDS
+    assert all(-(1 << 63) <= value < (1 << 63) for value in bands)
+
+
+def test_near_duplicates_share_bands_and_unrelated_texts_do_not():
+    original = band_hashes(signature(shingles(TEXT)))
+    edited = band_hashes(signature(shingles(TEXT + " today")))
+    unrelated = band_hashes(signature(shingles("Tenant union meeting about the rent increase at the county building")))
+
+    assert set(original) & set(edited)
+    assert not set(original) & set(unrelated)
+
+
+def test_blocking_key_separates_identical_texts():
+    sig = signature(shingles(TEXT))
+
+    assert not set(band_hashes(sig, "oakland ca")) & set(band_hashes(sig, "fresno ca"))
+    assert band_hashes(sig, "oakland ca") == band_hashes(sig, "oakland ca")
+
+
+def test_jaccard():
+    assert jaccard({"a", "b"}, {"b", "c"}) == 1 / 3
+    assert jaccard({"a"}, set()) == 0.0
+
+
+def test_posting_features_are_tagged_with_their_field():
+    features = posting_features({"title": "Baker", "organization": "Bakery Co-op", "description": "Baker"})
+
+    assert features == {"t:baker", "o:bakery co", "o:co op", "d:baker"}
+
+
+def test_location_key_ignores_case_and_punctuation():
+    assert location_key("Oakland, CA") == location_key("oakland  ca") == "oakland ca"
@@ -0,0 +1,149 @@
+"""Tests for Accept negotiation and MessagePack responses."""
+
+import asyncio
+from datetime import datetime, timezone
+from typing import List, Optional
+import msgpack
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+from app.core.negotiation import MSGPACK_MEDIA_TYPE, wants_msgpack
+from app.core.serialization import MessagePackMiddleware, TrustedJSONResponse, dump_msgpack
+from app.models import UnionStatus
+
+CREATED = datetime(2026, 5, 1, 17, 30)
+
+
+class Item(BaseModel):
+    title: str
+    bio: Optional[str] = None
+    union_status: UnionStatus
+    created_at: datetime
+
+
+ITEMS = [
+    Item(title="2026-13-01T10:00:00", bio="2026-05-01T10:00:00", union_status=UnionStatus.UNIONIZED, created_at=CREATED),
+    Item(title="Rally", union_status=UnionStatus.NOT_LISTED, created_at=CREATED),
+]
+
+
+@pytest.mark.parametrize("accept, expected", [
+    ("application/msgpack", True),
+    ("application/x-msgpack", True),
+    ("application/vnd.msgpack, application/json", True),
+    ("application/json, application/msgpack;q=0.5", False),
+    ("application/msgpack;q=0.5, */*;q=0.1", True),
+    ("application/msgpack;q=0", False),
+    ("application/json", False),
+    ("*/*", False),
+    ("", False),
+])
+def test_wants_msgpack(accept, expected):
+    assert wants_msgpack(accept) is expected
+
+
+def unpack(data):
+    return msgpack.unpackb(data, timestamp=3)
+
+
+def test_dump_msgpack_takes_timestamps_from_the_schema():
+    decoded = unpack(dump_msgpack(List[Item], ITEMS))
+
+    assert decoded[0] == {
+        "title": "2026-13-01T10:00:00",
+        "bio": "2026-05-01T10:00:00",
+        "union_status": "unionized",
+        "created_at": CREATED.replace(tzinfo=timezone.utc),
+    }
+    assert decoded[1]["bio"] is None
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.add_middleware(MessagePackMiddleware)
+
+    @app.get("/items", response_model=List[Item])
+    def items():
+        return ITEMS
+
+    @app.get("/trusted", response_model=List[Item])
+    def trusted():
+        return TrustedJSONResponse(ITEMS, List[Item])
+
+    @app.get("/missing", response_model=Item)
+    def missing():
+        raise HTTPException(status_code=404, detail="Not found")
+
+    @app.get("/plain")
+    def plain():
+        return {"created_at": CREATED.isoformat()}
+
+    return TestClient(app)
+
+
+@pytest.mark.parametrize("path", ["/items", "/trusted"])
+def test_msgpack_responses_match_the_json_document(client, path):
+    as_json = client.get(path)
+    as_msgpack = client.get(path, headers={"Accept": MSGPACK_MEDIA_TYPE})
+
+    assert as_msgpack.headers["content-type"] == MSGPACK_MEDIA_TYPE
+    assert int(as_msgpack.headers["content-length"]) == len(as_msgpack.content)
+    decoded = unpack(as_msgpack.content)
+    assert decoded[0]["created_at"] == CREATED.replace(tzinfo=timezone.utc)
+    assert decoded[0]["title"] == "2026-13-01T10:00:00"
+    assert [item["title"] for item in decoded] == [item["title"] for item in as_json.json()]
+
+
+@pytest.mark.parametrize("path", ["/items", "/trusted", "/missing"])
+def test_json_responses_of_negotiable_routes_vary_on_accept(client, path):
+    response = client.get(path)
+
+    assert response.headers["content-type"] == "application/json"
+    assert response.headers["vary"] == "Accept"
+
+
+def test_errors_stay_json(client):
+    response = client.get("/missing", headers={"Accept": MSGPACK_MEDIA_TYPE})
+
+    assert response.status_code == 404
+    assert response.json() == {"detail": "Not found"}
+    assert response.headers["vary"] == "Accept"
+
+
+def test_routes_without_a_response_model_are_left_alone(client):
+    response = client.get("/plain", headers={"Accept": MSGPACK_MEDIA_TYPE})
+
+    assert response.json() == {"created_at": CREATED.isoformat()}
+    assert "vary" not in response.headers
+
+
+def test_the_apps_start_message_is_left_unchanged():
+    """A start message replayed twice (as single-flight does) gets Vary: Accept once each time."""
+    start = {"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/json")]}
+    body = Item(title="Rally", union_status=UnionStatus.UNIONIZED, created_at=CREATED).model_dump_json().encode()
+
+    class Route:
+        response_model = Item
+
+    async def app(scope, receive, send):
+        scope["route"] = Route
+        await send(start)
+        await send({"type": "http.response.body", "body": body})
+
+    async def call(accept):
+        messages = []
+
+        async def send(message):
+            messages.append(message)
+
+        scope = {"type": "http", "method": "GET", "path": "/items/1", "headers": [(b"accept", accept)]}
+        await MessagePackMiddleware(app)(scope, None, send)
+        return messages[0]["headers"]
+
+    for accept in (b"application/json", MSGPACK_MEDIA_TYPE.encode(), MSGPACK_MEDIA_TYPE.encode()):
+        headers = asyncio.run(call(accept))
+        assert [value for name, value in headers if name == b"vary"] == [b"Accept"]
+
+    assert start["headers"] == [(b"content-type", b"application/json")]
@@ -0,0 +1,28 @@
+"""Tests for opaque keyset cursors."""
+
+from datetime import datetime
+import pytest
+from app.core.exceptions import ValidationException
+from app.core.pagination import encode_cursor, decode_cursor
+
+
+def test_cursor_round_trips_sort_keys():
+    posted = datetime(2026, 3, 1, 9, 30, 15, 250000)
+
+    cursor = encode_cursor(0.0607927, "event", 42, posted, None)
+
+    assert decode_cursor(cursor, float, str, int, datetime, int) == (0.0607927, "event", 42, posted, None)
+
+
+def test_cursor_is_url_safe():
+    cursor = encode_cursor("?&=/+", 10 ** 12)
+
+    assert all(character.isalnum() or character in "-_" for character in cursor)
+
+
+@pytest.mark.parametrize("cursor", ["", "not-a-cursor", encode_cursor(1, 2), encode_cursor("x", 1, 2)])
+def test_malformed_cursor_raises_validation_exception(cursor):
+    with pytest.raises(ValidationException) as error:
+        decode_cursor(cursor, int, int, int)
+
+    assert error.value.field == "cursor"
@@ -0,0 +1,49 @@
+"""Tests for reaction writes against Postgres."""
+
+from datetime import datetime, timedelta
+import pytest
+from sqlmodel import select
+from app.core.security import create_access_token
+from app.models import User, Profile, Post, Reaction
+
+pytestmark = pytest.mark.postgres
+
+
+@pytest.fixture
+def post(db_session):
+    user = User(email="poster@example.org", hashed_password="x")
+    db_session.add(user)
+    db_session.flush()
+    profile = Profile(user_id=user.id, name="Poster", causes=[])
+    db_session.add(profile)
+    db_session.flush()
+    post = Post(creator_id=profile.id, text="We won the contract")
+    db_session.add(post)
+    db_session.flush()
+    return post
+
+
+@pytest.fixture
+def auth_headers(db_session):
+    user = User(email="reactor@example.org", hashed_password="x")
+    db_session.add(user)
+    db_session.flush()
+    return {"Authorization": f"Bearer {create_access_token({'sub': str(user.id)})}"}
+
+
+def test_changing_a_reaction_bumps_its_updated_at(client, db_session, post, auth_headers):
+    body = {"target_type": "post", "target_id": post.id, "reaction_type": "solidarity"}
+    assert client.post("/api/v1/reactions", json=body, headers=auth_headers).status_code == 201
+
+    reaction = db_session.exec(select(Reaction).where(Reaction.target_id == post.id)).one()
+    reaction.updated_at = datetime.utcnow() - timedelta(days=1)
+    db_session.add(reaction)
+    db_session.flush()
+    changed_before = reaction.updated_at
+
+    response = client.post("/api/v1/reactions", json={**body, "reaction_type": "respect"}, headers=auth_headers)
+
+    assert response.status_code == 201, response.text
+    db_session.refresh(reaction)
+    assert reaction.reaction_type.value == "respect"
+    assert reaction.updated_at > changed_before
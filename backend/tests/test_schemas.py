@@ -0,0 +1,33 @@
+"""Tests for request schema validation."""
+
+from datetime import datetime, timedelta
+import pytest
+from pydantic import ValidationError
+from app.schemas import EventCreate, TAG_MAX_LENGTH, MAX_TAGS
+
+
+def event(**values):
+    return EventCreate(
+        title="Rally",
+        description="Bring signs",
+        event_date=datetime.utcnow() + timedelta(days=1),
+        location="City Hall",
+        **values
+    )
+
+
+def test_tags_are_trimmed_and_deduplicated_keeping_the_first_spelling():
+    created = event(tags=["  Workers  Rights ", "workers rights", "", "   ", "Fair Wages"])
+
+    assert created.tags == ["Workers Rights", "Fair Wages"]
+
+
+def test_tags_longer_than_the_limit_are_rejected():
+    assert event(tags=["x" * TAG_MAX_LENGTH]).tags == ["x" * TAG_MAX_LENGTH]
+    with pytest.raises(ValidationError):
+        event(tags=["x" * (TAG_MAX_LENGTH + 1)])
+
+
+def test_too_many_tags_are_rejected():
+    with pytest.raises(ValidationError):
+        event(tags=[f"Tag {index}" for index in range(MAX_TAGS + 1)])
@@ -0,0 +1,132 @@
+"""Tests for /search against Postgres: ranking, filters and keyset pagination."""
+
+from datetime import datetime, timedelta
+import pytest
+from app.models import User, Profile, Event, Post
+
+pytestmark = pytest.mark.postgres
+
+NOW = datetime(2026, 6, 1, 12, 0)
+
+# Oakland and Los Angeles, about 550 km apart
+OAKLAND = (37.8044, -122.2712)
+LOS_ANGELES = (34.0522, -118.2437)
+
+
+@pytest.fixture
+def creator(db_session):
+    user = User(email="organizer@example.org", hashed_password="x")
+    db_session.add(user)
+    db_session.flush()
+    profile = Profile(user_id=user.id, name="Organizer", causes=[])
+    db_session.add(profile)
+    db_session.flush()
+    return profile
+
+
+def add_event(session, creator, title, description="Community meeting", days=0, at=OAKLAND, tags=()):
+    event = Event(
+        creator_id=creator.id,
+        title=title,
+        description=description,
+        event_date=NOW + timedelta(days=days),
+        location="Somewhere",
+        latitude=at[0] if at else None,
+        longitude=at[1] if at else None,
+        tags=list(tags),
+    )
+    session.add(event)
+    session.flush()
+    return event
+
+
+def add_post(session, creator, text, days=0):
+    post = Post(creator_id=creator.id, text=text, created_at=NOW + timedelta(days=days))
+    session.add(post)
+    session.flush()
+    return post
+
+
+def search(client, **params):
+    response = client.get("/api/v1/search", params=params)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def hits(body):
+    return [(result["type"], result["id"]) for result in body["results"]]
+
+
+def test_title_matches_rank_above_description_matches(client, db_session, creator):
+    in_description = add_event(db_session, creator, "Weekly meeting", description="We talk about the rent strike")
+    in_title = add_event(db_session, creator, "Rent strike rally")
+    add_event(db_session, creator, "Garden day", description="Planting")
+
+    body = search(client, q="rent strike")
+
+    assert hits(body) == [("event", in_title.id), ("event", in_description.id)]
+    assert body["results"][0]["rank"] > body["results"][1]["rank"]
+    assert body["next_cursor"] is None
+
+
+def test_searches_events_and_posts_and_filters_by_type(client, db_session, creator):
+    event = add_event(db_session, creator, "Tenant union assembly")
+    post = add_post(db_session, creator, "Our tenant union won repairs")
+
+    assert set(hits(search(client, q="tenant union"))) == {("event", event.id), ("post", post.id)}
+    assert hits(search(client, q="tenant union", type="post")) == [("post", post.id)]
+    assert hits(search(client, q="tenant union", type="event")) == [("event", event.id)]
+
+
+def test_date_filters_use_event_date_and_post_creation(client, db_session, creator):
+    early = add_event(db_session, creator, "Picket line", days=-10)
+    late = add_event(db_session, creator, "Picket line", days=10)
+    old_post = add_post(db_session, creator, "Picket line photos", days=-10)
+    new_post = add_post(db_session, creator, "Picket line photos", days=10)
+
+    after = search(client, q="picket", date_from=NOW.isoformat())
+    assert set(hits(after)) == {("event", late.id), ("post", new_post.id)}
+
+    before = search(client, q="picket", date_to=NOW.isoformat())
+    assert set(hits(before)) == {("event", early.id), ("post", old_post.id)}
+
+
+def test_geo_filter_keeps_nearby_events_and_leaves_out_posts(client, db_session, creator):
+    near = add_event(db_session, creator, "Mutual aid pantry", at=OAKLAND)
+    add_event(db_session, creator, "Mutual aid pantry", at=LOS_ANGELES)
+    add_event(db_session, creator, "Mutual aid pantry", at=None)
+    add_post(db_session, creator, "Mutual aid pantry needs volunteers")
+
+    body = search(client, q="mutual aid", latitude=OAKLAND[0], longitude=OAKLAND[1], radius_km=50)
+
+    assert hits(body) == [("event", near.id)]
+
+
+def test_keyset_pages_cover_every_hit_once_in_rank_order(client, db_session, creator):
+    for index in range(5):
+        add_event(db_session, creator, "Housing justice", description="Housing " * index)
+    for _ in range(3):
+        add_post(db_session, creator, "Housing justice")
+
+    everything = hits(search(client, q="housing", limit=50))
+    assert len(everything) == 8
+
+    paged, cursor = [], None
+    while True:
+        params = {"q": "housing", "limit": 3}
+        if cursor:
+            params["cursor"] = cursor
+        body = search(client, **params)
+        paged.extend(hits(body))
+        cursor = body["next_cursor"]
+        if cursor is None:
+            break
+
+    assert paged == everything
+
+
+def test_malformed_cursor_is_a_validation_error(client):
+    response = client.get("/api/v1/search", params={"q": "housing", "cursor": "not-a-cursor"})
+
+    assert response.status_code == 400
+    assert response.json()["error"]["field"] == "cursor"
@@ -0,0 +1,263 @@
+"""Tests for single-flight coalescing of concurrent identical GETs."""
+
+import asyncio
+import gzip
+import json
+from datetime import datetime
+import msgpack
+import pytest
+from app.core import single_flight
+from app.core.single_flight import SingleFlightMiddleware
+
+
+class SlowApp:
+    """ASGI app that answers after a short delay and counts its calls."""
+
+    def __init__(self, status=200, body=b"[]", delay=0.05):
+        self.status = status
+        self.body = body
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self, scope, receive, send):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        await send({"type": "http.response.start", "status": self.status, "headers": []})
+        await send({"type": "http.response.body", "body": self.body})
+
+
+def scope(path="/api/v1/events", query=b"", method="GET", headers=()):
+    return {"type": "http", "method": method, "path": path, "query_string": query, "headers": list(headers)}
+
+
+async def request(middleware, request_scope):
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        messages.append(message)
+
+    await middleware(request_scope, receive, send)
+    return messages
+
+
+def run_together(middleware, *scopes):
+    async def main():
+        return await asyncio.gather(*(request(middleware, s) for s in scopes))
+    return asyncio.run(main())
+
+
+@pytest.fixture(autouse=True)
+def counters(monkeypatch):
+    counters = {"leaders": 0, "coalesced": 0, "fallbacks": 0}
+    monkeypatch.setattr(single_flight, "_counters", counters)
+    return counters
+
+
+def test_concurrent_identical_gets_share_one_response(counters):
+    app = SlowApp(body=b'[{"id": 1}]')
+
+    responses = run_together(SingleFlightMiddleware(app), scope(), scope(), scope())
+
+    assert app.calls == 1
+    assert responses[0] == responses[1] == responses[2]
+    assert responses[0][1]["body"] == b'[{"id": 1}]'
+    assert counters == {"leaders": 1, "coalesced": 2, "fallbacks": 0}
+    assert single_flight.stats() == counters
+
+
+def test_followers_get_copies_the_leader_cannot_change(counters):
+    app = SlowApp(body=b'[{"id": 1}]')
+    middleware = SingleFlightMiddleware(app)
+    leader_messages = []
+
+    async def rewriting_send(message):
+        # What outer middleware does to the leader's response
+        if message["type"] == "http.response.start":
+            message["headers"].append((b"content-encoding", b"gzip"))
+        leader_messages.append(message)
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def main():
+        leader = middleware(scope(), receive, rewriting_send)
+        return await asyncio.gather(leader, request(middleware, scope()), request(middleware, scope()))
+
+    _, first, second = asyncio.run(main())
+
+    assert leader_messages[0]["headers"] == [(b"content-encoding", b"gzip")]
+    assert first[0]["headers"] == second[0]["headers"] == []
+    assert first[0] is not second[0]
+    assert counters["coalesced"] == 2
+
+
+def test_sequential_requests_are_not_coalesced():
+    app = SlowApp()
+    middleware = SingleFlightMiddleware(app)
+
+    run_together(middleware, scope())
+    run_together(middleware, scope())
+
+    assert app.calls == 2
+
+
+@pytest.mark.parametrize("other", [
+    scope(query=b"tag=strike"),
+    scope(headers=[(b"accept", b"application/msgpack")]),
+    scope(headers=[(b"if-none-match", b'W/"abc"')]),
+    scope(path="/api/v1/events/map"),
+])
+def test_differing_requests_run_separately(other):
+    app = SlowApp()
+
+    run_together(SingleFlightMiddleware(app), scope(), other)
+
+    assert app.calls == 2
+
+
+@pytest.mark.parametrize("other", [
+    scope(method="POST"),
+    scope(path="/api/v1/feed"),
+])
+def test_only_listed_gets_are_coalesced(other):
+    app = SlowApp()
+
+    run_together(SingleFlightMiddleware(app), other, other)
+
+    assert app.calls == 2
+
+
+def test_viewer_dependent_responses_are_shared_per_token():
+    path, query = "/api/v1/events/7", b"include=viewer"
+    alice = scope(path, query, headers=[(b"authorization", b"Bearer alice")])
+    bob = scope(path, query, headers=[(b"authorization", b"Bearer bob")])
+
+    app = SlowApp()
+    run_together(SingleFlightMiddleware(app), alice, bob)
+    assert app.calls == 2
+
+    app = SlowApp()
+    run_together(SingleFlightMiddleware(app), alice, alice)
+    assert app.calls == 1
+
+    app = SlowApp()
+    run_together(SingleFlightMiddleware(app), scope(path), scope(path, headers=[(b"authorization", b"Bearer bob")]))
+    assert app.calls == 1
+
+
+@pytest.mark.parametrize("status", [500, 401, 403])
+def test_unshareable_statuses_make_followers_run_their_own(counters, status):
+    app = SlowApp(status=status)
+
+    run_together(SingleFlightMiddleware(app), scope(), scope())
+
+    assert app.calls == 2
+    assert counters["fallbacks"] == 1
+
+
+def test_large_responses_are_not_shared(monkeypatch, counters):
+    monkeypatch.setattr(single_flight, "MAX_SHARED_BODY", 10)
+    app = SlowApp(body=b"x" * 11)
+
+    responses = run_together(SingleFlightMiddleware(app), scope(), scope())
+
+    assert app.calls == 2
+    assert responses[1][1]["body"] == b"x" * 11
+    assert counters["fallbacks"] == 1
+
+
+def test_followers_stop_waiting_after_max_wait(counters):
+    app = SlowApp(delay=0.2)
+
+    run_together(SingleFlightMiddleware(app, max_wait=0.01), scope(), scope())
+
+    assert app.calls == 2
+    assert counters["fallbacks"] == 1
+
+
+def test_leader_failure_reaches_the_leader_and_followers_retry(counters):
+    class FailingOnce(SlowApp):
+        async def __call__(self, scope, receive, send):
+            if self.calls == 0:
+                self.calls += 1
+                await asyncio.sleep(self.delay)
+                raise RuntimeError("boom")
+            await super().__call__(scope, receive, send)
+
+    app = FailingOnce()
+    middleware = SingleFlightMiddleware(app)
+
+    async def both():
+        return await asyncio.gather(request(middleware, scope()), request(middleware, scope()), return_exceptions=True)
+
+    leader, follower = asyncio.run(both())
+
+    assert isinstance(leader, RuntimeError)
+    assert follower[0]["status"] == 200
+    assert app.calls == 2
+    assert counters["fallbacks"] == 1
+
+
+@pytest.fixture
+def rallies(client, db_session):
+    """Twenty events with coordinates, served by app.main.app on db_session."""
+    from app.models import User, Profile, Event
+
+    user = User(email="organizer@example.org", hashed_password="x")
+    db_session.add(user)
+    db_session.flush()
+    profile = Profile(user_id=user.id, name="Organizer", causes=[])
+    db_session.add(profile)
+    db_session.flush()
+    for i in range(20):
+        db_session.add(Event(
+            creator_id=profile.id, title=f"Rally {i}", description="Meet at the hall",
+            event_date=datetime(2026, 11, 1, 18, 0), location="Union Hall",
+            latitude=37.8, longitude=-122.27, tags=[]
+        ))
+    db_session.flush()
+
+
+def run_app_together(path, headers, count=3):
+    """Send count identical GETs through the whole app stack at once."""
+    from app.main import app
+
+    request_scope = {
+        "type": "http", "http_version": "1.1", "method": "GET", "scheme": "http",
+        "path": path, "raw_path": path.encode(), "root_path": "", "query_string": b"",
+        "server": ("testserver", 80), "client": ("testclient", 50000),
+        "headers": [(b"host", b"testserver"), *headers],
+    }
+    return [
+        (messages[0]["headers"], b"".join(m.get("body", b"") for m in messages[1:]))
+        for messages in run_together(app, *(dict(request_scope) for _ in range(count)))
+    ]
+
+
+@pytest.mark.postgres
+def test_coalesced_responses_through_the_full_stack_are_intact(rallies, counters):
+    responses = run_app_together("/api/v1/events", [(b"accept-encoding", b"gzip")])
+
+    assert counters["coalesced"] == 2
+    for raw_headers, body in responses:
+        headers = dict(raw_headers)
+        assert headers[b"content-encoding"] == b"gzip"
+        assert int(headers[b"content-length"]) == len(body)
+        assert len(json.loads(gzip.decompress(body))) == 20
+
+
+@pytest.mark.postgres
+@pytest.mark.parametrize("path", ["/api/v1/events", "/api/v1/events/map"])
+def test_coalesced_msgpack_responses_are_negotiated_for_every_follower(rallies, counters, path):
+    responses = run_app_together(path, [(b"accept", b"application/msgpack")])
+
+    assert counters["coalesced"] == 2
+    for raw_headers, body in responses:
+        headers = dict(raw_headers)
+        assert headers[b"content-type"] == b"application/msgpack"
+        assert int(headers[b"content-length"]) == len(body)
+        assert [value for name, value in raw_headers if name == b"vary"] == [b"Accept"]
+        assert len(msgpack.unpackb(body, timestamp=3)) == 20
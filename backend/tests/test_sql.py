@@ -0,0 +1,8 @@
+"""Tests for SQL helpers."""
+
+from app.core.sql import escape_like
+
+
+def test_escape_like_escapes_wildcards_and_the_escape_character():
+    assert escape_like(r"50%_off\now") == r"50\%\_off\\now"
+    assert escape_like("plain") == "plain"
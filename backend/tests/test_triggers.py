@@ -0,0 +1,102 @@
+"""Tests for the trigger-maintained tables installed by the migrations (Postgres)."""
+
+from datetime import datetime
+import pytest
+from sqlmodel import select
+from app.models import (
+    User, Profile, Event, Attendance, EventTagCount, FairWorkPosting, FairWorkPostingCount,
+    ChangeLogEntry, CollectionVersion, EmploymentType, UnionStatus
+)
+
+pytestmark = pytest.mark.postgres
+
+
+@pytest.fixture
+def profile(db_session):
+    user = User(email="organizer@example.org", hashed_password="x")
+    db_session.add(user)
+    db_session.flush()
+    profile = Profile(user_id=user.id, name="Organizer", causes=[])
+    db_session.add(profile)
+    db_session.flush()
+    return profile
+
+
+def add_event(session, profile, tags):
+    event = Event(
+        creator_id=profile.id, title="Rally", description="Meet at the hall",
+        event_date=datetime(2026, 11, 1, 18, 0), location="Union Hall", tags=tags
+    )
+    session.add(event)
+    session.flush()
+    return event
+
+
+def tag_counts(session):
+    return {row.tag: row.event_count for row in session.exec(select(EventTagCount))}
+
+
+def facet_count(session, wage_band):
+    row = session.get(FairWorkPostingCount, (EmploymentType.FULL_TIME, UnionStatus.UNIONIZED, wage_band))
+    return row.posting_count if row else 0
+
+
+def test_event_tag_counts_follow_inserts_updates_and_deletes(db_session, profile):
+    first = add_event(db_session, profile, ["housing", "labor"])
+    add_event(db_session, profile, ["labor"])
+    assert tag_counts(db_session) == {"housing": 1, "labor": 2}
+
+    first.tags = ["climate"]
+    db_session.flush()
+    assert tag_counts(db_session) == {"climate": 1, "labor": 1}
+
+    db_session.delete(first)
+    db_session.flush()
+    assert tag_counts(db_session) == {"labor": 1}
+
+
+def test_posting_facet_counts_move_between_wage_bands(db_session):
+    posting = FairWorkPosting(
+        title="Line Cook", organization="Cooperative Kitchen", location="Oakland, CA",
+        wage_text="$25/hour", wage_min=25, employment_type=EmploymentType.FULL_TIME,
+        union_status=UnionStatus.UNIONIZED, description="Prep and line work",
+        posted_date=datetime.utcnow()
+    )
+    db_session.add(posting)
+    db_session.flush()
+    assert facet_count(db_session, "20-30") == 1
+
+    posting.wage_min = 32
+    db_session.flush()
+    assert (facet_count(db_session, "20-30"), facet_count(db_session, "30-plus")) == (0, 1)
+
+
+def test_change_log_records_writes_and_deletes(db_session, profile):
+    event = add_event(db_session, profile, [])
+    attendance = Attendance(user_id=profile.user_id, event_id=event.id)
+    db_session.add(attendance)
+    db_session.flush()
+    event_id = event.id
+    db_session.delete(attendance)
+    db_session.flush()
+    db_session.delete(event)
+    db_session.flush()
+
+    entries = db_session.exec(
+        select(ChangeLogEntry).where(ChangeLogEntry.entity_id == event_id).order_by(ChangeLogEntry.id)
+    ).all()
+    assert [(e.entity, e.user_id, e.deleted) for e in entries] == [
+        ("event", None, False),
+        ("attendance", profile.user_id, False),
+        ("attendance", profile.user_id, True),
+        ("event", None, True),
+    ]
+
+
+def test_collection_versions_bump_once_per_statement(db_session, profile):
+    before = db_session.get(CollectionVersion, "events").version
+
+    add_event(db_session, profile, [])
+    db_session.expire_all()
+
+    assert db_session.get(CollectionVersion, "events").version == before + 1
@@ -0,0 +1,91 @@
+"""Tests for creating and importing fair work postings against Postgres."""
+
+import json
+import pytest
+from sqlmodel import select
+from app.core.security import create_access_token
+from app.models import User, FairWorkPosting
+
+pytestmark = pytest.mark.postgres
+
+POSTING = {
+    "title": "Line Cook",
+    "organization": "Cooperative Kitchen",
+    "location": "Oakland, CA",
+    "latitude": 37.8044,
+    "longitude": -122.2712,
+    "wage_text": "$25/hour",
+    "employment_type": "full-time",
+    "union_status": "unionized",
+    "description": "Prep and line work in a worker-owned kitchen",
+}
+
+
+@pytest.fixture
+def auth_headers(db_session):
+    user = User(email="importer@example.org", hashed_password="x")
+    db_session.add(user)
+    db_session.flush()
+    return {"Authorization": f"Bearer {create_access_token({'sub': str(user.id)})}"}
+
+
+def upload(client, postings, headers):
+    body = "\n".join(json.dumps(posting) for posting in postings)
+    return client.post(
+        "/api/v1/unionized/import",
+        files={"file": ("postings.ndjson", body.encode(), "application/x-ndjson")},
+        headers=headers,
+    )
+
+
+def test_import_requires_authentication(client):
+    response = upload(client, [POSTING], headers={})
+
+    assert response.status_code in (401, 403)
+
+
+def test_reimport_updates_in_place(client, db_session, auth_headers):
+    first = upload(client, [POSTING], auth_headers)
+    assert first.status_code == 200, first.text
+    assert first.json()["inserted"] == 1
+
+    again = upload(client, [POSTING], auth_headers)
+    assert again.json()["unchanged"] == 1
+
+    changed = upload(client, [{**POSTING, "wage_text": "$27/hour"}], auth_headers)
+    assert changed.json()["updated"] == 1
+    assert len(db_session.exec(select(FairWorkPosting)).all()) == 1
+
+
+def test_import_rejects_a_non_utf8_file_before_writing(client, db_session, auth_headers):
+    body = json.dumps(POSTING).encode() + b"\n" + json.dumps({**POSTING, "title": "Café cook"}, ensure_ascii=False).encode("latin-1")
+    response = client.post(
+        "/api/v1/unionized/import",
+        files={"file": ("postings.ndjson", body, "application/x-ndjson")},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 400
+    assert db_session.exec(select(FairWorkPosting)).all() == []
+
+
+def test_creating_a_posting_with_a_taken_natural_key_flags_it(client, db_session):
+    original = client.post("/api/v1/unionized/", json=POSTING)
+    assert original.status_code == 201, original.text
+
+    repeat = client.post("/api/v1/unionized/", json={**POSTING, "title": "LINE COOK"})
+
+    assert repeat.status_code == 201, repeat.text
+    assert repeat.json()["duplicate_of_id"] == original.json()["id"]
+    listed = client.get("/api/v1/unionized/").json()
+    assert [posting["id"] for posting in listed] == [original.json()["id"]]
+
+
+def test_import_updates_the_key_owner_not_its_duplicates(client, db_session, auth_headers):
+    original = client.post("/api/v1/unionized/", json=POSTING).json()
+    client.post("/api/v1/unionized/", json=POSTING)
+
+    report = upload(client, [{**POSTING, "wage_text": "$27/hour"}], auth_headers).json()
+
+    assert report["updated"] == 1 and report["inserted"] == 0
+    assert db_session.get(FairWorkPosting, original["id"]).wage_text == "$27/hour"
@@ -25,7 +25,7 @@ export default function EventDetailScreen() {
 
   const loadEvent = async () => {
     try {
-      const response = await eventAPI.get(Number(id));
+      const response = await eventAPI.get(Number(id), 'attendees,reactions,viewer');
       setEvent(response.data);
     } catch (error) {
       console.error('Error loading event:', error);
@@ -37,7 +37,7 @@ export default function EventDetailScreen() {
   const handleJoin = async () => {
     setJoining(true);
     try {
-      if (event.user_attending) {
+      if (event.viewer?.attending) {
         await eventAPI.leave(Number(id));
       } else {
         await eventAPI.join(Number(id));
@@ -70,7 +70,7 @@ export default function EventDetailScreen() {
     <ScrollView style={styles.container} contentContainerStyle={styles.content}>
       <View style={styles.header}>
         <Badge text={event.event_type} variant="green" />
-        <Text style={styles.attendance}>{event.attendance_count} people joined</Text>
+        <Text style={styles.attendance}>{event.attendee_count} people joined</Text>
       </View>
 
       <Text style={styles.title}>{event.title}</Text>
@@ -114,10 +114,10 @@ export default function EventDetailScreen() {
 
       <View style={styles.buttonContainer}>
         <Button
-          title={event.user_attending ? 'Leave Event' : 'Join Event'}
+          title={event.viewer?.attending ? 'Leave Event' : 'Join Event'}
           onPress={handleJoin}
           loading={joining}
-          variant={event.user_attending ? 'outline' : 'primary'}
+          variant={event.viewer?.attending ? 'outline' : 'primary'}
         />
       </View>
     </ScrollView>
@@ -34,21 +34,33 @@ export const authAPI = {
     api.post('/auth/logout'),
 };
 
+// Named field sets for list endpoints; 'card' leaves long text out
+export type Projection = 'card' | 'full';
+
 // Profile endpoints
 export const profileAPI = {
   getMyProfile: () => api.get('/profiles/me'),
   updateProfile: (data: any) => api.patch('/profiles/me', data),
   getProfile: (id: number) => api.get(`/profiles/${id}`),
+  getProfiles: (ids: number[], fields?: Projection) =>
+    api.get('/profiles', { params: { ids: ids.join(','), fields } }),
   getProfileEvents: (id: number) => api.get(`/profiles/${id}/events`),
   getMyAttendingEvents: () => api.get('/profiles/me/attending'),
+  search: (params: {
+    q?: string;
+    cause?: string[];
+    profile_type?: string;
+    limit?: number;
+  }) => api.get('/profiles/search', { params, paramsSerializer: { indexes: null } }),
 };
 
 // Event endpoints
 export const eventAPI = {
   create: (data: any) => api.post('/events', data),
-  list: () => api.get('/events'),
+  list: (fields?: Projection) => api.get('/events', { params: { fields } }),
   listMap: () => api.get('/events/map'),
-  get: (id: number) => api.get(`/events/${id}`),
+  get: (id: number, include?: string) =>
+    api.get(`/events/${id}`, { params: include ? { include } : undefined }),
   join: (id: number) => api.post(`/events/${id}/join`),
   leave: (id: number) => api.delete(`/events/${id}/leave`),
   getAttendees: (id: number) => api.get(`/events/${id}/attendees`),
@@ -71,7 +83,7 @@ export const reactionAPI = {
 
 // Feed endpoints
 export const feedAPI = {
-  get: (limit?: number) => api.get('/feed', { params: { limit } }),
+  get: (limit?: number, fields?: Projection) => api.get('/feed', { params: { limit, fields } }),
 };
 
 // Unionized endpoints
@@ -80,9 +92,34 @@ export const unionizedAPI = {
     skip?: number;
     limit?: number;
     location?: string;
+    q?: string;
     employment_type?: string;
     union_status?: string;
+    min_wage?: number;
+    max_wage?: number;
+    fields?: Projection;
   }) => api.get('/unionized', { params }),
+  page: (params?: {
+    cursor?: string;
+    limit?: number;
+    facets?: boolean;
+    q?: string;
+    location?: string;
+    employment_type?: string;
+    union_status?: string;
+    min_wage?: number;
+    max_wage?: number;
+    sort?: 'newest' | 'wage_desc' | 'wage_asc';
+    fields?: Projection;
+  }) => api.get('/unionized/page', { params }),
   get: (id: number) => api.get(`/unionized/${id}`),
+  nearEvent: (eventId: number, limit?: number) =>
+    api.get(`/unionized/near-event/${eventId}`, { params: { limit } }),
   create: (data: any) => api.post('/unionized', data),
 };
+
+// Delta sync: call without since for a watermark (then refetch lists), then
+// pass the last watermark; sync again while has_more. 410 means start over.
+export const syncAPI = {
+  changes: (since?: string) => api.get('/sync', { params: since ? { since } : undefined }),
+};
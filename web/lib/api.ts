@@ -40,19 +40,30 @@ export const authAPI = {
     api.post('/auth/logout'),
 }
 
+// Named field sets for list endpoints; 'card' leaves long text out
+export type Projection = 'card' | 'full';
+
 // Profile endpoints
 export const profileAPI = {
   getMyProfile: () => api.get('/profiles/me'),
   updateProfile: (data: any) => api.patch('/profiles/me', data),
   getProfile: (id: number) => api.get(`/profiles/${id}`),
+  getProfiles: (ids: number[], fields?: Projection) =>
+    api.get('/profiles', { params: { ids: ids.join(','), fields } }),
   getProfileEvents: (id: number) => api.get(`/profiles/${id}/events`),
   getMyAttendingEvents: () => api.get('/profiles/me/attending'),
+  search: (params: {
+    q?: string;
+    cause?: string[];
+    profile_type?: string;
+    limit?: number;
+  }) => api.get('/profiles/search', { params, paramsSerializer: { indexes: null } }),
 }
 
 // Event endpoints
 export const eventAPI = {
   create: (data: any) => api.post('/events', data),
-  list: () => api.get('/events'),
+  list: (fields?: Projection) => api.get('/events', { params: { fields } }),
   listMap: () => api.get('/events/map'),
   get: (id: number) => api.get(`/events/${id}`),
   join: (id: number) => api.post(`/events/${id}/join`),
@@ -77,7 +88,19 @@ export const reactionAPI = {
 
 // Feed endpoints
 export const feedAPI = {
-  get: (limit?: number) => api.get('/feed', { params: { limit } }),
+  get: (limit?: number, fields?: Projection) => api.get('/feed', { params: { limit, fields } }),
+}
+
+// Export endpoints (streamed file downloads)
+export type ExportFormat = 'ndjson' | 'csv';
+
+export const exportAPI = {
+  events: (format: ExportFormat = 'csv') =>
+    api.get('/exports/events', { params: { format }, responseType: 'blob' }),
+  attendees: (format: ExportFormat = 'csv', eventId?: number) =>
+    api.get('/exports/attendees', { params: { format, event_id: eventId }, responseType: 'blob' }),
+  postings: (format: ExportFormat = 'csv') =>
+    api.get('/exports/postings', { params: { format }, responseType: 'blob' }),
 }
 
 // Unionized endpoints
@@ -86,9 +109,28 @@ export const unionizedAPI = {
     skip?: number;
     limit?: number;
     location?: string;
+    q?: string;
     employment_type?: string;
     union_status?: string;
+    min_wage?: number;
+    max_wage?: number;
+    fields?: Projection;
   }) => api.get('/unionized', { params }),
+  page: (params?: {
+    cursor?: string;
+    limit?: number;
+    facets?: boolean;
+    q?: string;
+    location?: string;
+    employment_type?: string;
+    union_status?: string;
+    min_wage?: number;
+    max_wage?: number;
+    sort?: 'newest' | 'wage_desc' | 'wage_asc';
+    fields?: Projection;
+  }) => api.get('/unionized/page', { params }),
   get: (id: number) => api.get(`/unionized/${id}`),
+  nearEvent: (eventId: number, limit?: number) =>
+    api.get(`/unionized/near-event/${eventId}`, { params: { limit } }),
   create: (data: any) => api.post('/unionized', data),
 }